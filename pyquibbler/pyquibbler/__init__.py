@@ -1,5 +1,6 @@
 from .cache import CacheStatus
 from .quib.factory import create_quib
+from .quib.variable_metadata import fast_quib_creation
 from .assignment import Assignment, AssignmentTemplate
 from .quib import CacheMode, iquib, Quib
 from .file_syncing import SaveFormat, ResponseToFileNotDefined
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import pathlib
+import pickle
+import struct
+import zipfile
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, BinaryIO
+
+import numpy as np
+
+from pyquibbler.path import PathComponent
+from .assignment import Assignment
+
+HEADER_KEY = 'header'
+
+# The size of the fixed part of the local file header of a zip member, and the offset of its name and extra lengths
+ZIP_LOCAL_HEADER_SIZE = 30
+ZIP_LOCAL_HEADER_LENGTHS_OFFSET = 26
+
+
+@dataclass(frozen=True)
+class NpzArrayReference:
+    """
+    Stands for an array stored as a separate block of the npz file, within the header of the assignments.
+    """
+    key: str
+
+
+def _is_native_array(obj: Any) -> bool:
+    return isinstance(obj, np.ndarray) and not obj.dtype.hasobject
+
+
+def _replace_arrays_with_references(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    if _is_native_array(obj):
+        key = f'array_{len(arrays)}'
+        arrays[key] = obj
+        return NpzArrayReference(key)
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_replace_arrays_with_references(sub_obj, arrays) for sub_obj in obj)
+    if isinstance(obj, dict):
+        return {key: _replace_arrays_with_references(sub_obj, arrays) for key, sub_obj in obj.items()}
+    return obj
+
+
+def _replace_references_with_arrays(obj: Any, arrays: Dict[str, np.ndarray]) -> Any:
+    if isinstance(obj, NpzArrayReference):
+        return arrays[obj.key]
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_replace_references_with_arrays(sub_obj, arrays) for sub_obj in obj)
+    if isinstance(obj, dict):
+        return {key: _replace_references_with_arrays(sub_obj, arrays) for key, sub_obj in obj.items()}
+    return obj
+
+
+def _replace_in_assignment(assignment: Assignment, replace_func) -> Assignment:
+    changes = {f.name: replace_func(getattr(assignment, f.name))
+               for f in dataclasses.fields(assignment) if f.name != 'path'}
+    changes['path'] = [PathComponent(replace_func(component.component)) for component in assignment.path]
+    return dataclasses.replace(assignment, **changes)
+
+
+def save_assignments_as_npz(assignments: List[Assignment], file: pathlib.Path):
+    """
+    Save assignments as an npz file.
+
+    Array values and array path components are saved as native numpy blocks. The assignments themselves, with
+    references to these blocks, are pickled into a small header block.
+
+    The file is written to a temporary file which then replaces the original file, so that arrays memory-mapped from
+    the original file remain valid.
+    """
+    arrays = {}
+    header = [_replace_in_assignment(assignment, lambda obj: _replace_arrays_with_references(obj, arrays))
+              for assignment in assignments]
+    arrays[HEADER_KEY] = np.frombuffer(pickle.dumps(header), dtype=np.uint8)
+
+    temporary_file = file.with_name(file.name + '.tmp')
+    with open(temporary_file, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(temporary_file, file)
+
+
+def _get_offset_of_zip_member_data(f: BinaryIO, zip_info: zipfile.ZipInfo) -> int:
+    f.seek(zip_info.header_offset + ZIP_LOCAL_HEADER_LENGTHS_OFFSET)
+    name_length, extra_length = struct.unpack('<HH', f.read(4))
+    return zip_info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_length + extra_length
+
+
+def _memory_map_npz_member(file: pathlib.Path, zip_file: zipfile.ZipFile, key: str) -> Optional[np.ndarray]:
+    """
+    Memory-map an array of an npz file, if it is stored uncompressed (as saved by `np.savez`).
+    Returns None if the array cannot be memory-mapped.
+    """
+    zip_info = zip_file.getinfo(key + '.npy')
+    if zip_info.compress_type != zipfile.ZIP_STORED:
+        return None
+
+    with zip_file.open(zip_info) as member:
+        version = np.lib.format.read_magic(member)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(member)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(member)
+        else:
+            return None
+        header_length = member.tell()
+
+    if dtype.hasobject or np.prod(shape) == 0:
+        return None
+
+    with open(file, 'rb') as f:
+        offset = _get_offset_of_zip_member_data(f, zip_info) + header_length
+    return np.memmap(file, dtype=dtype, mode='r', shape=shape, order='F' if fortran_order else 'C', offset=offset)
+
+
+def load_assignments_from_npz(file: pathlib.Path, memory_map_min_bytes: Optional[int] = None) -> List[Assignment]:
+    """
+    Load assignments saved by `save_assignments_as_npz`.
+
+    Arrays of at least `memory_map_min_bytes` bytes are memory-mapped (read-only) rather than read to memory.
+    `None` for reading all arrays to memory.
+    """
+    arrays = {}
+    with np.load(file, allow_pickle=False) as npz_file, zipfile.ZipFile(file) as zip_file:
+        header = pickle.loads(npz_file[HEADER_KEY].tobytes())
+        for key in npz_file.files:
+            if key == HEADER_KEY:
+                continue
+            array = None
+            if memory_map_min_bytes is not None \
+                    and zip_file.getinfo(key + '.npy').file_size >= memory_map_min_bytes:
+                array = _memory_map_npz_member(file, zip_file, key)
+            arrays[key] = npz_file[key] if array is None else array
+
+    return [_replace_in_assignment(assignment, lambda obj: _replace_references_with_arrays(obj, arrays))
+            for assignment in header]
@@ -12,9 +12,11 @@ from pyquibbler.quib.utils import deep_copy_without_quibs_or_graphics
 from pyquibbler.utilities.iterators import recursively_run_func_on_object
 
 from pyquibbler.debug_utils import timeit
+from pyquibbler.env import ZERO_COPY_ARRAY_ARGUMENTS, NPZ_MEMORY_MAP_MIN_BYTES
 
 from .assignment import Assignment
 from .assignment_to_from_text import convert_executable_text_to_assignments, convert_assignments_to_executable_text
+from .assignment_to_from_npz import save_assignments_as_npz, load_assignments_from_npz
 from .assignment_template import AssignmentTemplate
 from .default_value import default
 from .exceptions import CannotConvertAssignmentsToTextException
@@ -121,10 +123,11 @@ class Overrider:
     def override(self, data: Any, assignment_template: Optional[AssignmentTemplate] = None):
         """
         Deep copies the argument and returns said data with applied overrides
+        (with ZERO_COPY_ARRAY_ARGUMENTS, arrays are only copied by deep_set when assigned into)
         """
         original_data = data
         with timeit("quib_overriding"):
-            data = deep_copy_without_quibs_or_graphics(data)
+            data = deep_copy_without_quibs_or_graphics(data, zero_copy_arrays=bool(ZERO_COPY_ARRAY_ARGUMENTS))
             for assignment in self._assignments:
                 if assignment.is_default():
                     value = deep_get(original_data, assignment.path)
@@ -184,6 +187,12 @@ class Overrider:
         with open(file, 'rb') as f:
             return self.replace_assignments(pickle.load(f))
 
+    def save_as_npz(self, file: pathlib.Path):
+        save_assignments_as_npz(self._assignments, file)
+
+    def load_from_npz(self, file: pathlib.Path) -> List[Path]:
+        return self.replace_assignments(load_assignments_from_npz(file, NPZ_MEMORY_MAP_MIN_BYTES.val))
+
     def save_as_txt(self, file: pathlib.Path):
         text = convert_assignments_to_executable_text(self._assignments,
                                                       raise_if_not_reversible=True)
@@ -15,6 +15,11 @@ SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS = Flag(True)
 
 SAFE_MODE = Flag(True)  # Catch and properly ignore path translation and inversion exceptions.
 
+""" Initialization """
+
+# Override ipywidgets only once it is imported, rather than importing it upon initialize_quibbler
+LAZY_INITIALIZATION = Flag(False)
+
 """ Lazy """
 
 LAZY = Flag(True)
@@ -22,10 +27,27 @@ LAZY = Flag(True)
 GRAPHICS_LAZY = Flag(False)
 
 
+""" Evaluation """
+
+APPLY_ALONG_AXIS_MAX_WORKERS = Mutable(1)  # Threads for computing apply_along_axis slices of non-graphics quibs
+
+PARENTS_EVALUATION_MAX_WORKERS = Mutable(1)  # Threads for evaluating the parent quibs of a quib concurrently
+
+
 """ Quib creation """
 
 ALLOW_ARRAY_WITH_DTYPE_OBJECT = Flag(False)
 
+# Keep array arguments of new quibs as read-only views, rather than copies. Pyquibbler copies such arrays only
+# before writing into them. The arrays passed to quibs should then not be modified in place by the user.
+ZERO_COPY_ARRAY_ARGUMENTS = Flag(False)
+
+""" File syncing """
+
+# Memory-map (read-only) array values of at least this number of bytes when loading 'npz' assignment files.
+# None for reading all values to memory
+NPZ_MEMORY_MAP_MIN_BYTES = Mutable(None)
+
 """ Graphics """
 
 DRAGGABLE_PLOTS_BY_DEFAULT = Flag(True)
@@ -34,6 +56,16 @@ GRAPHICS_DRIVEN_ASSIGNMENT_RESOLUTION = Mutable(1000)  # Number of pixels in mou
 
 WARN_ON_UNSUPPORTED_BACKEND = Flag(True)
 
+IN_PLACE_GRAPHICS_UPDATE = Flag(True)  # Update artists of plot, scatter, imshow in place upon data change
+
+BLIT_WHILE_DRAGGING = Flag(False)  # During drag, only redraw changed artists over a captured background
+
+PLOT_DOWNSAMPLING = Mutable(None)  # None, 'minmax' or 'lttb': decimate long plot lines to the axes pixel width
+
+GRAPHICS_MAX_FPS = Mutable(None)  # Max redraws per second of each figure during drag. None for no cap
+
+CANCEL_STALE_DRAG_EVALUATIONS = Flag(True)  # A newer mouse event during drag aborts recalculations of older ones
+
 
 """ Override dialog """
 
@@ -23,10 +23,14 @@ class SaveFormat(StrEnum):
     BIN = 'bin'
     "Save assignments as a binary file (``'bin'``; File extension '.quib')."
 
+    NPZ = 'npz'
+    "Save assignments as a NumPy npz file, with arrays stored natively (``'npz'``; File extension '.npz')."
+
 
 SAVE_FORMAT_TO_FILE_EXT = {
     SaveFormat.BIN: '.quib',
     SaveFormat.TXT: '.txt',
+    SaveFormat.NPZ: '.npz',
 }
 
 
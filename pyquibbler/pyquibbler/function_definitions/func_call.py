@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod, ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, Any, Optional, Callable, List, Type, ClassVar, Dict, Union
 
 from pyquibbler.utilities.iterators import recursively_compare_objects
@@ -9,7 +9,7 @@ from pyquibbler.utilities.general_utils import Kwargs, Args
 from pyquibbler.quib.external_call_failed_exception_handling import external_call_failed_exception_handling
 from pyquibbler.path import deep_set, PathComponent
 
-from .utils import get_signature_for_func
+from .utils import get_binding_plan_for_func
 from .location import SourceLocation, get_object_type_locations_in_args_kwargs
 from .types import iter_arg_ids_and_values, KeywordArgument, PositionalArgument, Argument, SubArgument, ArgId, \
     convert_argument_id_to_argument
@@ -21,6 +21,36 @@ if TYPE_CHECKING:
     from .func_definition import FuncDefinition
 
 
+def _are_identical(objects: Tuple, other_objects: Tuple) -> bool:
+    return len(objects) == len(other_objects) and all(obj is other for obj, other in zip(objects, other_objects))
+
+
+@dataclass(frozen=True)
+class _BoundArguments:
+    """
+    The memoized binding of a FuncArgsKwargs, with a shallow snapshot of the func, args and kwargs it was bound to.
+    """
+    func: Callable
+    args: Tuple
+    kwarg_names: Tuple[str, ...]
+    kwarg_values: Tuple
+    arg_values_by_name: Kwargs
+    arg_values_by_position: Args
+
+    @classmethod
+    def create(cls, func_args_kwargs: FuncArgsKwargs, arg_values_by_name: Kwargs, arg_values_by_position: Args):
+        return cls(func_args_kwargs.func, tuple(func_args_kwargs.args),
+                   tuple(func_args_kwargs.kwargs), tuple(func_args_kwargs.kwargs.values()),
+                   arg_values_by_name, arg_values_by_position)
+
+    def is_bound_to(self, func_args_kwargs: FuncArgsKwargs) -> bool:
+        # args and kwargs may be changed in place, so we compare their elements by identity
+        return self.func is func_args_kwargs.func \
+            and _are_identical(self.args, tuple(func_args_kwargs.args)) \
+            and self.kwarg_names == tuple(func_args_kwargs.kwargs) \
+            and _are_identical(self.kwarg_values, tuple(func_args_kwargs.kwargs.values()))
+
+
 @dataclass
 class FuncArgsKwargs:
     """
@@ -31,22 +61,26 @@ class FuncArgsKwargs:
     - Default arguments
     This class uses the function signature to determine the values each parameter was given,
     and can be indexed using ints, slices and keywords.
+
+    The binding of the args and kwargs to the parameters is memoized (per `include_defaults`), and is recalculated
+    only if func, args or kwargs have changed.
     """
 
     func: Callable
     args: Union[Tuple[Any, ...], List[Any, ...]]
     kwargs: Dict[str, Any]
+    _bound_arguments: Optional[Dict[bool, _BoundArguments]] = field(default=None, init=False, repr=False,
+                                                                    compare=False)
 
     def get_kwargs_without_those_equal_to_defaults(self, arguments: Optional[Kwargs] = None):
         """
         Remove arguments which exist as default arguments with the same value.
         """
         arguments = self.kwargs if arguments is None else arguments
-        sig = get_signature_for_func(self.func)
+        defaults = get_binding_plan_for_func(self.func).defaults
         new_arguments = []
-        parameters = sig.parameters
         for name, value in arguments.items():
-            if not (name in parameters and recursively_compare_objects(parameters[name].default, value)):
+            if not (name in defaults and recursively_compare_objects(defaults[name], value)):
                 new_arguments.append((name, value))
 
         return dict(new_arguments)
@@ -56,27 +90,30 @@ class FuncArgsKwargs:
         Given a specific function call - func, args, kwargs - return an iterator to (name, val) tuples
         of all arguments that would have been passed to the function.
         """
-        sig = get_signature_for_func(self.func)
-        bound_args = sig.bind(*self.args, **self.kwargs)
-
-        if include_defaults:
-            bound_args.apply_defaults()
-        arguments = bound_args.arguments
-
-        return arguments.items()
+        return get_binding_plan_for_func(self.func).bind(self.args, self.kwargs, include_defaults).items()
+
+    def _get_bound_arguments(self, include_defaults: bool) -> _BoundArguments:
+        if self._bound_arguments is None:
+            self._bound_arguments = {}
+        bound_arguments = self._bound_arguments.get(include_defaults)
+        if bound_arguments is None or not bound_arguments.is_bound_to(self):
+            # We use external_call_failed_exception_handling here as if the user provided the wrong arguments to the
+            # function we'll fail here
+            with external_call_failed_exception_handling():
+                try:
+                    arg_values_by_name = dict(self._iter_args_and_names_in_function_call(include_defaults))
+                    arg_values_by_position = tuple(arg_values_by_name.values())
+                except (ValueError, TypeError):
+                    arg_values_by_name = self.kwargs
+                    arg_values_by_position = self.args
+            bound_arguments = _BoundArguments.create(self, arg_values_by_name, arg_values_by_position)
+            self._bound_arguments[include_defaults] = bound_arguments
+        return bound_arguments
 
     def get_args_values_by_keyword_and_position(self, include_defaults: bool = True) \
             -> Tuple[Kwargs, Args]:
-        # We use external_call_failed_exception_handling here as if the user provided the wrong arguments to the
-        # function we'll fail here
-        with external_call_failed_exception_handling():
-            try:
-                arg_values_by_name = dict(self._iter_args_and_names_in_function_call(include_defaults))
-                arg_values_by_position = tuple(arg_values_by_name.values())
-            except (ValueError, TypeError):
-                arg_values_by_name = self.kwargs
-                arg_values_by_position = self.args
-        return arg_values_by_name, arg_values_by_position
+        bound_arguments = self._get_bound_arguments(include_defaults)
+        return dict(bound_arguments.arg_values_by_name), bound_arguments.arg_values_by_position
 
     def get_arg_values_by_keyword(self, include_defaults: bool = True) -> Kwargs:
         return self.get_args_values_by_keyword_and_position(include_defaults)[0]
@@ -88,7 +125,7 @@ class FuncArgsKwargs:
         return id(self)
 
     def get(self, keyword: str, default: Optional = None, include_defaults: bool = True) -> Optional[Any]:
-        return self.get_arg_values_by_keyword(include_defaults).get(keyword, default)
+        return self._get_bound_arguments(include_defaults).arg_values_by_name.get(keyword, default)
 
     def get_all_arguments(self) -> List[Argument]:
         return [KeywordArgument(key) if isinstance(key, str) else PositionalArgument(key)
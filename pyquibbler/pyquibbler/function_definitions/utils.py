@@ -1,5 +1,7 @@
 import functools
 import inspect
+from dataclasses import dataclass
+from typing import Tuple, Optional, Dict, Any, FrozenSet, Sequence
 
 from .types import PositionalArgument, KeywordArgument
 
@@ -13,6 +15,98 @@ def get_signature_for_func(func):
     return inspect.signature(func)
 
 
+@dataclass(frozen=True)
+class SignatureBindingPlan:
+    """
+    A precomputed plan for binding args and kwargs to the parameters of a function, allowing the binding of
+    common calls with dictionary lookups, instead of going through `inspect.Signature.bind`.
+    Calls the plan cannot bind (including erroneous calls) are bound by `inspect.Signature.bind`.
+    """
+    signature: inspect.Signature
+    parameter_names: Tuple[str, ...]
+    positional_names: Tuple[str, ...]  # parameters which can be given positionally, by order
+    keyword_names: FrozenSet[str]  # parameters which can be given by keyword
+    required_names: FrozenSet[str]  # parameters without defaults
+    defaults: Dict[str, Any]
+    var_positional_name: Optional[str]
+    var_keyword_name: Optional[str]
+
+    @classmethod
+    def from_signature(cls, signature: inspect.Signature):
+        parameters = signature.parameters.values()
+        var_names = {parameter.kind: parameter.name for parameter in parameters
+                     if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)}
+        return cls(
+            signature=signature,
+            parameter_names=tuple(signature.parameters),
+            positional_names=tuple(parameter.name for parameter in parameters if parameter.kind in
+                                   (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)),
+            keyword_names=frozenset(parameter.name for parameter in parameters if parameter.kind in
+                                    (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)),
+            required_names=frozenset(parameter.name for parameter in parameters
+                                     if parameter.default is inspect.Parameter.empty
+                                     and parameter.name not in var_names.values()),
+            defaults={parameter.name: parameter.default for parameter in parameters
+                      if parameter.default is not inspect.Parameter.empty},
+            var_positional_name=var_names.get(inspect.Parameter.VAR_POSITIONAL),
+            var_keyword_name=var_names.get(inspect.Parameter.VAR_KEYWORD),
+        )
+
+    def _bind_with_signature(self, args: Sequence, kwargs: Dict[str, Any], include_defaults: bool) -> Dict[str, Any]:
+        bound_args = self.signature.bind(*args, **kwargs)
+        if include_defaults:
+            bound_args.apply_defaults()
+        return dict(bound_args.arguments)
+
+    def bind(self, args: Sequence, kwargs: Dict[str, Any], include_defaults: bool = True) -> Dict[str, Any]:
+        """
+        Return a dict of the values given to each parameter, by the order of the parameters, like
+        `inspect.BoundArguments.arguments` (after `apply_defaults()` if `include_defaults`).
+        Raises TypeError if the args and kwargs do not match the signature.
+        """
+        num_positional = len(self.positional_names)
+        if len(args) > num_positional and self.var_positional_name is None:
+            return self._bind_with_signature(args, kwargs, include_defaults)
+
+        bound = dict(zip(self.positional_names, args))
+        extra_kwargs = {}
+        for name, value in kwargs.items():
+            if name in bound:
+                return self._bind_with_signature(args, kwargs, include_defaults)
+            if name in self.keyword_names:
+                bound[name] = value
+            elif self.var_keyword_name is not None:
+                extra_kwargs[name] = value
+            else:
+                return self._bind_with_signature(args, kwargs, include_defaults)
+
+        if not self.required_names <= bound.keys():
+            return self._bind_with_signature(args, kwargs, include_defaults)
+
+        arguments = {}
+        for name in self.parameter_names:
+            if name in bound:
+                arguments[name] = bound[name]
+            elif name == self.var_positional_name:
+                if len(args) > num_positional or include_defaults:
+                    arguments[name] = tuple(args[num_positional:])
+            elif name == self.var_keyword_name:
+                if extra_kwargs or include_defaults:
+                    arguments[name] = extra_kwargs
+            elif include_defaults:
+                arguments[name] = self.defaults[name]
+        return arguments
+
+
+@functools.lru_cache()
+def get_binding_plan_for_func(func) -> SignatureBindingPlan:
+    """
+    Get the binding plan for the signature of a function, cached per function.
+    Raises ValueError or TypeError if the signature of the function cannot be found.
+    """
+    return SignatureBindingPlan.from_signature(get_signature_for_func(func))
+
+
 def get_parameters_for_func(func):
     try:
         sig = get_signature_for_func(func)
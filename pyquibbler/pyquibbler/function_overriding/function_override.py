@@ -14,6 +14,21 @@ from pyquibbler.quib.get_value_context_manager import get_value_context_pass_qui
 from pyquibbler.quib.quib import Quib
 from pyquibbler.quib.factory import create_quib
 from pyquibbler.utilities.general_utils import Args, Kwargs
+from pyquibbler.utilities.iterators import is_there_object_of_type_in_args_kwargs
+
+
+@functools.lru_cache()
+def _get_public_attributes_of_type(type_: Type) -> Tuple[str, ...]:
+    return tuple(attr for attr in dir(type_) if not attr.startswith('_'))
+
+
+def _get_public_attributes_to_copy(func: Callable) -> Tuple[str, ...]:
+    if isinstance(func, type):
+        # classes also have the public attributes of their base classes
+        return tuple(attr for attr in dir(func) if not attr.startswith('_'))
+    # other public attributes are either in the __dict__ of the func (copied by functools.wraps), or defined by its
+    # type (like the methods of ufuncs)
+    return _get_public_attributes_of_type(type(func))
 
 
 def get_flags_from_kwargs(flag_names: Tuple[str, ...], kwargs: Dict[str, Any]) -> Mapping[str, Any]:
@@ -77,7 +92,9 @@ class FuncOverride:
         @functools.wraps(wrapped_func)
         def _maybe_create_quib(*args, **kwargs):
 
-            if get_value_context_pass_quibs() is not False:
+            # Quickly rule out calls without quibs, before looking for the locations of the quibs
+            if get_value_context_pass_quibs() is not False and is_there_object_of_type_in_args_kwargs(Quib, args,
+                                                                                                      kwargs):
                 quib_locations = get_object_type_locations_in_args_kwargs(Quib, args, kwargs)
 
                 if quib_locations and self.should_create_quib(wrapped_func, args, kwargs):
@@ -114,9 +131,8 @@ class FuncOverride:
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")  # to avoid some "attribute was deprecated" warnings
-            for attr in dir(wrapped_func):
-                if not attr.startswith('_'):
-                    setattr(_maybe_create_quib, attr, getattr(wrapped_func, attr))
+            for attr in _get_public_attributes_to_copy(wrapped_func):
+                setattr(_maybe_create_quib, attr, getattr(wrapped_func, attr))
 
         return _maybe_create_quib
 
@@ -4,14 +4,15 @@ from pyquibbler.project.jupyer_project.jupyter_project import create_jupyter_pro
 from pyquibbler.function_definitions import add_definition_for_function
 from pyquibbler.utilities.input_validation_utils import validate_user_input
 from pyquibbler.utilities.warning_messages import no_header_warn
-from pyquibbler.env import DRAGGABLE_PLOTS_BY_DEFAULT, SHOW_QUIBS_AS_WIDGETS_IN_JUPYTER_LAB
+from pyquibbler.env import DRAGGABLE_PLOTS_BY_DEFAULT, SHOW_QUIBS_AS_WIDGETS_IN_JUPYTER_LAB, LAZY_INITIALIZATION
 
 from .attribute_override import AttributeOverride
 from .defintion_without_override.python_functions import create_definitions_for_python_functions
 from .exceptionhook import override_jupyterlab_excepthook
 from .function_override import FuncOverride
 from .is_initiated import is_quibbler_initialized, set_quibbler_initialized
-from .third_party_overriding.ipywidgets.overrides import override_ipywidgets_if_installed
+from .third_party_overriding.ipywidgets.overrides import override_ipywidgets_if_installed, \
+    override_ipywidgets_upon_import
 from .third_party_overriding.non_quib_overrides import override_axes_methods, switch_widgets_to_quib_supporting_widgets
 from .quib_overrides.operators.overrides import create_operator_overrides
 from .quib_overrides.quib_methods import create_quib_method_overrides
@@ -87,6 +88,9 @@ def initialize_quibbler(draggable_plots: bool = True,
     Additional calls, though, are harmless and can even be useful as a means to re-specify
     `draggable_plots` and `show_quibs_as_widgets`.
 
+    To shorten the initialization of short-lived scripts, set ``pyquibbler.env.LAZY_INITIALIZATION``,
+    to only override ipywidgets once it is imported.
+
     If Quibbler is not initaited, the `iquib`, `quiby` and `q` will not modify their arguments.
     Therefore, not initiating Quibbler allows testing your code as a normal code without any quibs.
     """
@@ -111,7 +115,8 @@ def initialize_quibbler(draggable_plots: bool = True,
 
     override_axes_methods()
 
-    ipywidgets_installed = override_ipywidgets_if_installed()
+    ipywidgets_installed = override_ipywidgets_upon_import() if LAZY_INITIALIZATION \
+        else override_ipywidgets_if_installed()
 
     if not ipywidgets_installed and within_jupyterlab:
         no_header_warn('It is not a requirement, but do consider installing ipywidgets to '
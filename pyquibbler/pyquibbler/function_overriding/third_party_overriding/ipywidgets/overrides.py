@@ -7,6 +7,8 @@ from pyquibbler.user_utils.obj2quib import obj2quib
 from pyquibbler.quib.quib import Quib
 from typing import Dict
 
+from pyquibbler.optional_packages.emulate_missing_packages import EMULATE_MISSING_PACKAGES
+from pyquibbler.utilities.import_hooks import call_upon_import, is_module_installed
 from pyquibbler.utilities.iterators import is_iterator_empty, iter_objects_of_type_in_object
 
 
@@ -85,3 +87,17 @@ def override_ipywidgets_if_installed() -> bool:
     _BoundedFloatRange.__init__ = get_wrapper_for_range_widget_init(_BoundedFloatRange)
 
     return True
+
+
+def override_ipywidgets_upon_import() -> bool:
+    """
+    Configure ipywidgets to work with quib arguments once it is imported, rather than importing it now
+    (importing ipywidgets takes most of the time of initializing quibbler).
+
+    Returns bool indicating whether ipywidgets is installed.
+    """
+    if 'ipywidgets' in EMULATE_MISSING_PACKAGES.val or not is_module_installed('ipywidgets'):
+        return False
+
+    call_upon_import('ipywidgets', override_ipywidgets_if_installed)
+    return True
@@ -16,6 +16,7 @@ from pyquibbler.env import DRAGGABLE_PLOTS_BY_DEFAULT
 from pyquibbler.function_overriding.function_override import FuncOverride
 from pyquibbler.function_overriding.third_party_overriding.general_helpers import override_with_cls, override_class
 from pyquibbler.quib.graphics import artist_wrapper
+from pyquibbler.quib.graphics.downsampling import redecimate_plots_in_axes
 
 from pyquibbler.quib.graphics.event_handling import CanvasEventHandler
 from pyquibbler.quib.graphics.event_handling.plt_plot_parser import get_xdata_arg_indices_and_ydata_arg_indices
@@ -102,14 +103,20 @@ class AxesLimOverride(AxesSetOverride):
         axes.drag_pan is overridden to indicate 'called_from_drag_pan', and this flag is caught here,
         triggering report to CanvasEventHandler for inverse assignment.
         Otherwise, the normal behavior of AxesSetOverride is invoked.
+        Downsampled plots are re-decimated upon change of the x-limits.
         """
+        ax = args[0]
         if kwargs.pop('called_from_drag_pan', False):
-            ax = args[0]
             lim = args[1]
             CanvasEventHandler.get_or_create_initialized_event_handler(ax.figure.canvas). \
                 handle_axes_drag_pan(ax, func, lim)
+            result = None
         else:
-            return AxesSetOverride._call_wrapped_func(func, args, kwargs)
+            result = AxesSetOverride._call_wrapped_func(func, args, kwargs)
+
+        if func.__name__ == 'set_xlim':
+            redecimate_plots_in_axes(ax)
+        return result
 
 
 graphics_override = partial(override_with_cls, GraphicsOverride,
@@ -10,6 +10,8 @@ from pyquibbler.function_overriding.third_party_overriding.matplotlib.helpers im
 from pyquibbler.quib.func_calling.func_calls import RadioButtonsQuibFuncCall, SliderQuibFuncCall, \
     RangeSliderQuibFuncCall, RectangleSelectorQuibFuncCall,  CheckButtonsQuibFuncCall
 from pyquibbler.quib.func_calling.func_calls.known_graphics.plot_call import PlotQuibFuncCall
+from pyquibbler.quib.func_calling.func_calls.known_graphics.scatter_call import ScatterQuibFuncCall
+from pyquibbler.quib.func_calling.func_calls.known_graphics.imshow_call import ImshowQuibFuncCall
 from pyquibbler.quib.func_calling.func_calls.known_graphics.widgets.textbox_call import TextBoxQuibFuncCall
 
 
@@ -18,8 +20,13 @@ def create_graphics_overrides():
         plot_override(
             'plot', quib_function_call_cls=PlotQuibFuncCall),
 
+        plot_override(
+            'scatter', quib_function_call_cls=ScatterQuibFuncCall),
+
+        axes_override(
+            'imshow', quib_function_call_cls=ImshowQuibFuncCall),
+
         *(plot_override(func_name) for func_name in (
-            'scatter',
             'axvline',
             'axhline',
         )),
@@ -81,7 +88,7 @@ def create_graphics_overrides():
             'hist',
             'hist2d',
             'hlines',
-            'imshow',
+            # 'imshow',  # implemented with ImshowQuibFuncCall
             'legend',
             # 'locator_params',
             'loglog',
@@ -46,6 +46,13 @@ class QVectorize(np.vectorize):
     """
     A small wrapper to the np.vectorize class, adding options to __init__ and wrapping __call__
     with a quib function wrapper.
+
+    `memo_size` specifies an optional number of per-element results to memoize, keyed by the element's argument
+    values. Elements whose argument values did not change are then retrieved from the memo, rather than recalculated.
+
+    `aggregate_lines=True` draws the lines created by all iterations of a graphics function as a single
+    LineCollection per axes, and their markers as a single PathCollection (rather than a visible Line2D artist per
+    iteration). Lines drawn as steps, or with partially filled or partially drawn markers, are not aggregated.
     """
 
     def __init__(self, *args,
@@ -54,10 +61,14 @@ class QVectorize(np.vectorize):
                  is_graphics: Optional[bool] = missing,
                  pass_quibs: bool = missing,
                  lazy: Optional[bool] = missing,
+                 memo_size: Optional[int] = None,
+                 aggregate_lines: bool = False,
                  signature=None,
                  cache=False,  # We don't need the underlying vectorize object to cache, we are doing that ourselves.
                  **kwargs):
         super().__init__(*args, signature=signature, cache=False, **kwargs)
+        self.memo_size = memo_size
+        self.aggregate_lines = aggregate_lines
         func_definition = get_definition_for_function(self.pyfunc)
         self.func_defintion_flags = {
             name: value if value is not missing else getattr(func_definition, name)
@@ -4,11 +4,14 @@ import weakref
 
 from pathlib import Path
 import sys
-from typing import Optional, Set, List, Callable, Union, Mapping
+from typing import Optional, Set, List, Callable, Union, Mapping, Iterable, Any, Tuple
 
 from pyquibbler.utilities.input_validation_utils import get_enum_by_str, validate_user_input
 from pyquibbler.utilities.file_path import PathWithHyperLink
 from pyquibbler.quib.graphics import GraphicsUpdateType, aggregate_redraw_mode
+from pyquibbler.quib.graphics.redraw import pause_figure, resume_figure
+from pyquibbler.quib.async_evaluation import evaluate_quibs_async
+from pyquibbler.quib.graph_traversal import get_graph_version, get_topological_order
 from pyquibbler.file_syncing.types import SaveFormat, ResponseToFileNotDefined
 
 from .actions import AssignmentAction, AddAssignmentAction, RemoveAssignmentAction
@@ -16,6 +19,7 @@ from .exceptions import NoProjectDirectoryException, NothingToUndoException, Not
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from matplotlib.figure import Figure
     from pyquibbler.quib.quib import Quib
     from pyquibbler.assignment import Assignment
 
@@ -24,7 +28,8 @@ class Project:
     """
     Quibbler project providing save/load and undo/redo functionality.
 
-    Keeps a weakref set of all quibs to manage the quibs centrally.
+    Keeps a weakref set of all quibs to manage the quibs centrally, as well as indexes of the quibs relevant for
+    each central command (random, file-loading, central-graphics, named and overridden quibs).
     """
 
     DEFAULT_GRAPHICS_UPDATE = GraphicsUpdateType.DRAG
@@ -35,6 +40,14 @@ class Project:
     def __init__(self, directory: Optional[Path]):
         self._directory = directory
         self._quib_refs: weakref.WeakSet[Quib] = weakref.WeakSet()
+        self._topological_order: Optional[Tuple[int, List[weakref.ref[Quib]]]] = None
+
+        # Indexes of the quibs relevant for central commands, so that these commands do not scan all quibs:
+        self._random_quib_refs: weakref.WeakSet[Quib] = weakref.WeakSet()
+        self._file_loading_quib_refs: weakref.WeakSet[Quib] = weakref.WeakSet()
+        self._central_graphics_quib_refs: weakref.WeakSet[Quib] = weakref.WeakSet()
+        self._named_quib_refs: weakref.WeakSet[Quib] = weakref.WeakSet()  # including quibs with a pending name
+        self._overridden_quib_refs: weakref.WeakSet[Quib] = weakref.WeakSet()  # quibs that have an overrider
         self._pending_undo_group: Optional[List] = None
         self._undo_action_groups: List[List[AssignmentAction]] = []
         self._redo_action_groups: List[List[AssignmentAction]] = []
@@ -42,6 +55,7 @@ class Project:
         self._graphics_update: GraphicsUpdateType = self.DEFAULT_GRAPHICS_UPDATE
         self.on_path_change: Optional[Callable] = None
         self.autoload_upon_first_get_value = False
+        self._verify_invalidation: bool = False
 
     @classmethod
     def get_or_create(cls, directory: Optional[Path, str] = None):
@@ -83,6 +97,56 @@ class Project:
         Register a quib to the project.
         """
         self._quib_refs.add(quib)
+        self._topological_order = None
+        if quib.is_random:
+            self._random_quib_refs.add(quib)
+        if quib.is_file_loading:
+            self._file_loading_quib_refs.add(quib)
+        if quib.handler.has_overrider:
+            self._overridden_quib_refs.add(quib)
+        self.on_quib_graphics_update_change(quib)
+        self.on_quib_name_change(quib)
+
+    def on_quib_graphics_update_change(self, quib: Quib):
+        if quib.graphics_update is GraphicsUpdateType.CENTRAL:
+            self._central_graphics_quib_refs.add(quib)
+        else:
+            self._central_graphics_quib_refs.discard(quib)
+
+    def on_quib_name_change(self, quib: Quib):
+        if quib.handler.may_have_assigned_name:
+            self._named_quib_refs.add(quib)
+        else:
+            self._named_quib_refs.discard(quib)
+
+    def on_quib_overrider_creation(self, quib: Quib):
+        self._overridden_quib_refs.add(quib)
+
+    def _get_file_syncing_quibs(self, response_to_file_not_defined: ResponseToFileNotDefined) -> Set[Quib]:
+        # Quibs without an assigned_name have no file. They only need to be visited to warn (or raise) about it.
+        if response_to_file_not_defined in (ResponseToFileNotDefined.IGNORE, ResponseToFileNotDefined.WARN_IF_DATA):
+            return set(self._named_quib_refs) | set(self._overridden_quib_refs)
+        return self.quibs
+
+    def get_quibs_in_topological_order(self) -> List[Quib]:
+        """
+        Return all the quibs in the project, each quib following the quibs it depends on.
+
+        The order is cached, and only recalculated after quibs are added or disconnected.
+
+        Returns
+        -------
+        list of Quib
+
+        See Also
+        --------
+        quibs, Quib.get_ancestors
+        """
+        if self._topological_order is None or self._topological_order[0] != get_graph_version():
+            order = get_topological_order(self._quib_refs, lambda quib: quib.handler.parents)
+            self._topological_order = get_graph_version(), [weakref.ref(quib) for quib in order]
+        quibs = (quib_ref() for quib_ref in self._topological_order[1])
+        return [quib for quib in quibs if quib is not None]
 
     @staticmethod
     def _reset_list_of_quibs(quibs):
@@ -107,7 +171,7 @@ class Project:
         reset_file_loading_quibs, reset_random_quibs, reset_impure_quibs, refresh_graphics
         Quib.is_random
         """
-        self._reset_list_of_quibs([quib for quib in self.quibs if quib.is_random])
+        self._reset_list_of_quibs(list(self._random_quib_refs))
 
     def reset_file_loading_quibs(self):
         """
@@ -122,7 +186,7 @@ class Project:
         reset_random_quibs, reset_impure_quibs, refresh_graphics
         Quib.is_file_loading
         """
-        self._reset_list_of_quibs([quib for quib in self.quibs if quib.is_file_loading])
+        self._reset_list_of_quibs(list(self._file_loading_quib_refs))
 
     def reset_impure_quibs(self):
         """
@@ -137,7 +201,7 @@ class Project:
         reset_file_loading_quibs, reset_random_quibs, refresh_graphics
         Quib.is_impure
         """
-        self._reset_list_of_quibs([quib for quib in self.quibs if quib.is_impure])
+        self._reset_list_of_quibs(list(set(self._random_quib_refs) | set(self._file_loading_quib_refs)))
 
     def refresh_graphics(self):
         """
@@ -148,9 +212,51 @@ class Project:
         reset_file_loading_quibs, reset_random_quibs, reset_impure_quibs,
         Quib.graphics_update, Quib.is_graphics, GraphicsUpdateType
         """
-        for quib in self.quibs:
-            if quib.graphics_update == GraphicsUpdateType.CENTRAL:
-                quib.get_value()
+        # Upstream graphics quibs are evaluated first:
+        for quib in sorted(self._central_graphics_quib_refs, key=lambda quib: quib.handler.get_depth()):
+            quib.get_value()
+
+    def pause_figure(self, figure: Figure):
+        """
+        Defer updating the graphics of a figure.
+
+        Graphics quibs of the figure are not recalculated upon upstream changes while the figure is paused.
+        They are recalculated once the figure is resumed.
+
+        Graphics quibs of figures that are closed, or whose window is not shown, are deferred likewise, and are
+        recalculated once the figure is drawn again.
+
+        See Also
+        --------
+        resume_figure, refresh_graphics
+        """
+        pause_figure(figure)
+
+    def resume_figure(self, figure: Figure):
+        """
+        Resume updating the graphics of a figure paused with `pause_figure`, recalculating any graphics quibs
+        whose update was deferred.
+
+        See Also
+        --------
+        pause_figure
+        """
+        resume_figure(figure)
+
+    async def evaluate_many_async(self, quibs: Iterable[Quib]) -> List[Any]:
+        """
+        Calculate the values of multiple quibs, without blocking the event loop.
+
+        Returns
+        -------
+        list
+            The values of the quibs, in the order of the given quibs.
+
+        See Also
+        --------
+        Quib.get_value_async
+        """
+        return await evaluate_quibs_async(quibs)
 
     """
     graphics
@@ -191,6 +297,28 @@ class Project:
     def graphics_update(self, graphics_update: Union[str, GraphicsUpdateType]):
         self._graphics_update = get_enum_by_str(GraphicsUpdateType, graphics_update)
 
+    """
+    invalidation
+    """
+
+    @property
+    def verify_invalidation(self) -> bool:
+        """
+        bool: The default for whether quibs verify that their value changed before invalidating downstream quibs.
+
+        Quibs whose own verify_invalidation is ``None`` adhere to the default verify_invalidation of the Project.
+
+        See Also
+        --------
+        Quib.verify_invalidation
+        """
+        return self._verify_invalidation
+
+    @verify_invalidation.setter
+    @validate_user_input(verify_invalidation=bool)
+    def verify_invalidation(self, verify_invalidation: bool):
+        self._verify_invalidation = verify_invalidation
+
     """
     save/load
     """
@@ -245,6 +373,8 @@ class Project:
 
         ``'bin'``: save quib assignments as a binary file (.quib)
 
+        ``'npz'``: save quib assignments as a NumPy npz file, with arrays stored natively (.npz)
+
         See Also
         --------
         Quib.save_format
@@ -272,7 +402,7 @@ class Project:
         Quib.save
         """
         self._raise_if_directory_is_not_defined('save')
-        for quib in self.quibs:
+        for quib in self._get_file_syncing_quibs(response_to_file_not_defined):
             quib.save(response_to_file_not_defined)
 
     def load_quibs(self, response_to_file_not_defined=ResponseToFileNotDefined.WARN_IF_DATA):
@@ -290,7 +420,7 @@ class Project:
         """
         self._raise_if_directory_is_not_defined('load')
         with aggregate_redraw_mode():
-            for quib in self.quibs:
+            for quib in self._get_file_syncing_quibs(response_to_file_not_defined):
                 quib.load(response_to_file_not_defined)
 
     def sync_quibs(self, response_to_file_not_defined=ResponseToFileNotDefined.WARN_IF_DATA):
@@ -308,7 +438,7 @@ class Project:
         """
         self._raise_if_directory_is_not_defined('sync')
         with aggregate_redraw_mode():
-            for quib in self.quibs:
+            for quib in self._get_file_syncing_quibs(response_to_file_not_defined):
                 quib.sync(response_to_file_not_defined)
 
     """
@@ -2,6 +2,7 @@ from contextlib import contextmanager
 from .project import Project
 from pyquibbler.quib.graphics.graphics_assignment_mode import is_within_graphics_assignment_mode
 from pyquibbler.quib.graphics.redraw import is_dragging
+from pyquibbler.quib.evaluation_cancellation import EvaluationCancelledException
 from ..utilities.basic_types import Flag
 
 IN_UNDO_GROUP_MODE = False
@@ -27,6 +28,10 @@ def undo_group_mode(temporarily: bool = False):
     try:
         project.start_pending_undo_group()
         yield all_ok
+    except EvaluationCancelledException:
+        # The assignments were completed; only the recalculation that followed them was cancelled
+        _push_pending_undo_group(project, temporarily)
+        raise
     except Exception:
         if is_within_graphics_assignment_mode():
             all_ok.set(False)
@@ -34,10 +39,14 @@ def undo_group_mode(temporarily: bool = False):
         else:
             raise
     else:
-        if not temporarily:
-            if is_dragging():
-                project.squash_pending_group_into_last_undo()
-            else:
-                project.push_pending_undo_group_to_undo_stack()
+        _push_pending_undo_group(project, temporarily)
     finally:
         IN_UNDO_GROUP_MODE = False
+
+
+def _push_pending_undo_group(project: Project, temporarily: bool):
+    if not temporarily:
+        if is_dragging():
+            project.squash_pending_group_into_last_undo()
+        else:
+            project.push_pending_undo_group_to_undo_stack()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, Any, Iterable, List
+
+from pyquibbler.quib.evaluation_threads import can_evaluate_quib_off_main_thread, on_evaluation_threads_start
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+_WORKER_STATE = threading.local()
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Async evaluations share a single worker thread: they are serialized among themselves (quib evaluation relies on
+    global state) while the event loop is kept free.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='quibbler-async')
+            on_evaluation_threads_start()
+        return _EXECUTOR
+
+
+def get_loop_of_async_evaluation() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Return the event loop awaiting the current async evaluation, or None if we are not within an async evaluation.
+    """
+    return getattr(_WORKER_STATE, 'loop', None)
+
+
+def call_soon_in_loop_if_in_async_evaluation(func: Callable, *args) -> bool:
+    """
+    If we are within an async evaluation, schedule `func(*args)` on the awaiting event loop and return True.
+    Otherwise, return False (the caller should call the function itself).
+    """
+    loop = get_loop_of_async_evaluation()
+    if loop is None:
+        return False
+    loop.call_soon_threadsafe(func, *args)
+    return True
+
+
+def _run_in_worker(loop: asyncio.AbstractEventLoop, func: Callable, args) -> Any:
+    _WORKER_STATE.loop = loop
+    try:
+        return func(*args)
+    finally:
+        _WORKER_STATE.loop = None
+
+
+async def run_quib_evaluation_async(quib: Quib, func: Callable, *args) -> Any:
+    """
+    Run a blocking evaluation of `quib` (`func(*args)`) in the async-evaluation executor and await its result.
+    """
+    # Quibs that may create graphics, or have ancestors that may, are evaluated on the loop thread
+    if get_loop_of_async_evaluation() is not None or not can_evaluate_quib_off_main_thread(quib):
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _run_in_worker, loop, func, args)
+
+
+async def evaluate_quibs_async(quibs: Iterable[Quib]) -> List[Any]:
+    return list(await asyncio.gather(*(quib.get_value_async() for quib in quibs)))
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+from typing import Optional
+
+from pyquibbler.exceptions import PyQuibblerException
+
+
+@dataclass
+class EvaluationCancelledException(PyQuibblerException):
+    generation: int
+
+    def __str__(self):
+        return f'Evaluation of generation {self.generation} was cancelled by a newer generation.'
+
+
+class GenerationToken:
+    """
+    A counter of request generations. Starting a new generation makes all evaluations carried for older generations
+    stale, so that they can be cooperatively cancelled (see `raise_if_evaluation_cancelled`).
+    """
+
+    def __init__(self):
+        self.generation = 0
+
+    def new_generation(self) -> int:
+        self.generation += 1
+        return self.generation
+
+    def is_stale(self, generation: int) -> bool:
+        return generation != self.generation
+
+
+_ACTIVE_TOKEN: Optional[GenerationToken] = None
+
+_ACTIVE_GENERATION: Optional[int] = None
+
+
+@contextlib.contextmanager
+def cancellable_evaluation(token: GenerationToken, generation: int):
+    """
+    Within this context, evaluations raise EvaluationCancelledException at their check points once `generation`
+    becomes stale.
+    Nested contexts are ignored: the outermost request owns the cancellation.
+    """
+    global _ACTIVE_TOKEN, _ACTIVE_GENERATION
+    if _ACTIVE_TOKEN is not None:
+        yield
+        return
+    _ACTIVE_TOKEN, _ACTIVE_GENERATION = token, generation
+    try:
+        yield
+    finally:
+        _ACTIVE_TOKEN, _ACTIVE_GENERATION = None, None
+
+
+@contextlib.contextmanager
+def non_cancellable_evaluation():
+    """
+    Suspend cancellation checks (for example, while undoing or otherwise restoring a consistent state).
+    """
+    global _ACTIVE_TOKEN, _ACTIVE_GENERATION
+    token, generation = _ACTIVE_TOKEN, _ACTIVE_GENERATION
+    _ACTIVE_TOKEN, _ACTIVE_GENERATION = None, None
+    try:
+        yield
+    finally:
+        _ACTIVE_TOKEN, _ACTIVE_GENERATION = token, generation
+
+
+def raise_if_evaluation_cancelled():
+    """
+    A cancellation check point. Called between quib evaluations and between iterations of long loops.
+    """
+    if _ACTIVE_TOKEN is not None and _ACTIVE_TOKEN.is_stale(_ACTIVE_GENERATION):
+        raise EvaluationCancelledException(_ACTIVE_GENERATION)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import threading
+from itertools import chain
+
+from pyquibbler.quib.graph_traversal import iter_reachable_quibs
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+_EVALUATION_THREADS_STARTED = False
+
+EVALUATION_LOCK_CREATION_LOCK = threading.Lock()
+
+
+def on_evaluation_threads_start():
+    """
+    Called upon creating an executor that evaluates quibs in worker threads (parallel or async evaluation).
+    From then on, quibs are locked while evaluated.
+    """
+    global _EVALUATION_THREADS_STARTED
+    _EVALUATION_THREADS_STARTED = True
+
+
+def are_evaluation_threads_started() -> bool:
+    return _EVALUATION_THREADS_STARTED
+
+
+def _can_run_quib_function_off_main_thread(quib: Quib) -> bool:
+    # matplotlib is not thread-safe, and quibs that pass quibs to their function rely on the global quib guard
+    return quib.handler.func_definition.is_graphics is False and not quib.pass_quibs
+
+
+def can_evaluate_quib_off_main_thread(quib: Quib) -> bool:
+    """
+    Evaluating a quib may evaluate any of its ancestors. A quib can therefore only be evaluated off the main thread
+    if the functions of the quib and of all its ancestors are known not to create graphics, and do not take quibs.
+    """
+    return all(_can_run_quib_function_off_main_thread(quib_to_check) for quib_to_check
+               in chain([quib], iter_reachable_quibs([quib], lambda ancestor: ancestor.handler.parents)))
@@ -12,6 +12,7 @@ from pyquibbler.utilities.general_utils import Args, Kwargs
 
 from pyquibbler.env import SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS
 from pyquibbler.exceptions import PyQuibblerException
+from pyquibbler.quib.evaluation_cancellation import EvaluationCancelledException
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -75,6 +76,8 @@ def external_call_failed_exception_handling():
     """
     try:
         yield
+    except EvaluationCancelledException:
+        raise
     except Exception as e:
         if not SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS:
             raise
@@ -5,7 +5,7 @@ from typing import Optional, Callable, Union, Set, List
 from pyquibbler.assignment import AssignmentTemplate
 from pyquibbler.utilities.missing_value import missing
 from pyquibbler.utilities.general_utils import Kwargs, Args
-from pyquibbler.env import LAZY, GRAPHICS_LAZY
+from pyquibbler.env import LAZY, GRAPHICS_LAZY, ZERO_COPY_ARRAY_ARGUMENTS
 from pyquibbler.project import Project
 from pyquibbler.file_syncing.types import SaveFormat
 from pyquibbler.function_definitions.func_definition import FuncDefinition
@@ -16,7 +16,8 @@ from .graphics import GraphicsUpdateType
 from .quib_guard import add_new_quib_to_guard_if_exists
 from .quib import Quib
 from .utils.miscellaneous import deep_copy_without_quibs_or_graphics
-from .variable_metadata import get_file_name_and_line_no, get_quib_name
+from .variable_metadata import get_file_name_and_line_no, get_quib_name, get_quib_name_call_site, \
+    is_in_fast_quib_creation_mode
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -55,12 +56,19 @@ def create_quib(func: Optional[Callable],
         func_definition = func_definition or get_definition_for_function(func)
 
     cache_mode = cache_mode or CachedQuibFuncCall.DEFAULT_CACHE_MODE
-    assigned_name = get_quib_name() if assigned_name is missing else assigned_name
+    assigned_name_call_site = None
+    if assigned_name is missing:
+        if is_in_fast_quib_creation_mode():
+            # The name will be determined once first needed
+            assigned_name = None
+            assigned_name_call_site = get_quib_name_call_site()
+        else:
+            assigned_name = get_quib_name()
 
     quib = Quib(created_in=get_file_name_and_line_no(),
                 func=get_original_func(func),
-                args=deep_copy_without_quibs_or_graphics(args),
-                kwargs=deep_copy_without_quibs_or_graphics(kwargs),
+                args=deep_copy_without_quibs_or_graphics(args, zero_copy_arrays=bool(ZERO_COPY_ARRAY_ARGUMENTS)),
+                kwargs=deep_copy_without_quibs_or_graphics(kwargs, zero_copy_arrays=bool(ZERO_COPY_ARRAY_ARGUMENTS)),
                 func_definition=func_definition,
                 )
 
@@ -73,6 +81,8 @@ def create_quib(func: Optional[Callable],
               save_format=save_format,
               cache_mode=cache_mode,
               )
+    if assigned_name_call_site is not None:
+        quib.handler.set_lazy_assigned_name(assigned_name_call_site)
 
     quib.handler.reset_quib_func_call()
     quib.handler.quib_function_call.load_source_locations(quib_locations)
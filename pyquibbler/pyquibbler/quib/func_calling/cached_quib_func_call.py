@@ -5,7 +5,7 @@ from sys import getsizeof
 from time import perf_counter
 
 # typing
-from typing import Optional, Dict, Any, Set, Callable, List, Union
+from typing import Optional, Dict, Any, Set, Callable, List, Union, Tuple
 from pyquibbler.utilities.general_utils import Args, Kwargs
 from pyquibbler.quib.quib import Quib
 from .quib_func_call import QuibFuncCall
@@ -23,6 +23,9 @@ from pyquibbler.graphics.graphics_collection import GraphicsCollection
 from pyquibbler.quib import consts
 from pyquibbler.quib.external_call_failed_exception_handling import external_call_failed_exception_handling
 from pyquibbler.quib.quib_guard import QuibGuard
+from pyquibbler.quib.evaluation_cancellation import raise_if_evaluation_cancelled
+from pyquibbler.quib.evaluation_threads import can_evaluate_quib_off_main_thread
+from .parallel_evaluation import is_parallel_evaluation_allowed, evaluate_quibs_in_parallel
 
 # translation
 from pyquibbler.utilities.multiple_instance_runner import NoRunnerWorkedException
@@ -72,6 +75,7 @@ class CachedQuibFuncCall(QuibFuncCall):
     def _run_single_call(self, func: Callable, graphics_collection: GraphicsCollection,
                          args: Args, kwargs: Kwargs, quibs_allowed_to_access: Set[Quib]):
 
+        raise_if_evaluation_cancelled()
         graphics_collection.set_color_cyclers_back_to_pre_run_index()
         with ExitStack() as stack:
             if self.func_definition.is_graphics is not False:
@@ -210,18 +214,48 @@ class CachedQuibFuncCall(QuibFuncCall):
 
         return result
 
+    def _evaluate_parent_quibs_in_parallel(self, quibs_to_valid_paths: Dict[Quib, Optional[Path]]) \
+            -> Dict[Tuple[int, bool], Any]:
+        """
+        When parallel evaluation is enabled (PARENTS_EVALUATION_MAX_WORKERS > 1), evaluate the parent quibs that
+        can run off the main thread concurrently.
+        Returns a dict mapping (id(quib), is_data_source) to the value of the quib.
+        """
+        if not is_parallel_evaluation_allowed():
+            return {}
+
+        keys_to_quibs_and_paths = {}
+        for quib in self.get_data_sources():
+            if can_evaluate_quib_off_main_thread(quib):
+                keys_to_quibs_and_paths[(id(quib), True)] = (quib, quibs_to_valid_paths.get(quib))
+        for quib in self.get_parameter_sources():
+            if can_evaluate_quib_off_main_thread(quib):
+                keys_to_quibs_and_paths[(id(quib), False)] = (quib, [])
+
+        if len(keys_to_quibs_and_paths) < 2:
+            return {}
+
+        values = evaluate_quibs_in_parallel(list(keys_to_quibs_and_paths.values()))
+        return dict(zip(keys_to_quibs_and_paths.keys(), values))
+
     def _get_args_and_kwargs_valid_at_quibs_to_paths(self, quibs_to_valid_paths: Dict[Quib, Optional[Path]]):
         """
         Prepare arguments to call self.func with - replace quibs with values valid at the given path
         """
 
+        prefetched_values = self._evaluate_parent_quibs_in_parallel(quibs_to_valid_paths)
+
         def _transform_data_source_quib(quib):
+            if (id(quib), True) in prefetched_values:
+                return prefetched_values[(id(quib), True)]
             # If the quib is a data source, and we didn't see it in the result, we don't need it to be valid at any
             # paths (it did not appear in quibs_to_paths)
             path = quibs_to_valid_paths.get(quib)
             return quib.get_value_valid_at_path(path)
 
         def _transform_parameter_source_quib(quib):
+            if (id(quib), False) in prefetched_values:
+                return prefetched_values[(id(quib), False)]
             # This is a paramater quib- we always need a parameter quib to be completely valid regardless of where
             # we need ourselves (this quib) to be valid
             return quib.get_value_valid_at_path([])
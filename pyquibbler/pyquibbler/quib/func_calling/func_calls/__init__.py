@@ -1,2 +1,2 @@
-from .known_graphics import PlotQuibFuncCall, SliderQuibFuncCall, RangeSliderQuibFuncCall, RadioButtonsQuibFuncCall, \
-    RectangleSelectorQuibFuncCall, CheckButtonsQuibFuncCall
+from .known_graphics import PlotQuibFuncCall, ScatterQuibFuncCall, ImshowQuibFuncCall, SliderQuibFuncCall, \
+    RangeSliderQuibFuncCall, RadioButtonsQuibFuncCall, RectangleSelectorQuibFuncCall, CheckButtonsQuibFuncCall
@@ -1,9 +1,13 @@
-from typing import Optional, Any, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Optional, Any, Callable, Tuple, List, Union
 
 import numpy as np
-from numpy import ndindex, s_
+from numpy import s_
 
+from pyquibbler.env import APPLY_ALONG_AXIS_MAX_WORKERS
 from pyquibbler.path import Path, PathComponent, SpecialComponent
+from pyquibbler.quib.evaluation_cancellation import raise_if_evaluation_cancelled
 from pyquibbler.quib.external_call_failed_exception_handling import \
     external_call_failed_exception_handling
 from pyquibbler.quib.specialized_functions.proxy import create_proxy
@@ -17,6 +21,20 @@ from pyquibbler.user_utils.quiby_funcs import q
 
 
 class ApplyAlongAxisQuibFuncCall(CachedQuibFuncCall):
+    """
+    Runs apply_along_axis slice by slice, keeping the output buffer across partial invalidations.
+
+    We keep track of which 1-D slices of the output buffer hold valid results, so that only slices that were
+    invalidated (and are requested) are recomputed.
+    Like the caches of other quibs, the buffer is the returned value, so recomputed slices also change arrays
+    previously returned by `get_value`. A new buffer is only allocated after a full invalidation.
+    Slices of non-graphics quibs can be dispatched to a thread pool (see `APPLY_ALONG_AXIS_MAX_WORKERS`).
+    The time of the last computation of each slice is kept in `slice_timings`.
+    """
+
+    _output_buffer: Optional[np.ndarray] = None
+    _valid_slices_mask: Optional[np.ndarray] = None
+    slice_timings: Optional[np.ndarray] = None
 
     def _run_func1d(self, arr: np.ndarray, *args, **kwargs) -> Any:
         """
@@ -56,21 +74,46 @@ class ApplyAlongAxisQuibFuncCall(CachedQuibFuncCall):
                 )
 
     @cache_method_until_full_invalidation
-    def _get_invalid_value_at_correct_shape_and_dtype(self) -> np.ndarray:
+    def _get_result_shape_and_dtype(self) -> Tuple[Shape, np.dtype]:
         """
-        Get a value that represents the real result in both shape and dtype.
+        Get the shape and dtype of the real result.
         Because the returned value can potentially be an ndarray, this will potentially execute the func1d once in
         order to get the results shape (but will remove any artists created by running it).
         """
         input_array_shape = self.arr.get_shape()
         sample_result_arr = np.asarray(self._get_sample_result())
+        new_shape = tuple(dim
+                          for i, d in enumerate(input_array_shape)
+                          for dim in ([d] if i != self.core_axis else sample_result_arr.shape))
+        return new_shape, sample_result_arr.dtype
+
+    @cache_method_until_full_invalidation
+    def _get_invalid_value_at_correct_shape_and_dtype(self) -> np.ndarray:
+        """
+        Get a value that represents the real result in both shape and dtype.
+        """
+        input_array_shape = self.arr.get_shape()
+        sample_result_arr = np.asarray(self._get_sample_result())
         dims_to_expand = list(range(0, self.core_axis))
         dims_to_expand += list(range(-1, -(len(input_array_shape) - self.core_axis), -1))
         expanded = np.expand_dims(sample_result_arr, dims_to_expand)
-        new_shape = [dim
-                     for i, d in enumerate(input_array_shape)
-                     for dim in ([d] if i != self.core_axis else sample_result_arr.shape)]
-        return np.array(np.broadcast_to(expanded, new_shape))
+        return np.array(np.broadcast_to(expanded, self._get_result_shape_and_dtype()[0]))
+
+    def _get_output_buffer(self) -> np.ndarray:
+        """
+        Get the output buffer, into which the results of the 1-D slices are written.
+
+        The buffer is kept across partial invalidations. After a full invalidation (or a change of the result shape
+        or dtype) a new buffer is allocated, so that values already returned to the user are not changed in place.
+        """
+        shape, dtype = self._get_result_shape_and_dtype()
+        buffer = self._output_buffer
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            self._output_buffer = buffer = np.empty(shape, dtype)
+            loop_shape = self._get_loop_shape()
+            self._valid_slices_mask = np.zeros(loop_shape, dtype=bool)
+            self.slice_timings = np.full(loop_shape, np.nan)
+        return buffer
 
     @property
     def core_axis(self) -> int:
@@ -92,7 +135,38 @@ class ApplyAlongAxisQuibFuncCall(CachedQuibFuncCall):
     def func1d(self) -> Callable:
         return self.func_args_kwargs.get('func1d')
 
-    def _get_oned_slice_for_running_func1d(self, indices: Tuple):
+    def _get_slices_mask_from_result_mask(self, result_bool_mask: np.ndarray) -> np.ndarray:
+        """
+        Convert a bool mask in the shape of the result to a bool mask in the loop shape, indicating the 1-D slices
+        that include any True element.
+        """
+        result_core_ndim = result_bool_mask.ndim - len(self._get_loop_shape())
+        return np.any(result_bool_mask, axis=tuple(range(self.core_axis, self.core_axis + result_core_ndim)))
+
+    def _get_slices_to_compute(self, valid_path: Path, result_shape) -> List[Tuple]:
+        """
+        Get the loop indices of the slices which are requested at `valid_path` and are not already valid
+        in the output buffer
+        """
+        indices = SpecialComponent.ALL if len(valid_path) == 0 else valid_path[0].component
+        requested_mask = self._get_slices_mask_from_result_mask(
+            create_bool_mask_with_true_at_indices(result_shape, indices))
+        return [tuple(loop_indices) for loop_indices in np.argwhere(requested_mask & ~self._valid_slices_mask)]
+
+    def _split_loop_indices(self, loop_indices: Tuple) -> Tuple[Tuple, Tuple]:
+        return loop_indices[:self.core_axis], loop_indices[self.core_axis:]
+
+    def _get_arr_value_valid_at_slices(self, slices_to_compute: List[Tuple]) -> np.ndarray:
+        """
+        Get the value of the input array, valid at all the 1-D slices we need to compute
+        """
+        slices_mask = np.zeros(self._get_loop_shape(), dtype=bool)
+        for loop_indices in slices_to_compute:
+            slices_mask[loop_indices] = True
+        arr_mask = np.broadcast_to(np.expand_dims(slices_mask, self.core_axis), self.arr.get_shape())
+        return self.arr.get_value_valid_at_path([PathComponent(arr_mask)])
+
+    def _get_oned_slice_for_running_func1d(self, indices: Tuple, arr_value: Optional[np.ndarray]):
         """
         Get the proper slice as a parameter for the func- this depends on whether the user specified that he wants a
         quib representing the result (and if so, we create a proxy quib so as not to invalidate operators quibs
@@ -101,58 +175,124 @@ class ApplyAlongAxisQuibFuncCall(CachedQuibFuncCall):
         """
         if self._pass_quibs:
             return create_proxy(self.arr[indices])
-        path = [PathComponent(indices)]
-        return self.arr.get_value_valid_at_path(path)[indices]
+        return arr_value[indices]
 
-    def _get_result_at_indices(self,
-                               requested_indices_bool_mask: np.ndarray,
-                               indices_before_axis: Tuple,
-                               indices_after_axis: Tuple,
-                               func1d_args: Args,
-                               func1d_kwargs: Kwargs):
+    def _run_slice(self, loop_indices: Tuple, arr_value: Optional[np.ndarray],
+                   func1d_args: Args, func1d_kwargs: Kwargs) -> Tuple[Any, float]:
         """
-        Get a result at the indices given as arguments- this does not necessarily mean that func1d will be run; if the
-        bool mask is not True within the given indices, then the result of this iteration was not requested (at
-        valid_path), and so we will simply return the sample result as a placeholder
+        Run func1d on the 1-D slice at the given loop indices. Returns the result and the elapsed time.
         """
+        indices_before_axis, indices_after_axis = self._split_loop_indices(loop_indices)
         indices = indices_before_axis + s_[(...,)] + indices_after_axis
-        if np.any(requested_indices_bool_mask[indices]):
-            oned_slice = self._get_oned_slice_for_running_func1d(indices)
-            res = self._run_single_call(
-                func=self.func1d,
-                graphics_collection=self.graphics_collections[indices_before_axis + indices_after_axis],
-                args=(oned_slice, *func1d_args),
-                kwargs=func1d_kwargs,
-                quibs_allowed_to_access={oned_slice} if isinstance(oned_slice, Quib) else set()
-            )
-        else:
-            res = self._get_sample_result()
-        return res
+        start_time = perf_counter()
+        oned_slice = self._get_oned_slice_for_running_func1d(indices, arr_value)
+        res = self._run_single_call(
+            func=self.func1d,
+            graphics_collection=self.graphics_collections[loop_indices],
+            args=(oned_slice, *func1d_args),
+            kwargs=func1d_kwargs,
+            quibs_allowed_to_access={oned_slice} if isinstance(oned_slice, Quib) else set()
+        )
+        return res, perf_counter() - start_time
+
+    def _run_slice_in_worker(self, loop_indices: Tuple, arr_value: np.ndarray,
+                             func1d_args: Args, func1d_kwargs: Kwargs) -> Tuple[Any, float]:
+        """
+        Run func1d on a 1-D slice in a worker thread.
+        We do not track graphics or guard quibs, as these are not thread-safe.
+        """
+        raise_if_evaluation_cancelled()
+        indices_before_axis, indices_after_axis = self._split_loop_indices(loop_indices)
+        start_time = perf_counter()
+        with external_call_failed_exception_handling():
+            res = self.func1d(arr_value[indices_before_axis + s_[(...,)] + indices_after_axis],
+                              *func1d_args, **func1d_kwargs)
+        return res, perf_counter() - start_time
+
+    def _get_number_of_workers(self, number_of_slices: int) -> int:
+        max_workers = APPLY_ALONG_AXIS_MAX_WORKERS.val
+        if max_workers is None or max_workers <= 1 or number_of_slices <= 1 \
+                or self._pass_quibs or self.func_definition.is_graphics is not False:
+            # Graphics tracking and quib guards are global, so we can only use workers for non-graphics quibs
+            return 1
+        return min(max_workers, number_of_slices)
 
     def _apply_along_axis(self, valid_path):
         """
         Run "apply_along_axis"- in reality, we need to map several different ndarrays, and so running apply_along_axis
-        itself would be problematic (as we need the indices themselves of the 1d slice). Given this, we simply run on
-        two loops of ndindex- the outer loop representing indices *before* the loop dimension, the operators loop
-        representing indices *after* the loop dimension. We then select everything in between the two index tuples,
+        itself would be problematic (as we need the indices themselves of the 1d slice). Given this, we loop over
+        the indices of the slices that need to be computed, each composed of the indices *before* the loop dimension
+        and the indices *after* the loop dimension. We then select everything in between the two index tuples,
         which is a 1d slice.
+
+        Results are written into the output buffer, so slices which are still valid are kept as is.
         """
-        indices = SpecialComponent.ALL if len(valid_path) == 0 else valid_path[0].component
-        ni, nk = self.arr.get_shape()[:self.core_axis], self.arr.get_shape()[self.core_axis + 1:]
-        out = self.run([None])
+        out = self._get_output_buffer()
+        slices_to_compute = self._get_slices_to_compute(valid_path, out.shape)
+        if len(slices_to_compute) == 0:
+            return out
+
         func_args_kwargs = FuncArgsKwargs(self.func, self.args, self.kwargs)
         args_by_name = func_args_kwargs.get_arg_values_by_keyword()
-        bool_mask = create_bool_mask_with_true_at_indices(self.get_shape(), indices)
-        for ii in ndindex(ni):
-            for kk in ndindex(nk):
-                out[ii + s_[(...,)] + kk] = self._get_result_at_indices(bool_mask,
-                                                                        indices_before_axis=ii,
-                                                                        indices_after_axis=kk,
-                                                                        func1d_args=args_by_name.get('args', []),
-                                                                        func1d_kwargs=args_by_name.get('kwargs', {}))
+        func1d_args = args_by_name.get('args', [])
+        func1d_kwargs = args_by_name.get('kwargs', {})
+        arr_value = None if self._pass_quibs else self._get_arr_value_valid_at_slices(slices_to_compute)
+
+        number_of_workers = self._get_number_of_workers(len(slices_to_compute))
+        if number_of_workers > 1:
+            with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+                results = list(executor.map(
+                    lambda loop_indices: self._run_slice_in_worker(loop_indices, arr_value, func1d_args, func1d_kwargs),
+                    slices_to_compute))
+        else:
+            results = [self._run_slice(loop_indices, arr_value, func1d_args, func1d_kwargs)
+                       for loop_indices in slices_to_compute]
+
+        for loop_indices, (res, elapsed_seconds) in zip(slices_to_compute, results):
+            if isinstance(res, Quib):
+                res = res.get_value()
+            indices_before_axis, indices_after_axis = self._split_loop_indices(loop_indices)
+            out[indices_before_axis + s_[(...,)] + indices_after_axis] = res
+            self._valid_slices_mask[loop_indices] = True
+            self.slice_timings[loop_indices] = elapsed_seconds
 
         return out
 
+    def get_hot_slices(self, amount: int = 10) -> List[Tuple[Tuple, float]]:
+        """
+        Return the loop indices and computation time of the slowest computed slices, slowest first.
+        """
+        if self.slice_timings is None:
+            return []
+        computed = np.argwhere(~np.isnan(self.slice_timings))
+        timings = [(tuple(loop_indices), self.slice_timings[tuple(loop_indices)]) for loop_indices in computed]
+        return sorted(timings, key=lambda loop_indices_and_time: -loop_indices_and_time[1])[:amount]
+
+    def _drop_output_buffer(self):
+        self._output_buffer = None
+        self._valid_slices_mask = None
+
+    def _invalidate_slices_at_path(self, path: Path):
+        if self._output_buffer is None:
+            return
+        if len(path) == 0:
+            self._drop_output_buffer()
+            return
+        try:
+            result_bool_mask = create_bool_mask_with_true_at_indices(self._output_buffer.shape, path[0].component)
+        except (IndexError, TypeError, ValueError):
+            self._drop_output_buffer()
+            return
+        self._valid_slices_mask[self._get_slices_mask_from_result_mask(result_bool_mask)] = False
+
+    def invalidate_cache_at_path(self, path: Path):
+        super().invalidate_cache_at_path(path)
+        self._invalidate_slices_at_path(path)
+
+    def on_type_change(self):
+        self._drop_output_buffer()
+        super().on_type_change()
+
     @cache_method_until_full_invalidation
     def _get_loop_shape(self) -> Shape:
         return tuple([s for i, s in enumerate(self.arr.get_shape()) if i != self.core_axis])
@@ -162,3 +302,10 @@ class ApplyAlongAxisQuibFuncCall(CachedQuibFuncCall):
             return self._get_invalid_value_at_correct_shape_and_dtype()
 
         return self._apply_along_axis(valid_path)
+
+    def run(self, valid_paths: List[Union[None, Path]]) -> Any:
+        result = super().run(valid_paths)
+        if not self._caching:
+            # A non-caching quib should recompute its slices on every run, without changing the returned value
+            self._drop_output_buffer()
+        return result
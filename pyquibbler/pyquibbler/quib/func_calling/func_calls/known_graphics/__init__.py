@@ -1,3 +1,5 @@
 from .widgets import SliderQuibFuncCall, RangeSliderQuibFuncCall, RadioButtonsQuibFuncCall, \
     RectangleSelectorQuibFuncCall, CheckButtonsQuibFuncCall
 from .plot_call import PlotQuibFuncCall
+from .scatter_call import ScatterQuibFuncCall
+from .imshow_call import ImshowQuibFuncCall
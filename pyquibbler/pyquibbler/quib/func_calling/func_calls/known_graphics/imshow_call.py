@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Set, Union, List, Optional, Callable, Dict, Tuple, Any
+
+import numpy as np
+from matplotlib.image import AxesImage
+
+from pyquibbler.graphics.graphics_collection import GraphicsCollection
+from pyquibbler.path import Path, deep_get, deep_set
+from pyquibbler.quib.evaluation_cancellation import raise_if_evaluation_cancelled
+from pyquibbler.utilities.general_utils import Args, Kwargs
+from pyquibbler.utilities.missing_value import missing
+
+from .in_place_update_call import InPlaceUpdatingQuibFuncCall, is_numeric_array
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+class ImshowQuibFuncCall(InPlaceUpdatingQuibFuncCall):
+    """
+    plt.imshow(X, ...): update the data of the AxesImage in place
+
+    When the only invalidations since the last run were of the data quib `X` at specific paths (for example,
+    painting a region of a mask), only these regions of `X` are requested, and patched into the array of the
+    existing image.
+    """
+
+    # The paths at which the data quib was invalidated since the last run. None if the image should be fully updated.
+    _invalidated_data_paths: Optional[List[Path]] = None
+    _is_invalidated_by_data_quib: bool = False
+    _data_patches: Optional[List[Tuple[Path, Any]]] = None
+
+    def _get_data_arg_ids(self, args: Args, kwargs: Kwargs) -> Set[Union[int, str]]:
+        return {1 if len(args) > 1 else 'X'}
+
+    def _get_data_arg(self, args: Args, kwargs: Kwargs):
+        return args[1] if len(args) > 1 else kwargs.get('X')
+
+    def _replace_data_arg(self, args: Args, kwargs: Kwargs, data) -> Tuple[Args, Kwargs]:
+        if len(args) > 1:
+            return args[:1] + (data, ) + args[2:], kwargs
+        return args, {**kwargs, 'X': data}
+
+    def _get_data_quib(self) -> Optional[Quib]:
+        from pyquibbler.quib.quib import Quib
+        data = self._get_data_arg(self.args, self.kwargs)
+        return data if isinstance(data, Quib) else None
+
+    """
+    partial update
+    """
+
+    def on_parent_invalidated_at_path(self, parent: Quib, path: Path):
+        if self._invalidated_data_paths is not None and len(path) > 0 and parent is self._get_data_quib():
+            self._invalidated_data_paths.append(path)
+            self._is_invalidated_by_data_quib = True
+        else:
+            self._invalidated_data_paths = None
+
+    def invalidate_cache_at_path(self, path: Path):
+        if not self._is_invalidated_by_data_quib:
+            # Invalidated not through the data quib
+            self._invalidated_data_paths = None
+        self._is_invalidated_by_data_quib = False
+        super().invalidate_cache_at_path(path)
+
+    def _get_args_and_kwargs_valid_at_quibs_to_paths(self, quibs_to_valid_paths: Dict[Quib, Optional[Path]]):
+        invalidated_data_paths = self._invalidated_data_paths
+        self._invalidated_data_paths = []
+        self._data_patches = None
+        data_quib = self._get_data_quib()
+        if not invalidated_data_paths or data_quib is None or self._previous_non_data_args_kwargs is missing:
+            return super()._get_args_and_kwargs_valid_at_quibs_to_paths(quibs_to_valid_paths)
+
+        self._data_patches = [(path, deep_get(data_quib.get_value_valid_at_path(path), path))
+                              for path in invalidated_data_paths]
+        return self.transform_sources_in_args_kwargs(
+            transform_data_source_func=lambda quib: quib.get_value_valid_at_path(quibs_to_valid_paths.get(quib)),
+            transform_parameter_func=lambda quib: missing if quib is data_quib else quib.get_value_valid_at_path([]),
+        )
+
+    def _patch_image(self, image: AxesImage, patches: List[Tuple[Path, Any]], kwargs: Kwargs) -> bool:
+        array = image.get_array()
+        if not isinstance(array, np.ndarray):
+            return False
+        for _, patch in patches:
+            patch = np.asarray(patch)
+            if not is_numeric_array(patch) or not np.all(np.isfinite(patch)) \
+                    or np.result_type(array, patch) != array.dtype:
+                return False
+
+        for path, patch in patches:
+            try:
+                deep_set(array, path, patch, raise_on_failure=True, should_copy_objects_referenced=False)
+            except Exception:
+                return False
+        image._imcache = None
+        image.stale = True
+        self._autoscale_norm(image, kwargs)
+        return True
+
+    def _run_single_call(self, func: Callable, graphics_collection: GraphicsCollection,
+                         args: Args, kwargs: Kwargs, quibs_allowed_to_access: Set[Quib]):
+        patches, self._data_patches = self._data_patches, None
+        if patches is not None:
+            raise_if_evaluation_cancelled()
+            if self._can_update_artists_in_place(graphics_collection, self._get_non_data_args_kwargs(args, kwargs)) \
+                    and len(graphics_collection.artists) == 1 and 'data' not in kwargs \
+                    and isinstance(graphics_collection.artists[0], AxesImage) \
+                    and self._patch_image(graphics_collection.artists[0], patches, kwargs):
+                return self._get_result_from_artists(graphics_collection.artists)
+
+            # Cannot patch. Get the whole data:
+            args, kwargs = self._replace_data_arg(args, kwargs, self._get_data_quib().get_value_valid_at_path([]))
+
+        return super()._run_single_call(func, graphics_collection, args, kwargs, quibs_allowed_to_access)
+
+    """
+    whole update
+    """
+
+    @staticmethod
+    def _autoscale_norm(image: AxesImage, kwargs: Kwargs):
+        if kwargs.get('norm') is None:
+            # Like a new call to imshow, scale the norm to the new data, except for specified limits:
+            image.norm.vmin = kwargs.get('vmin')
+            image.norm.vmax = kwargs.get('vmax')
+            image.autoscale_None()
+
+    def _update_artists_with_data(self, artists: List[AxesImage], args: Args, kwargs: Kwargs) -> bool:
+        if len(artists) != 1 or not isinstance(artists[0], AxesImage) or 'data' in kwargs:
+            return False
+        image = artists[0]
+        data = self._get_data_arg(args, kwargs)
+        if data is None or not is_numeric_array(data):
+            return False
+        data = np.asanyarray(data)
+        # A different shape implies a different default extent
+        if data.shape != image.get_array().shape:
+            return False
+
+        image.set_data(data)
+        self._autoscale_norm(image, kwargs)
+        return True
+
+    def _get_result_from_artists(self, artists: List[AxesImage]) -> AxesImage:
+        return artists[0]
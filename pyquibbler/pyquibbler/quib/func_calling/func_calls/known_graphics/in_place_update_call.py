@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import copy
+from abc import abstractmethod
+from typing import Any, Set, Callable, List, Tuple, Union
+
+import numpy as np
+from matplotlib.artist import Artist
+
+from pyquibbler.env import IN_PLACE_GRAPHICS_UPDATE
+from pyquibbler.graphics.graphics_collection import GraphicsCollection
+from pyquibbler.quib.evaluation_cancellation import raise_if_evaluation_cancelled
+from pyquibbler.quib.func_calling import CachedQuibFuncCall
+from pyquibbler.utilities.general_utils import Args, Kwargs
+from pyquibbler.utilities.iterators import recursively_compare_objects
+from pyquibbler.utilities.missing_value import missing
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+def is_numeric_array(value: Any) -> bool:
+    return np.asarray(value).dtype.kind in 'biuf'
+
+
+class InPlaceUpdatingQuibFuncCall(CachedQuibFuncCall):
+    """
+    A func call of a graphics function whose artists can be updated in place.
+
+    When a re-run only changes the data arguments of the function (for example, the x, y of `plot`), the existing
+    artists are updated with the new data (`Line2D.set_data`, `AxesImage.set_data`, ...), rather than calling the
+    function again to create new artists and then transferring them into the place of the previous ones.
+    """
+
+    _previous_non_data_args_kwargs = missing
+
+    @abstractmethod
+    def _get_data_arg_ids(self, args: Args, kwargs: Kwargs) -> Set[Union[int, str]]:
+        """
+        Return the indices of positional args and the names of kwargs that hold the data of the artists
+        """
+
+    @abstractmethod
+    def _update_artists_with_data(self, artists: List[Artist], args: Args, kwargs: Kwargs) -> bool:
+        """
+        Update the given artists with the data in args, kwargs.
+        Return False, without changing the artists, if the artists cannot represent the new data in place.
+        """
+
+    @abstractmethod
+    def _get_result_from_artists(self, artists: List[Artist]) -> Any:
+        """
+        Return the result that the function would have returned, given the artists it created
+        """
+
+    def _get_non_data_args_kwargs(self, args: Args, kwargs: Kwargs) -> Tuple[Args, Kwargs]:
+        data_arg_ids = self._get_data_arg_ids(args, kwargs)
+        return tuple(arg for i, arg in enumerate(args) if i not in data_arg_ids), \
+            {key: value for key, value in kwargs.items() if key not in data_arg_ids}
+
+    @staticmethod
+    def _are_non_data_args_kwargs_equal(args_kwargs: Tuple[Args, Kwargs], other_args_kwargs: Tuple[Args, Kwargs]):
+        (args, kwargs), (other_args, other_kwargs) = args_kwargs, other_args_kwargs
+        # The first arg is the axes, which we compare by identity
+        if not (len(args) == len(other_args) and len(args) > 0 and args[0] is other_args[0]):
+            return False
+        try:
+            return bool(recursively_compare_objects((args[1:], kwargs), (other_args[1:], other_kwargs)))
+        except Exception:
+            return False
+
+    def _can_update_artists_in_place(self, graphics_collection: GraphicsCollection,
+                                     non_data_args_kwargs: Tuple[Args, Kwargs]) -> bool:
+        if not IN_PLACE_GRAPHICS_UPDATE \
+                or self._previous_non_data_args_kwargs is missing \
+                or len(graphics_collection.widgets) > 0:
+            return False
+
+        artists = graphics_collection.artists
+        return len(artists) > 0 and len(graphics_collection._get_artists_still_in_axes()) == len(artists) \
+            and self._are_non_data_args_kwargs_equal(non_data_args_kwargs, self._previous_non_data_args_kwargs)
+
+    def _try_to_update_artists_in_place(self, graphics_collection: GraphicsCollection,
+                                        non_data_args_kwargs: Tuple[Args, Kwargs], args: Args, kwargs: Kwargs):
+        if not self._can_update_artists_in_place(graphics_collection, non_data_args_kwargs) \
+                or not self._update_artists_with_data(graphics_collection.artists, args, kwargs):
+            return missing
+
+        return self._get_result_from_artists(graphics_collection.artists)
+
+    def _run_single_call(self, func: Callable, graphics_collection: GraphicsCollection,
+                         args: Args, kwargs: Kwargs, quibs_allowed_to_access: Set[Quib]):
+        raise_if_evaluation_cancelled()
+        non_data_args_kwargs = self._get_non_data_args_kwargs(args, kwargs)
+        result = self._try_to_update_artists_in_place(graphics_collection, non_data_args_kwargs, args, kwargs)
+        if result is not missing:
+            return result
+
+        self._previous_non_data_args_kwargs = missing
+        result = super()._run_single_call(func, graphics_collection, args, kwargs, quibs_allowed_to_access)
+
+        non_data_args, non_data_kwargs = non_data_args_kwargs
+        try:
+            # Keep a copy, as the arguments may be mutated in place by upstream quibs
+            copied_args, copied_kwargs = copy.deepcopy((non_data_args[1:], non_data_kwargs))
+        except Exception:
+            return result
+        self._previous_non_data_args_kwargs = non_data_args[:1] + copied_args, copied_kwargs
+        return result
@@ -1,8 +1,154 @@
-from pyquibbler.path.path_component import Path
-from pyquibbler.quib.func_calling import CachedQuibFuncCall
+from __future__ import annotations
 
+from typing import Set, Union, List, Optional, Tuple, Dict, Callable
 
-class PlotQuibFuncCall(CachedQuibFuncCall):
+import numpy as np
+from matplotlib.lines import Line2D
+
+from pyquibbler.graphics.graphics_collection import GraphicsCollection
+from pyquibbler.path.path_component import Path, PathComponent
+from pyquibbler.quib.graphics.downsampling import get_downsampling_method, get_visible_x_range, \
+    get_number_of_pixels, get_downsampled_indices, get_index_range_of_x_range, set_downsampling_of_line
+from pyquibbler.quib.graphics.event_handling.plt_plot_parser import get_xdata_arg_indices_and_ydata_arg_indices
+from pyquibbler.utilities.general_utils import Args, Kwargs
+
+from .in_place_update_call import InPlaceUpdatingQuibFuncCall, is_numeric_array
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+def get_lines_data_from_plot_args(args: Args) -> Optional[List[Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Return the (xdata, ydata) of each of the lines created by plt.plot(*args), or None if the args do not
+    represent simple numeric data
+    """
+    lines_data = []
+    x_data_arg_indices, y_data_arg_indices, _ = get_xdata_arg_indices_and_ydata_arg_indices(args)
+    for x_index, y_index in zip(x_data_arg_indices, y_data_arg_indices):
+        # Masks are kept, so that masked points are drawn as gaps (as in plt.plot)
+        y = np.ma.asarray(args[y_index])
+        if not (1 <= y.ndim <= 2 and is_numeric_array(y)):
+            return None
+        x = np.arange(len(y)) if x_index is None else np.ma.asarray(args[x_index])
+        if not (1 <= x.ndim <= 2 and is_numeric_array(x)) or len(x) != len(y):
+            return None
+        x = x.reshape(len(x), -1)
+        y = y.reshape(len(y), -1)
+        if x.shape[1] != y.shape[1] and x.shape[1] != 1 and y.shape[1] != 1:
+            return None
+        for column in range(max(x.shape[1], y.shape[1])):
+            lines_data.append((x[:, column if x.shape[1] > 1 else 0], y[:, column if y.shape[1] > 1 else 0]))
+    return lines_data
+
+
+def downsample_plot_args(args: Args, method: str) -> Optional[Tuple[Args, List[Optional[np.ndarray]]]]:
+    """
+    Decimate the lines of plt.plot(*args) to the pixel resolution of the axes, within its visible x-range.
+    Returns the new args, and the original indices of the points kept in each line (None for lines that are kept
+    whole). Returns None if there is nothing to downsample.
+    Lines without xdata are given xdata of their original indices.
+    """
+    axes = args[0]
+    x_range = get_visible_x_range(axes)
+    number_of_pixels = get_number_of_pixels(axes)
+    new_args = [axes]
+    lines_indices = []
+    for x_index, y_index, fmt_index in zip(*get_xdata_arg_indices_and_ydata_arg_indices(args)):
+        y = np.asarray(args[y_index])
+        x = None if x_index is None else np.asarray(args[x_index])
+        if y.ndim != 1:
+            # We only downsample plots in which each pair of x, y creates a single line
+            return None
+        indices = None
+        if is_numeric_array(y) and (x is None or is_numeric_array(x)):
+            indices = get_downsampled_indices(x, y, x_range, number_of_pixels, method)
+        lines_indices.append(indices)
+        if indices is None:
+            new_args.extend(args[index] for index in (x_index, y_index) if index is not None)
+        else:
+            new_args.extend((indices if x is None else x[indices], y[indices]))
+        if fmt_index is not None:
+            new_args.append(args[fmt_index])
+
+    if all(indices is None for indices in lines_indices):
+        return None
+    return tuple(new_args), lines_indices
+
+
+class PlotQuibFuncCall(InPlaceUpdatingQuibFuncCall):
+
+    def _get_quibs_to_paths_needed_for_display(self) -> Dict[Quib, Path]:
+        """
+        When downsampling plots of a zoomed-in axes, only the part of the ydata within the visible x-range is needed.
+        """
+        from pyquibbler.quib.quib import Quib
+        args = self.args
+        if get_downsampling_method() is None or 'data' in self.kwargs \
+                or len(args) == 0 or isinstance(args[0], Quib) or get_visible_x_range(args[0]) is None:
+            return {}
+
+        axes = args[0]
+        x_range = get_visible_x_range(axes)
+        number_of_pixels = get_number_of_pixels(axes)
+        quibs_to_paths = {}
+        x_data_arg_indices, y_data_arg_indices, _ = get_xdata_arg_indices_and_ydata_arg_indices(args)
+        if any(len(args[y_index].get_shape() if isinstance(args[y_index], Quib) else np.shape(args[y_index])) != 1
+               for y_index in y_data_arg_indices):
+            # Not downsampled (see downsample_plot_args)
+            return {}
+        for x_index, y_index in zip(x_data_arg_indices, y_data_arg_indices):
+            y = args[y_index]
+            if not isinstance(y, Quib):
+                continue
+            shape = y.get_shape()
+            if len(shape) != 1 or shape[0] <= 2 * number_of_pixels or y in quibs_to_paths:
+                # Not downsampled, or needed by more than one line
+                quibs_to_paths[y] = []
+                continue
+            if x_index is None:
+                x = np.arange(shape[0])
+            else:
+                x = args[x_index]
+                x = np.asarray(x.get_value_valid_at_path([]) if isinstance(x, Quib) else x)
+                if x.shape != shape or not is_numeric_array(x) or np.any(np.diff(x) < 0):
+                    quibs_to_paths[y] = []
+                    continue
+            start, stop = get_index_range_of_x_range(x, x_range)
+            quibs_to_paths[y] = [PathComponent(slice(start, stop))]
+        return quibs_to_paths
+
+    def _get_args_and_kwargs_valid_at_quibs_to_paths(self, quibs_to_valid_paths: Dict[Quib, Optional[Path]]):
+        quibs_to_paths_needed_for_display = self._get_quibs_to_paths_needed_for_display()
+        if not quibs_to_paths_needed_for_display:
+            return super()._get_args_and_kwargs_valid_at_quibs_to_paths(quibs_to_valid_paths)
+
+        return self.transform_sources_in_args_kwargs(
+            transform_data_source_func=lambda quib: quib.get_value_valid_at_path(quibs_to_valid_paths.get(quib)),
+            transform_parameter_func=lambda quib: quib.get_value_valid_at_path(
+                quibs_to_paths_needed_for_display.get(quib, [])),
+        )
+
+    def _run_single_call(self, func: Callable, graphics_collection: GraphicsCollection,
+                         args: Args, kwargs: Kwargs, quibs_allowed_to_access: Set[Quib]):
+        method = get_downsampling_method()
+        downsampled = None if method is None or 'data' in kwargs else downsample_plot_args(args, method)
+        if downsampled is None:
+            lines_indices = None
+        else:
+            args, lines_indices = downsampled
+
+        result = super()._run_single_call(func, graphics_collection, args, kwargs, quibs_allowed_to_access)
+
+        artists = graphics_collection.artists
+        for i, artist in enumerate(artists):
+            if isinstance(artist, Line2D):
+                if lines_indices is None:
+                    set_downsampling_of_line(artist, None, None, is_tracked=False)
+                else:
+                    set_downsampling_of_line(artist, lines_indices[i], get_visible_x_range(artist.axes))
+        return result
 
     def _run_on_path(self, valid_path: Path):
         res = super(PlotQuibFuncCall, self)._run_on_path(valid_path)
@@ -11,3 +157,25 @@ class PlotQuibFuncCall(CachedQuibFuncCall):
             artist._index_in_plot = i
 
         return res
+
+    def _get_data_arg_ids(self, args: Args, kwargs: Kwargs) -> Set[Union[int, str]]:
+        x_data_arg_indices, y_data_arg_indices, _ = get_xdata_arg_indices_and_ydata_arg_indices(args)
+        return {index for index in x_data_arg_indices + y_data_arg_indices if index is not None}
+
+    def _update_artists_with_data(self, artists: List[Line2D], args: Args, kwargs: Kwargs) -> bool:
+        if 'data' in kwargs:
+            return False
+        lines_data = get_lines_data_from_plot_args(args)
+        if lines_data is None or len(lines_data) != len(artists) \
+                or not all(isinstance(artist, Line2D) for artist in artists):
+            return False
+
+        axes = artists[0].axes
+        for line, (xdata, ydata) in zip(artists, lines_data):
+            line.set_data(xdata, ydata)
+            axes._update_line_limits(line)
+        axes._request_autoscale_view()
+        return True
+
+    def _get_result_from_artists(self, artists: List[Line2D]) -> List[Line2D]:
+        return list(artists)
@@ -0,0 +1,44 @@
+from typing import Set, Union, List
+
+import numpy as np
+from matplotlib.collections import PathCollection
+
+from pyquibbler.utilities.general_utils import Args, Kwargs
+
+from .in_place_update_call import InPlaceUpdatingQuibFuncCall, is_numeric_array
+
+
+class ScatterQuibFuncCall(InPlaceUpdatingQuibFuncCall):
+    """
+    plt.scatter(x, y, ...): update the offsets of the PathCollection in place
+    """
+
+    DATA_ARGS = ((1, 'x'), (2, 'y'))
+
+    def _get_data_arg_ids(self, args: Args, kwargs: Kwargs) -> Set[Union[int, str]]:
+        return {index if index < len(args) else name for index, name in self.DATA_ARGS}
+
+    def _update_artists_with_data(self, artists: List[PathCollection], args: Args, kwargs: Kwargs) -> bool:
+        if len(artists) != 1 or not isinstance(artists[0], PathCollection) or 'data' in kwargs:
+            return False
+        collection = artists[0]
+        try:
+            x, y = (args[index] if index < len(args) else kwargs[name] for index, name in self.DATA_ARGS)
+        except KeyError:
+            return False
+        if np.ma.is_masked(x) or np.ma.is_masked(y) or not is_numeric_array(x) or not is_numeric_array(y):
+            return False
+        x = np.ravel(x)
+        y = np.ravel(y)
+        # Per-point properties (sizes, colors) were set for the previous number of points:
+        if x.shape != y.shape or len(x) != len(collection.get_offsets()):
+            return False
+
+        offsets = np.column_stack([x, y])
+        collection.set_offsets(offsets)
+        collection.axes.update_datalim(offsets)
+        collection.axes._request_autoscale_view()
+        return True
+
+    def _get_result_from_artists(self, artists: List[PathCollection]) -> PathCollection:
+        return artists[0]
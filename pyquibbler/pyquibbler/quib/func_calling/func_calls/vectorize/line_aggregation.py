@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Any, Optional, Set
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.axes import Axes
+from matplotlib.collections import Collection, LineCollection, PathCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.markers import MarkerStyle
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
+
+from pyquibbler.graphics.graphics_collection import GraphicsCollection
+
+
+NONE_STYLES = ('None', 'none', '', ' ', None)
+
+# `transOffset` was renamed `offset_transform` in matplotlib 3.6
+OFFSET_TRANSFORM_KWARG = 'offset_transform' \
+    if 'offset_transform' in inspect.signature(Collection.__init__).parameters else 'transOffset'
+
+
+@dataclass
+class AggregatedLine:
+    segment: np.ndarray
+    color: Any
+    linewidth: float
+    linestyle: Any
+
+
+@dataclass
+class AggregatedMarkers:
+    offsets: np.ndarray
+    path: Path
+    size: float
+    facecolor: Any
+    edgecolor: Any
+    edgewidth: float
+
+
+@dataclass
+class AggregatedArtist:
+    """
+    The parts of a Line2D which are drawn by the aggregating collections of its axes
+    """
+    axes: Axes
+    line: Optional[AggregatedLine]
+    markers: Optional[AggregatedMarkers]
+
+
+def _has_style(style) -> bool:
+    return not (isinstance(style, str) or style is None) or style not in NONE_STYLES
+
+
+def _is_line_aggregatable(artist: Artist) -> bool:
+    # Lines drawn as steps, partially filled markers, and markers drawn at only some points are kept as individual
+    # artists
+    return type(artist) is Line2D and artist.axes is not None and artist.get_drawstyle() == 'default' \
+        and (not _has_style(artist.get_marker())
+             or (artist.get_fillstyle() == 'full' and artist.get_markevery() is None))
+
+
+def _aggregate_and_hide_line(line: Line2D) -> AggregatedArtist:
+    line.set_visible(False)  # The line remains pickable, for dragging
+    xydata = line.get_xydata()
+    aggregated_line = None
+    if _has_style(line.get_linestyle()):
+        aggregated_line = AggregatedLine(
+            segment=xydata,
+            color=line.get_color(),
+            linewidth=line.get_linewidth(),
+            linestyle=line.get_linestyle(),
+        )
+    aggregated_markers = None
+    if _has_style(line.get_marker()):
+        marker_style = MarkerStyle(line.get_marker())
+        aggregated_markers = AggregatedMarkers(
+            offsets=xydata,
+            path=marker_style.get_path().transformed(marker_style.get_transform()),
+            size=line.get_markersize() ** 2,
+            facecolor=to_rgba(line.get_markerfacecolor()),
+            edgecolor=to_rgba(line.get_markeredgecolor()),
+            edgewidth=line.get_markeredgewidth(),
+        )
+    return AggregatedArtist(axes=line.axes, line=aggregated_line, markers=aggregated_markers)
+
+
+def _update_line_collection(line_collection: LineCollection, lines: List[AggregatedLine]):
+    line_collection.set_segments([line.segment for line in lines])
+    line_collection.set_color([line.color for line in lines])
+    line_collection.set_linewidth([line.linewidth for line in lines])
+    line_collection.set_linestyle([line.linestyle for line in lines])
+
+
+def _update_path_collection(path_collection: PathCollection, markers: List[AggregatedMarkers]):
+    # One path, size and color per point:
+    numbers_of_points = [len(marker.offsets) for marker in markers]
+    path_collection.set_paths([marker.path for marker, number in zip(markers, numbers_of_points)
+                               for _ in range(number)])
+    path_collection.set_offsets(np.concatenate([marker.offsets for marker in markers]) if markers
+                                else np.empty((0, 2)))
+    path_collection.set_sizes(np.repeat([marker.size for marker in markers], numbers_of_points))
+    path_collection.set_facecolor(np.repeat([marker.facecolor for marker in markers], numbers_of_points, axis=0))
+    path_collection.set_edgecolor(np.repeat([marker.edgecolor for marker in markers], numbers_of_points, axis=0))
+    path_collection.set_linewidth(np.repeat([marker.edgewidth for marker in markers], numbers_of_points))
+
+
+def _create_path_collection(axes: Axes) -> PathCollection:
+    # Like the PathCollection of `scatter`, marker paths are in points, placed at offsets in data coordinates
+    path_collection = PathCollection([], sizes=[], zorder=Line2D.zorder, **{OFFSET_TRANSFORM_KWARG: axes.transData})
+    path_collection.set_transform(IdentityTransform())
+    return path_collection
+
+
+@dataclass
+class LinesAggregator:
+    """
+    Draws the lines created by all the iterations of a vectorized graphics function as a single LineCollection, and
+    their markers as a single PathCollection, per axes, instead of an individual Line2D per iteration.
+
+    The individual lines are kept (hidden) in their graphics collections, so that they can still be picked and
+    dragged. Only the lines of iterations that were re-run (which have new artists) are re-read, and only the
+    collections of axes with such lines are updated.
+    """
+
+    iterations_to_artists_and_aggregated: Dict[int, Tuple[List[Artist], List[AggregatedArtist]]] = \
+        field(default_factory=dict)
+    axes_to_line_collections: Dict[Axes, LineCollection] = field(default_factory=dict)
+    axes_to_path_collections: Dict[Axes, PathCollection] = field(default_factory=dict)
+
+    def _update_iteration(self, iteration: int, graphics_collection: GraphicsCollection) -> Set[Axes]:
+        """
+        Re-read the lines of the iteration, if it was re-run. Returns the axes whose aggregated lines changed.
+        """
+        artists = graphics_collection.artists
+        previous = self.iterations_to_artists_and_aggregated.get(iteration)
+        if previous is not None and len(previous[0]) == len(artists) \
+                and all(artist is previous_artist for artist, previous_artist in zip(artists, previous[0])):
+            return set()
+
+        aggregated = [_aggregate_and_hide_line(artist) for artist in artists if _is_line_aggregatable(artist)]
+        self.iterations_to_artists_and_aggregated[iteration] = list(artists), aggregated
+        changed_axes = {aggregated_artist.axes for aggregated_artist in aggregated}
+        if previous is not None:
+            changed_axes.update(aggregated_artist.axes for aggregated_artist in previous[1])
+        return changed_axes
+
+    @staticmethod
+    def _get_collection(axes_to_collections: Dict[Axes, Collection], axes: Axes, create_collection):
+        collection = axes_to_collections.get(axes)
+        if collection is None or collection.axes is not axes:
+            collection = create_collection()
+            axes.add_collection(collection, autolim=False)
+            axes_to_collections[axes] = collection
+        return collection
+
+    @staticmethod
+    def _remove_collection(axes_to_collections: Dict[Axes, Collection], axes: Axes):
+        collection = axes_to_collections.pop(axes, None)
+        if collection is not None and collection.axes is not None:
+            collection.remove()
+
+    def _update_axes(self, axes: Axes):
+        aggregated = [aggregated_artist
+                      for _, aggregated_artists in self.iterations_to_artists_and_aggregated.values()
+                      for aggregated_artist in aggregated_artists if aggregated_artist.axes is axes]
+
+        lines = [aggregated_artist.line for aggregated_artist in aggregated if aggregated_artist.line is not None]
+        if lines:
+            _update_line_collection(
+                self._get_collection(self.axes_to_line_collections, axes, lambda: LineCollection([])), lines)
+        else:
+            self._remove_collection(self.axes_to_line_collections, axes)
+
+        markers = [aggregated_artist.markers for aggregated_artist in aggregated
+                   if aggregated_artist.markers is not None]
+        if markers:
+            _update_path_collection(
+                self._get_collection(self.axes_to_path_collections, axes, lambda: _create_path_collection(axes)),
+                markers)
+        else:
+            self._remove_collection(self.axes_to_path_collections, axes)
+
+    def update(self, graphics_collections: List[GraphicsCollection]):
+        changed_axes = set()
+        for iteration in list(self.iterations_to_artists_and_aggregated):
+            if iteration >= len(graphics_collections):
+                _, aggregated = self.iterations_to_artists_and_aggregated.pop(iteration)
+                changed_axes.update(aggregated_artist.axes for aggregated_artist in aggregated)
+
+        for iteration, graphics_collection in enumerate(graphics_collections):
+            changed_axes |= self._update_iteration(iteration, graphics_collection)
+
+        for axes in changed_axes:
+            self._update_axes(axes)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import numpy as np
-from typing import Iterable, Optional, Dict, Union, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Iterable, Optional, Dict, Union, Any, Hashable, TYPE_CHECKING
 from string import ascii_letters
 from itertools import islice
 
-from pyquibbler.utilities.general_utils import Shape
+from pyquibbler.utilities.general_utils import Shape, Args, Kwargs
+from pyquibbler.utilities.missing_value import missing
 
 if TYPE_CHECKING:
     from .vectorize_metadata import ArgsMetadata
@@ -78,3 +80,57 @@ def get_indices_array(shape: Shape) -> np.ndarray:
     indices pointing to that cell.
     """
     return np.apply_along_axis(Indices, -1, np.moveaxis(np.indices(shape), 0, -1))
+
+
+def _get_memo_key_of_value(value: Any) -> Hashable:
+    """
+    Return a hashable key representing the value. Raises TypeError for unhashable values.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError()
+        return np.ndarray, value.shape, value.dtype.str, value.tobytes()
+    hash(value)
+    # we include the type, so that 1, 1.0 and True are memoized separately:
+    return type(value), value
+
+
+def get_memo_key(args: Args, kwargs: Kwargs) -> Optional[Hashable]:
+    """
+    Return a hashable key representing the values of the given args and kwargs,
+    or None if any of the values cannot be hashed.
+    """
+    try:
+        return tuple(map(_get_memo_key_of_value, args)), \
+            tuple((name, _get_memo_key_of_value(value)) for name, value in sorted(kwargs.items()))
+    except TypeError:
+        return None
+
+
+class ElementMemo:
+    """
+    A bounded memo of the results of single calls of a vectorize pyfunc, keyed by the argument values.
+    Least recently used results are evicted when the memo is full.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._results = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the memoized result for the key, or `missing` if not memoized.
+        """
+        result = self._results.get(key, missing)
+        if result is not missing:
+            self._results.move_to_end(key)
+        return result
+
+    def set(self, key: Hashable, result: Any):
+        self._results[key] = result
+        self._results.move_to_end(key)
+        if len(self._results) > self.max_size:
+            self._results.popitem(last=False)
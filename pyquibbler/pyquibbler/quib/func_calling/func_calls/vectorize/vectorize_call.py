@@ -18,12 +18,16 @@ from pyquibbler.graphics.utils import remove_created_graphics
 from pyquibbler.utilities.missing_value import missing
 from pyquibbler.utilities.numpy_original_functions import np_array
 
+from .line_aggregation import LinesAggregator
 from .vectorize_metadata import VectorizeCaller, VectorizeMetadata
-from .utils import alter_signature, copy_vectorize, get_indices_array
+from .utils import alter_signature, copy_vectorize, get_indices_array, get_memo_key, ElementMemo
 
 
 class VectorizeQuibFuncCall(CachedQuibFuncCall):
 
+    _element_memo: Optional[ElementMemo] = None
+    _lines_aggregator: Optional[LinesAggregator] = None
+
     def _wrap_vectorize_caller_to_pass_quibs(self, call: VectorizeCaller, args_metadata,
                                              results_core_ndims) -> VectorizeCaller:
         """
@@ -171,6 +175,7 @@ class VectorizeQuibFuncCall(CachedQuibFuncCall):
         # as it is run for every index in the loop.
         pyfunc = call.vectorize.pyfunc
         empty_result = np.empty(self._vectorize_metadata.result_core_shape, dtype=self._vectorize_metadata.result_dtype)
+        memo = self._get_element_memo()
 
         def wrapper(graphics_collection, should_run, *args, **kwargs):
             if should_run:
@@ -179,14 +184,40 @@ class VectorizeQuibFuncCall(CachedQuibFuncCall):
                                              quibs_allowed_to_access=call.quibs_to_guard)
             return empty_result
 
+        def memoized_wrapper(graphics_collection, should_run, *args, **kwargs):
+            if should_run:
+                key = get_memo_key(args, kwargs)
+                result = missing if key is None else memo.get(key)
+                if result is missing:
+                    result = self._run_single_call(func=pyfunc, args=args, kwargs=kwargs,
+                                                   graphics_collection=graphics_collection,
+                                                   quibs_allowed_to_access=call.quibs_to_guard)
+                    if key is not None and not graphics_collection.artists:
+                        memo.set(key, result)
+                return result
+            return empty_result
+
+        wrapper_to_vectorize = wrapper if memo is None else memoized_wrapper
         args_to_add = (self.graphics_collections, bool_mask)
         wrapper_excluded = {i + len(args_to_add) if isinstance(i, int) else i for i in self._vectorize.excluded}
         wrapper_signature = call.vectorize.signature if call.vectorize.signature is None \
             else '(),' * len(args_to_add) + call.vectorize.signature
-        vectorize = copy_vectorize(call.vectorize, func=wrapper, excluded=wrapper_excluded, signature=wrapper_signature,
-                                   otypes=otypes)
+        vectorize = copy_vectorize(call.vectorize, func=wrapper_to_vectorize, excluded=wrapper_excluded,
+                                   signature=wrapper_signature, otypes=otypes)
         return VectorizeCaller(vectorize, (*args_to_add, *call.args), call.kwargs)
 
+    def _get_element_memo(self) -> Optional[ElementMemo]:
+        """
+        Get the memo of per-element results, or None if memoization is not requested or not possible
+        (for random functions, graphics functions, or when passing quibs).
+        """
+        memo_size = getattr(self._vectorize, 'memo_size', None)
+        if not memo_size or self._pass_quibs or self.func_definition.is_random or self.func_can_create_graphics:
+            return None
+        if self._element_memo is None or self._element_memo.max_size != memo_size:
+            self._element_memo = ElementMemo(memo_size)
+        return self._element_memo
+
     @cache_method_until_full_invalidation
     def get_result_metadata(self) -> Dict:
         return {
@@ -205,4 +236,17 @@ class VectorizeQuibFuncCall(CachedQuibFuncCall):
                                           vectorize_metadata.result_or_results_core_ndims, valid_path)
         call = self._wrap_vectorize_caller_to_calc_only_needed(call, valid_path, vectorize_metadata.otypes)
 
-        return call()
+        result = call()
+        self._aggregate_lines()
+        return result
+
+    def _aggregate_lines(self):
+        """
+        If requested (`aggregate_lines=True`), draw the lines of all iterations as a single LineCollection (and their
+        markers as a single PathCollection) per axes
+        """
+        if not getattr(self._vectorize, 'aggregate_lines', False):
+            return
+        if self._lines_aggregator is None:
+            self._lines_aggregator = LinesAggregator()
+        self._lines_aggregator.update(self.flat_graphics_collections())
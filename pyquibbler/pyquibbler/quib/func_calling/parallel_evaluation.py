@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple, Any
+
+from pyquibbler.env import PARENTS_EVALUATION_MAX_WORKERS
+from pyquibbler.path import Path
+from pyquibbler.quib.evaluation_threads import on_evaluation_threads_start
+from pyquibbler.quib.get_value_context_manager import get_value_context
+from pyquibbler.quib.quib_guard import QuibGuard
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+_WORKER_STATE = threading.local()
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+_EXECUTOR_MAX_WORKERS: Optional[int] = None
+
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def is_within_parallel_evaluation() -> bool:
+    return getattr(_WORKER_STATE, 'is_worker', False)
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _EXECUTOR, _EXECUTOR_MAX_WORKERS
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None or _EXECUTOR_MAX_WORKERS != max_workers:
+            if _EXECUTOR is not None:
+                _EXECUTOR.shutdown(wait=False)
+            _EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='quibbler-parents')
+            on_evaluation_threads_start()
+            _EXECUTOR_MAX_WORKERS = max_workers
+        return _EXECUTOR
+
+
+def is_parallel_evaluation_allowed() -> bool:
+    return PARENTS_EVALUATION_MAX_WORKERS.val > 1 \
+        and not is_within_parallel_evaluation() \
+        and not QuibGuard.is_within_quib_guard()
+
+
+def _get_value_valid_at_path_in_worker(quib: Quib, path: Optional[Path]) -> Any:
+    _WORKER_STATE.is_worker = True
+    try:
+        return quib.get_value_valid_at_path(path)
+    finally:
+        _WORKER_STATE.is_worker = False
+
+
+def evaluate_quibs_in_parallel(quibs_and_paths: List[Tuple[Quib, Optional[Path]]]) -> List[Any]:
+    """
+    Get the values of the given quibs, each valid at its respective path, evaluating the quibs concurrently.
+
+    Each quib is evaluated under its own lock, so quibs shared by several of the evaluated branches are computed once.
+    Evaluation within a worker is serial (nested parallelism is not allowed), so the pool can never deadlock on itself.
+    Exceptions are re-raised in the calling thread, in the order of the given quibs.
+    """
+    executor = _get_executor(PARENTS_EVALUATION_MAX_WORKERS.val)
+    # Enter the get-value context in the calling thread, so that workers do not race on setting and resetting it:
+    with get_value_context():
+        futures = [executor.submit(_get_value_valid_at_path_in_worker, quib, path)
+                   for quib, path in quibs_and_paths]
+        exception = None
+        values = []
+        for future in futures:
+            try:
+                values.append(future.result())
+            except Exception as e:
+                values.append(None)
+                if exception is None:
+                    exception = e
+        if exception is not None:
+            raise exception
+    return values
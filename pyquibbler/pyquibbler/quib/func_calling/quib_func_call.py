@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 # types:
 from typing import Optional, Type, Dict, Callable, Any, List, Union
@@ -35,7 +35,7 @@ class QuibFuncCall(FuncCall):
 
     artists_creation_callback: Optional[Callable] = None
     graphics_collections: Optional[np.ndarray[GraphicsCollection]] = None
-    method_cache: Dict[Callable, Any] = field(default_factory=dict)
+    method_cache: Optional[Dict[Callable, Any]] = None  # created upon first use
     cache: Optional[Cache] = None
     _caching: bool = False
     result_type: Optional[Type] = None
@@ -142,13 +142,20 @@ class QuibFuncCall(FuncCall):
         return is_graphics or (is_graphics is None and self.created_graphics)
 
     def on_type_change(self):
-        self.method_cache.clear()
+        self.method_cache = None
         self.result_type = None
         self.result_shape = None
 
     def invalidate_cache_at_path(self, path: Path):
         pass
 
+    def on_parent_invalidated_at_path(self, parent: Quib, path: Path):
+        """
+        Called when a parent quib is invalidated at the given path (in the coordinates of the parent), before this
+        quib is invalidated accordingly.
+        """
+        pass
+
     def get_result_metadata(self) -> Dict:
         return {}
 
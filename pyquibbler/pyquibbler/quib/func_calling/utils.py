@@ -14,7 +14,9 @@ if TYPE_CHECKING:
 def cache_method_until_full_invalidation(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(self: QuibFuncCall):
-        if func in self.method_cache:
+        if self.method_cache is None:
+            self.method_cache = {}
+        elif func in self.method_cache:
             return self.method_cache[func]
         result = func(self)
         self.method_cache[func] = result
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, Optional, Set
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+GetNeighbours = Callable[['Quib'], Iterable['Quib']]
+
+# Stamps data cached on the structure of the quib graph (like the ancestors of quibs). Incremented whenever a change
+# of the edges of the graph may change the ancestors or descendants of existing quibs.
+GRAPH_VERSION = 0
+
+
+def get_graph_version() -> int:
+    return GRAPH_VERSION
+
+
+def on_graph_edges_change():
+    global GRAPH_VERSION
+    GRAPH_VERSION += 1
+
+
+def iter_reachable_quibs(quibs: Iterable[Quib],
+                         get_neighbours: GetNeighbours,
+                         depth: Optional[float] = None,
+                         visited: Optional[Set[Quib]] = None,
+                         ) -> Iterator[Quib]:
+    """
+    Breadth-first iteration over the quibs reachable from the given quibs, nearest first, each quib once.
+
+    The given quibs themselves are not yielded (unless reachable from one another).
+    `depth` limits the number of steps from the given quibs (`None` for no limit).
+    Quibs in `visited` are neither yielded nor explored through; yielded quibs are added to it.
+    """
+    visited = set() if visited is None else visited
+    queue = deque((quib, 0) for quib in quibs)
+    while queue:
+        quib, distance = queue.popleft()
+        if depth is not None and distance >= depth:
+            continue
+        for neighbour in get_neighbours(quib):
+            if neighbour not in visited:
+                visited.add(neighbour)
+                yield neighbour
+                queue.append((neighbour, distance + 1))
+
+
+def iter_quibs_bypassing_intermediate(quibs: Iterable[Quib], get_neighbours: GetNeighbours) -> Iterator[Quib]:
+    """
+    Iterate over the given quibs, replacing intermediate quibs (unnamed, non-graphics) by their nearest
+    non-intermediate neighbours. Each quib is yielded once.
+    """
+    visited = set()
+    stack = list(quibs)
+    while stack:
+        quib = stack.pop()
+        if quib in visited:
+            continue
+        visited.add(quib)
+        if quib.assigned_name is None and not quib.is_graphics_quib:
+            stack.extend(get_neighbours(quib))
+        else:
+            yield quib
+
+
+def get_topological_order(quibs: Iterable[Quib], get_parents: GetNeighbours) -> List[Quib]:
+    """
+    Order the given quibs, together with their ancestors reachable by `get_parents`, such that each quib comes
+    after its parents.
+
+    Uses an iterative depth-first search, so that it is not limited by the recursion limit.
+    """
+    order = []
+    visited = set()
+    for root in quibs:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(get_parents(root)))]
+        while stack:
+            quib, parents = stack[-1]
+            for parent in parents:
+                if parent not in visited:
+                    visited.add(parent)
+                    stack.append((parent, iter(get_parents(parent))))
+                    break
+            else:
+                stack.pop()
+                order.append(quib)
+    return order
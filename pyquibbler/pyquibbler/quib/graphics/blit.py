@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
+
+from pyquibbler.env import BLIT_WHILE_DRAGGING
+
+
+@dataclass
+class FigureBlitState:
+    """
+    The blitting state of a figure during drag: the artists that change during the drag are animated (excluded from
+    full draws), and are drawn on top of a background of the static content, which is captured once.
+    """
+    animated_artists: List[Artist] = field(default_factory=list)
+    background: Any = None
+    view_limits: Optional[Tuple] = None
+
+
+FIGURES_TO_BLIT_STATES: weakref.WeakKeyDictionary[Figure, FigureBlitState] = weakref.WeakKeyDictionary()
+
+
+def can_blit_figure(figure: Figure) -> bool:
+    return BLIT_WHILE_DRAGGING and getattr(figure.canvas, 'supports_blit', False)
+
+
+def is_blitting_figure(figure: Figure) -> bool:
+    return figure in FIGURES_TO_BLIT_STATES
+
+
+def add_artists_to_blit(artists: Iterable[Artist]):
+    """
+    Animate the given artists, so that they are blitted on top of the static background of their figure
+    """
+    for artist in artists:
+        figure = artist.figure
+        if figure is None or not can_blit_figure(figure):
+            continue
+        blit_state = FIGURES_TO_BLIT_STATES.setdefault(figure, FigureBlitState())
+        if artist not in blit_state.animated_artists:
+            artist.set_animated(True)
+            blit_state.animated_artists.append(artist)
+            blit_state.background = None  # The artist is no longer part of the background
+
+
+def _get_view_limits(figure: Figure) -> Tuple:
+    return tuple(tuple(axes.viewLim.bounds) for axes in figure.axes)
+
+
+def blit_figure(figure: Figure):
+    """
+    Restore the static background of the figure, and draw only its animated artists on top of it.
+    The background is (re)captured upon the first blit, or whenever the axes limits change.
+    """
+    blit_state = FIGURES_TO_BLIT_STATES[figure]
+    canvas = figure.canvas
+    # Artists replaced by new artists are no longer in their axes:
+    blit_state.animated_artists = [artist for artist in blit_state.animated_artists
+                                   if artist.axes is not None and artist in artist.axes._children]
+
+    view_limits = _get_view_limits(figure)
+    if blit_state.background is None or view_limits != blit_state.view_limits:
+        canvas.draw()
+        blit_state.background = canvas.copy_from_bbox(figure.bbox)
+        blit_state.view_limits = view_limits
+    else:
+        canvas.restore_region(blit_state.background)
+
+    for artist in blit_state.animated_artists:
+        figure.draw_artist(artist)
+    canvas.blit(figure.bbox)
+    canvas.flush_events()
+
+
+def end_blitting() -> Set[Figure]:
+    """
+    Return all animated artists to normal drawing. Returns the figures that were blitted (and need a full redraw).
+    """
+    figures = set()
+    for figure, blit_state in list(FIGURES_TO_BLIT_STATES.items()):
+        for artist in blit_state.animated_artists:
+            artist.set_animated(False)
+        figures.add(figure)
+    FIGURES_TO_BLIT_STATES.clear()
+    return figures
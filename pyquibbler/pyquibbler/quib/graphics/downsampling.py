@@ -0,0 +1,162 @@
+"""
+Display-aware decimation of large line plots.
+
+When PLOT_DOWNSAMPLING is set, `plot` graphics quibs pass to matplotlib only the points needed to draw each line at the
+pixel resolution of the axes, within the visible x-range. The indices of the kept points are stored on the artist, so
+that mouse interactions can be mapped back to the original data.
+"""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
+
+from pyquibbler.env import PLOT_DOWNSAMPLING
+from pyquibbler.quib.graphics import artist_wrapper
+
+
+DOWNSAMPLING_METHODS = ('minmax', 'lttb')
+
+XRange = Optional[Tuple[float, float]]
+
+
+def get_downsampling_method() -> Optional[str]:
+    method = PLOT_DOWNSAMPLING.val
+    if method is not None and method not in DOWNSAMPLING_METHODS:
+        raise ValueError(f'PLOT_DOWNSAMPLING should be None or one of {DOWNSAMPLING_METHODS}; got {method!r}')
+    return method
+
+
+def get_visible_x_range(axes: Axes) -> XRange:
+    """
+    The x-range shown by the axes, or None if the axes is autoscaling (the whole data is visible)
+    """
+    if axes.get_autoscalex_on():
+        return None
+    return tuple(sorted(axes.get_xlim()))
+
+
+def get_number_of_pixels(axes: Axes) -> int:
+    return max(int(axes.bbox.width), 1)
+
+
+def get_index_range_of_x_range(x: np.ndarray, x_range: XRange) -> Tuple[int, int]:
+    """
+    The index range of the points of (sorted) `x` within `x_range`, including one point beyond each edge, so that
+    the line continues out of the axes
+    """
+    if x_range is None:
+        return 0, len(x)
+    start = max(np.searchsorted(x, x_range[0], side='left') - 1, 0)
+    stop = min(np.searchsorted(x, x_range[1], side='right') + 1, len(x))
+    return int(start), int(stop)
+
+
+def get_minmax_indices(y: np.ndarray, number_of_bins: int) -> np.ndarray:
+    """
+    The indices of the minimal and maximal point of each bin (plus the first and last point), which is all that is
+    needed to draw a line with a resolution of `number_of_bins`
+    """
+    length = len(y)
+    if length <= 2 * number_of_bins:
+        return np.arange(length)
+    bin_size = length // number_of_bins
+    binned_length = bin_size * number_of_bins
+    bins = y[:binned_length].reshape(number_of_bins, bin_size)
+    offsets = np.arange(number_of_bins) * bin_size
+    indices = [offsets + np.argmin(bins, axis=1), offsets + np.argmax(bins, axis=1), [0, length - 1]]
+    if binned_length < length:
+        indices.append(binned_length + np.array([np.argmin(y[binned_length:]), np.argmax(y[binned_length:])]))
+    return np.unique(np.concatenate(indices))
+
+
+def get_lttb_indices(x: np.ndarray, y: np.ndarray, number_of_points: int) -> np.ndarray:
+    """
+    The indices of the points kept by the Largest-Triangle-Three-Buckets algorithm
+    """
+    length = len(y)
+    if length <= number_of_points or number_of_points < 3:
+        return np.arange(length)
+    edges = np.floor(np.linspace(1, length - 1, number_of_points - 1)).astype(int)
+    indices = np.empty(number_of_points, dtype=int)
+    indices[0] = 0
+    indices[-1] = length - 1
+    previous = 0
+    for bucket in range(number_of_points - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        next_x = x[stop:next_stop].mean()
+        next_y = y[stop:next_stop].mean()
+        areas = np.abs((x[previous] - next_x) * (y[start:stop] - y[previous])
+                       - (x[previous] - x[start:stop]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+    return indices
+
+
+def get_downsampled_indices(x: Optional[np.ndarray], y: np.ndarray, x_range: XRange,
+                            number_of_pixels: int, method: str) -> Optional[np.ndarray]:
+    """
+    The indices of the points needed to draw the line (x, y) within `x_range`.
+    Returns None if the line is not worth (or cannot be) downsampled.
+    `x` of None indicates x = arange(len(y)).
+    """
+    if y.ndim != 1 or len(y) <= 2 * number_of_pixels:
+        return None
+    if x is None:
+        x = np.arange(len(y))
+    elif x.shape != y.shape or np.any(np.diff(x) < 0):
+        # matplotlib connects the points in their order. We only downsample monotonic x
+        return None
+
+    start, stop = get_index_range_of_x_range(x, x_range)
+    if method == 'minmax':
+        indices = get_minmax_indices(y[start:stop], number_of_pixels)
+    else:
+        indices = get_lttb_indices(x[start:stop].astype(float), y[start:stop].astype(float), 2 * number_of_pixels)
+    return start + indices
+
+
+def set_downsampling_of_line(line: Line2D, indices: Optional[np.ndarray], x_range: XRange, is_tracked: bool = True):
+    """
+    Record the original indices of the points of a line, and the x-range for which it was downsampled.
+    Tracked lines are re-decimated when the x-range of their axes changes.
+    """
+    line._quibbler_downsampled_indices = indices
+    if is_tracked:
+        line._quibbler_downsampled_x_range = x_range
+    elif hasattr(line, '_quibbler_downsampled_x_range'):
+        del line._quibbler_downsampled_x_range
+
+
+def get_original_data_indices(artist, indices):
+    """
+    Map indices of the points of a (possibly downsampled) artist to indices into the original data
+    """
+    downsampled_indices = getattr(artist, '_quibbler_downsampled_indices', None)
+    if not isinstance(downsampled_indices, np.ndarray):
+        return indices
+    return downsampled_indices[np.asarray(indices)]
+
+
+def redecimate_plots_in_axes(axes: Axes):
+    """
+    Called upon change of the axes limits: re-evaluate downsampled plots whose visible x-range has changed
+    """
+    if get_downsampling_method() is None:
+        return
+    x_range = get_visible_x_range(axes)
+    quibs = set()
+    for line in axes.lines:
+        if not hasattr(line, '_quibbler_downsampled_x_range') or line._quibbler_downsampled_x_range == x_range:
+            continue
+        quib = artist_wrapper.get_creating_quib(line)
+        if quib is not None:
+            quibs.add(quib)
+
+    from pyquibbler.quib.graphics.redraw import aggregate_redraw_mode
+    with aggregate_redraw_mode():
+        for quib in quibs:
+            quib.handler.invalidate_self([])
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
 from threading import Lock
-from typing import Optional, Tuple, Callable, Union
+from typing import Optional, Tuple, Callable, Union, Dict
 
 from matplotlib.artist import Artist
 from matplotlib.backend_bases import MouseEvent, PickEvent, MouseButton
 from matplotlib.axes import Axes
 
 from pyquibbler.debug_utils.timer import timeit
-from pyquibbler.env import END_DRAG_IMMEDIATELY
+from pyquibbler.env import END_DRAG_IMMEDIATELY, CANCEL_STALE_DRAG_EVALUATIONS
+from pyquibbler.quib.evaluation_cancellation import GenerationToken, EvaluationCancelledException, \
+    cancellable_evaluation, non_cancellable_evaluation
 
 from .. import artist_wrapper
 from ..redraw import end_dragging, start_dragging
@@ -47,6 +49,9 @@ class CanvasEventHandler:
         self.current_pick_quib: Optional[Quib] = None
         self._previous_mouse_event: Optional[MouseEvent] = None
         self._assignment_lock = Lock()
+        self._generation_token = GenerationToken()
+        self._pending_mouse_events: Dict[Artist, MouseEvent] = {}
+        self._is_release_pending = False
 
         self.EVENT_HANDLERS = {
             'button_press_event': self._handle_button_press,
@@ -70,10 +75,19 @@ class CanvasEventHandler:
             self._call_object_rightclick_callback_if_exists(mouse_event.inaxes, mouse_event)
 
     def _handle_button_release(self, _mouse_event: MouseEvent):
-        end_dragging()
+        if self._assignment_lock.locked():
+            # We are in the middle of an assignment. The drop is handled once the pending events are applied.
+            self._is_release_pending = True
+            return
+        self._end_drag()
+
+    def _end_drag(self):
+        with non_cancellable_evaluation():
+            end_dragging()
         self.current_pick_event = None
         self.current_pick_quib = None
         self._previous_mouse_event = None
+        self._pending_mouse_events.clear()
 
     def _handle_pick_event(self, pick_event: PickEvent):
         start_dragging()
@@ -135,21 +149,58 @@ class CanvasEventHandler:
 
     def _inverse_from_mouse_event(self, mouse_event):
         if self.current_pick_event is not None:
-            with self._try_acquire_assignment_lock() as locked:
-                if locked:
-                    # If not locked, there is already another motion handler running, we just drop this one.
-                    # This could happen if changes are slow or if a dialog is open
-                    if self._previous_mouse_event is None:
-                        xy_dominance = None
-                    else:
-                        xy_dominance = 'x' if abs(mouse_event.x - self._previous_mouse_event.x) > \
-                                              abs(mouse_event.y - self._previous_mouse_event.y) else 'y'
-                    mouse_event.xy_dominance = xy_dominance
-                    self._inverse_assign_graphics(mouse_event)
-                    self._previous_mouse_event = mouse_event
-                    if END_DRAG_IMMEDIATELY:
-                        self.current_pick_event = None
-                        self.current_pick_quib = None
+            self._generation_token.new_generation()
+            self._pending_mouse_events[self.current_pick_event.artist] = mouse_event
+            self._process_pending_events()
+
+    def _pop_pending_mouse_event(self) -> Optional[MouseEvent]:
+        """
+        Pop the latest pending mouse event of the currently picked artist (events of other artists are stale)
+        """
+        pick_event = self.current_pick_event
+        mouse_event = None if pick_event is None else self._pending_mouse_events.pop(pick_event.artist, None)
+        self._pending_mouse_events.clear()
+        return mouse_event
+
+    def _process_pending_events(self):
+        """
+        Inverse assign the latest pending mouse event, and then handle a pending button release.
+        Events that arrive while we are busy are collapsed: only the latest one is processed once we are done.
+        """
+        with self._try_acquire_assignment_lock() as locked:
+            if not locked:
+                # There is already another handler running (this could happen if changes are slow or if a dialog is
+                # open). It will process the pending event once done (or, when cancelling stale recalculations, as
+                # soon as it reaches a cancellation check point).
+                return
+
+            mouse_event = self._pop_pending_mouse_event()
+            while mouse_event is not None:
+                try:
+                    self._inverse_assign_graphics_from_mouse_event(mouse_event, self._generation_token.generation)
+                except EvaluationCancelledException:
+                    pass
+                mouse_event = self._pop_pending_mouse_event()
+
+        if self._is_release_pending:
+            self._is_release_pending = False
+            self._end_drag()
+
+    def _inverse_assign_graphics_from_mouse_event(self, mouse_event, generation: int):
+        if self._previous_mouse_event is None:
+            xy_dominance = None
+        else:
+            xy_dominance = 'x' if abs(mouse_event.x - self._previous_mouse_event.x) > \
+                                  abs(mouse_event.y - self._previous_mouse_event.y) else 'y'
+        mouse_event.xy_dominance = xy_dominance
+        self._previous_mouse_event = mouse_event
+        with ExitStack() as stack:
+            if CANCEL_STALE_DRAG_EVALUATIONS:
+                stack.enter_context(cancellable_evaluation(self._generation_token, generation))
+            self._inverse_assign_graphics(mouse_event)
+        if END_DRAG_IMMEDIATELY:
+            self.current_pick_event = None
+            self.current_pick_quib = None
 
     def initialize(self):
         """
@@ -186,5 +237,7 @@ class CanvasEventHandler:
                         lim=lim,
                         is_override_removal=False,
                     )
+            if locked:
+                self._process_pending_events()
         else:
             drawing_func(ax, lim)
@@ -10,8 +10,10 @@ from pyquibbler.assignment import get_axes_x_y_tolerance, create_assignment, Ove
     get_override_group_for_quib_changes, AssignmentToQuib, default, get_override_group_for_quib_change
 from pyquibbler.assignment.utils import convert_scalar_value
 from pyquibbler.path import Path, deep_get
+from pyquibbler.quib.graphics.downsampling import get_original_data_indices
 
 from .affected_args_and_paths import get_quibs_and_paths_affected_by_event
+from .transform_cache import get_artist_transform_cache
 from .utils import get_closest_point_on_line_in_axes
 
 from typing import TYPE_CHECKING
@@ -87,7 +89,7 @@ def get_override_group_by_indices(xy_args: XY, data_index: Union[None, int],
 
     from pyquibbler import Project
     project = Project.get_or_create()
-    point_indices = pick_event.ind
+    point_indices = get_original_data_indices(pick_event.artist, pick_event.ind)
     ax = pick_event.artist.axes
 
     # For x and y, get list of (quib, path) for each affected plot index. None if not a quib
@@ -108,6 +110,9 @@ def get_override_group_by_indices(xy_args: XY, data_index: Union[None, int],
 
     xy_order = (0, 1) if _is_dragged_in_x_more_than_y(pick_event, mouse_event) else (1, 0)
 
+    # The cached transforms of the artist save their re-creation for each dragged point
+    transform_cache = get_artist_transform_cache(pick_event.artist)
+
     for xy_quib_and_path, xy_offset in [(XY(quib_and_path_x, quib_and_path_y), PointXY(dxy[0], dxy[1]))
                                         for quib_and_path_x, quib_and_path_y, dxy
                                         in zip(xy_quibs_and_paths.x, xy_quibs_and_paths.y, pick_event.xy_offset)]:
@@ -144,7 +149,11 @@ def get_override_group_by_indices(xy_args: XY, data_index: Union[None, int],
                 if is_other_affected and ax is not None:  # ax can be None in testing
                     # The other axis also changed. x and y are dependent.  We need to find the drag-line and
                     # find the point on this line which is closest to the mouse position.
-                    xy_closest, slope = get_closest_point_on_line_in_axes(ax, xy_old, xy_new, xy_assigned_value)
+                    if transform_cache is None:
+                        xy_closest, slope = get_closest_point_on_line_in_axes(ax, xy_old, xy_new, xy_assigned_value)
+                    else:
+                        xy_closest, slope = transform_cache.get_closest_point_on_line(xy_old, xy_new,
+                                                                                      xy_assigned_value)
                     adjusted_assigned_value = xy_closest[focal_xy]
                     adjustment_to_tolerance = slope[focal_xy]
                 else:
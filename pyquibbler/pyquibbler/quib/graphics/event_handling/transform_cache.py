@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import weakref
+from typing import Optional, Tuple
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+from matplotlib.transforms import Transform
+
+from pyquibbler.quib.types import PointXY
+
+from .utils import get_closest_point_on_line
+
+
+class ArtistTransformCache:
+    """
+    The data of an artist, together with the transforms between the data and display coordinates of the artist.
+
+    The cache is kept per artist, and its transforms, including the inverted transform, are only re-created when the
+    transform of the artist changes (see `_get_transform_key`). Replacing the data of the artist (as happens upon
+    dragging) only replaces the data of the cache.
+    """
+
+    def __init__(self, data, transform: Transform, transform_key: Tuple):
+        self.data = data
+        self.transform = transform
+        self.transform_key = transform_key
+        self.inverted_transform = transform.inverted()
+
+    def get_xy(self, indices) -> np.ndarray:
+        """
+        Return the specified points in data coordinates (the underlying data of masked points included).
+        """
+        return np.ma.getdata(self.data)[indices, :]
+
+    def get_closest_point_on_line(self, xy1: PointXY, xy2: PointXY, xy_p: PointXY) -> Tuple[PointXY, PointXY]:
+        """
+        Like `get_closest_point_on_line_in_axes`, using the cached transforms.
+        """
+        xy1, xy2, xy_p = map(PointXY.from_array_like, self.transform.transform([xy1, xy2, xy_p]))
+        xy, slope = get_closest_point_on_line(xy1, xy2, xy_p)
+
+        return PointXY.from_array_like(self.inverted_transform.transform(xy)), slope
+
+
+ARTISTS_TO_TRANSFORM_CACHES: weakref.WeakKeyDictionary[Artist, ArtistTransformCache] = weakref.WeakKeyDictionary()
+
+
+def _get_data_and_transform(artist: Artist) -> Optional[Tuple[np.ndarray, Transform]]:
+    if isinstance(artist, Line2D):
+        return artist.get_xydata(), artist.get_transform()
+    if isinstance(artist, PathCollection):
+        return artist.get_offsets(), artist.get_offset_transform()
+    return None
+
+
+def _get_transform_key(artist: Artist, transform: Transform) -> Tuple:
+    # The non-affine part of the data transform is determined by the scales of the axes
+    axes = artist.axes
+    scales = None if transform.is_affine or axes is None else (axes.get_xscale(), axes.get_yscale())
+    return transform.get_affine().get_matrix().tobytes(), scales
+
+
+def get_artist_transform_cache(artist: Artist) -> Optional[ArtistTransformCache]:
+    """
+    Return the transform cache of a Line2D or PathCollection artist.
+    The cache is kept per artist, and is only re-created when the transform of the artist changes.
+    Returns None for other artists.
+    """
+    data_and_transform = _get_data_and_transform(artist)
+    if data_and_transform is None:
+        return None
+    data, transform = data_and_transform
+
+    transform_key = _get_transform_key(artist, transform)
+    transform_cache = ARTISTS_TO_TRANSFORM_CACHES.get(artist)
+    if transform_cache is None or transform_cache.transform is not transform \
+            or transform_cache.transform_key != transform_key:
+        transform_cache = ArtistTransformCache(data, transform, transform_key)
+        ARTISTS_TO_TRANSFORM_CACHES[artist] = transform_cache
+    else:
+        transform_cache.data = data
+    return transform_cache
@@ -43,11 +43,9 @@ def get_closest_point_on_line_in_axes(ax: Axes, xy1: PointXY, xy2: PointXY, xy_p
     also return `slope`: the normalized dx, dy of the line
     """
 
-    xy, slope = get_closest_point_on_line(
-        PointXY.from_array_like(ax.transData.transform(xy1)),
-        PointXY.from_array_like(ax.transData.transform(xy2)),
-        PointXY.from_array_like(ax.transData.transform(xy_p)),
-    )
+    # transform all points in a single vectorized call
+    xy1, xy2, xy_p = map(PointXY.from_array_like, ax.transData.transform([xy1, xy2, xy_p]))
+    xy, slope = get_closest_point_on_line(xy1, xy2, xy_p)
 
     return PointXY.from_array_like(ax.transData.inverted().transform(xy)), slope
 
@@ -57,8 +55,7 @@ def get_sqr_distance_in_axes(ax: Axes, xy1: PointXY, xy2: PointXY) -> float:
     Returns the square distance in pixels between two points in axes
     """
 
-    xy1 = PointXY.from_array_like(ax.transData.transform(xy1))
-    xy2 = PointXY.from_array_like(ax.transData.transform(xy2))
+    xy1, xy2 = map(PointXY.from_array_like, ax.transData.transform([xy1, xy2]))
     d = xy1 - xy2
 
     return d.x ** 2 + d.y ** 2
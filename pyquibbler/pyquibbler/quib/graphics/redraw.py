@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import contextlib
 import weakref
+from time import perf_counter
 
 from typing import Set, Dict
+from matplotlib.backend_bases import TimerBase
 from matplotlib.figure import Figure
 from matplotlib.pyplot import fignum_exists
 from matplotlib._pylab_helpers import Gcf
 from matplotlib.pyplot import get_backend
 
 from pyquibbler.debug_utils import timeit
+from pyquibbler.env import GRAPHICS_MAX_FPS, BLIT_WHILE_DRAGGING
+from pyquibbler.quib.async_evaluation import call_soon_in_loop_if_in_async_evaluation
 
 from .graphics_update import GraphicsUpdateType
+from .blit import add_artists_to_blit, is_blitting_figure, blit_figure, end_blitting
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -23,6 +28,16 @@ QUIBS_TO_NOTIFY_OVERRIDING_CHANGES: weakref.WeakSet[Quib] = weakref.WeakSet()
 IN_AGGREGATE_REDRAW_MODE = False
 IN_DRAGGING_MODE = False
 
+# Frame-rate capping of redraws during drag:
+FIGURES_TO_LAST_REDRAW_TIMES: weakref.WeakKeyDictionary[Figure, float] = weakref.WeakKeyDictionary()
+DIRTY_FIGURES: weakref.WeakSet[Figure] = weakref.WeakSet()
+FIGURES_TO_FLUSH_TIMERS: weakref.WeakKeyDictionary[Figure, TimerBase] = weakref.WeakKeyDictionary()
+
+# Deferred updating of graphics quibs of non-visible figures:
+PAUSED_FIGURES: weakref.WeakSet[Figure] = weakref.WeakSet()
+FIGURES_TO_DEFERRED_QUIBS: weakref.WeakKeyDictionary[Figure, weakref.WeakSet[Quib]] = weakref.WeakKeyDictionary()
+FIGURES_TO_DRAW_EVENT_CIDS: weakref.WeakKeyDictionary[Figure, int] = weakref.WeakKeyDictionary()
+
 
 @contextlib.contextmanager
 def aggregate_redraw_mode(temporarily: bool = False):
@@ -72,6 +87,9 @@ def end_dragging():
         _redraw_quibs_with_graphics(GraphicsUpdateType.DROP)
     except Exception:
         project.undo()
+    finally:
+        redraw_figures(end_blitting(), throttle=False)
+        flush_dirty_figures()
 
     project.remove_last_undo_group_if_empty()
     project.set_undo_redo_buttons_enable_state()
@@ -106,6 +124,10 @@ def _redraw_quibs_with_graphics(graphics_update: GraphicsUpdateType):
     global QUIBS_TO_REDRAW
     quib_refs = QUIBS_TO_REDRAW[graphics_update]
     quibs = set(quib_refs)
+    for quib in quibs:
+        if _defer_quib_if_its_figures_are_not_visible(quib):
+            quib_refs.remove(quib)
+    quibs = set(quib_refs)
     with timeit("quib redraw", f"redrawing {len(quib_refs)} quibs"), skip_canvas_draws():
         for quib in quibs:
             quib.handler.reevaluate_graphic_quib()
@@ -113,9 +135,99 @@ def _redraw_quibs_with_graphics(graphics_update: GraphicsUpdateType):
 
     figures = {figure for quib in quibs for figure in quib.handler.get_figures() if figure is not None}
 
+    if is_dragging() and BLIT_WHILE_DRAGGING:
+        add_artists_to_blit(artist for quib in quibs for artist in quib.handler.get_artists())
+
     redraw_figures(figures)
 
 
+def _is_canvas_realized(canvas) -> bool:
+    get_tk_widget = getattr(canvas, 'get_tk_widget', None)
+    if get_tk_widget is None:
+        return True
+    try:
+        # False for windows that are minimized, or not shown yet
+        return bool(get_tk_widget().winfo_viewable())
+    except Exception:
+        return True
+
+
+def is_figure_visible(figure: Figure) -> bool:
+    """
+    A figure is not visible if it is closed, its canvas is not realized, or it was paused (see `pause_figure`).
+    """
+    if figure in PAUSED_FIGURES:
+        return False
+    number = getattr(figure, 'number', None)
+    if number is not None and not fignum_exists(number):
+        return False
+    return _is_canvas_realized(figure.canvas)
+
+
+def _defer_quib_if_its_figures_are_not_visible(quib: Quib) -> bool:
+    """
+    Graphics quibs whose figures are all not visible are not recalculated. Instead, they are recalculated once
+    any of their figures becomes visible (upon draw of the figure, or upon `resume_figure`).
+    """
+    figures = {figure for figure in quib.handler.get_figures() if figure is not None}
+    if len(figures) == 0 or any(is_figure_visible(figure) for figure in figures):
+        return False
+
+    for figure in figures:
+        if figure not in FIGURES_TO_DEFERRED_QUIBS:
+            FIGURES_TO_DEFERRED_QUIBS[figure] = weakref.WeakSet()
+        if figure not in FIGURES_TO_DRAW_EVENT_CIDS:
+            _connect_to_draw_event(figure)
+        FIGURES_TO_DEFERRED_QUIBS[figure].add(quib)
+    return True
+
+
+def _connect_to_draw_event(figure: Figure):
+    figure_ref = weakref.ref(figure)
+
+    def _on_draw(_event):
+        drawn_figure = figure_ref()
+        if drawn_figure is not None and drawn_figure in FIGURES_TO_DEFERRED_QUIBS \
+                and is_figure_visible(drawn_figure):
+            redraw_deferred_quibs_of_figure(drawn_figure)
+
+    FIGURES_TO_DRAW_EVENT_CIDS[figure] = figure.canvas.mpl_connect('draw_event', _on_draw)
+
+
+def _disconnect_from_draw_event(figure: Figure):
+    cid = FIGURES_TO_DRAW_EVENT_CIDS.pop(figure, None)
+    if cid is not None:
+        figure.canvas.mpl_disconnect(cid)
+
+
+def redraw_deferred_quibs_of_figure(figure: Figure) -> bool:
+    """
+    Recalculate the graphics quibs whose update was deferred while the figure was not visible.
+    Returns False if there were no such quibs.
+    """
+    quibs = FIGURES_TO_DEFERRED_QUIBS.pop(figure, None)
+    _disconnect_from_draw_event(figure)
+    if not quibs:
+        return False
+    with aggregate_redraw_mode():
+        for quib in set(quibs):
+            for other_quibs in FIGURES_TO_DEFERRED_QUIBS.values():
+                other_quibs.discard(quib)
+            QUIBS_TO_REDRAW[GraphicsUpdateType.DROP].add(quib)
+    return True
+
+
+def pause_figure(figure: Figure):
+    PAUSED_FIGURES.add(figure)
+
+
+def resume_figure(figure: Figure):
+    PAUSED_FIGURES.discard(figure)
+    if is_figure_visible(figure) and not redraw_deferred_quibs_of_figure(figure):
+        # Graphics quibs of other figures may have also updated artists of this figure
+        redraw_figures({figure}, throttle=False)
+
+
 def _notify_of_overriding_changes():
     with timeit("override_notify", f"notifying overriding changes for {len(QUIBS_TO_NOTIFY_OVERRIDING_CHANGES)} quibs"):
         quibs = set(QUIBS_TO_NOTIFY_OVERRIDING_CHANGES)
@@ -129,6 +241,10 @@ def redraw_quib_with_graphics_or_add_in_aggregate_mode(quib: Quib, graphics_upda
     if not (graphics_update == GraphicsUpdateType.DRAG or graphics_update == GraphicsUpdateType.DROP):
         return
 
+    if call_soon_in_loop_if_in_async_evaluation(redraw_quib_with_graphics_or_add_in_aggregate_mode,
+                                                quib, graphics_update):
+        return
+
     QUIBS_TO_REDRAW[graphics_update].add(quib)
     if not IN_AGGREGATE_REDRAW_MODE:
         _redraw_quibs_with_graphics(graphics_update)
@@ -136,6 +252,9 @@ def redraw_quib_with_graphics_or_add_in_aggregate_mode(quib: Quib, graphics_upda
 
 def notify_of_overriding_changes_or_add_in_aggregate_mode(quib: Quib):
     global QUIBS_TO_NOTIFY_OVERRIDING_CHANGES
+    if call_soon_in_loop_if_in_async_evaluation(notify_of_overriding_changes_or_add_in_aggregate_mode, quib):
+        return
+
     QUIBS_TO_NOTIFY_OVERRIDING_CHANGES.add(quib)
     if not IN_AGGREGATE_REDRAW_MODE:
         _notify_of_overriding_changes()
@@ -157,11 +276,72 @@ def redraw_canvas(canvas):
         canvas.start_event_loop(0.001)
 
 
-def redraw_figures(figures: Set[Figure]):
+def _get_figures_to_redraw_now(figures: Set[Figure], min_interval: float) -> Set[Figure]:
+    """
+    Return the figures that were not redrawn within the last `min_interval` seconds.
+    The other figures are marked dirty and flushed once their interval passes (or upon end of dragging).
+    """
+    now = perf_counter()
+    figures_to_redraw_now = set()
+    for figure in figures:
+        remaining = FIGURES_TO_LAST_REDRAW_TIMES.get(figure, -min_interval) + min_interval - now
+        if remaining <= 0:
+            figures_to_redraw_now.add(figure)
+        else:
+            DIRTY_FIGURES.add(figure)
+            _schedule_flush(figure, remaining)
+    return figures_to_redraw_now
+
+
+def _schedule_flush(figure: Figure, delay: float):
+    if figure in FIGURES_TO_FLUSH_TIMERS:
+        return
+    figure_ref = weakref.ref(figure)
+
+    def _flush():
+        flushed_figure = figure_ref()
+        if flushed_figure is not None:
+            FIGURES_TO_FLUSH_TIMERS.pop(flushed_figure, None)
+            if flushed_figure in DIRTY_FIGURES:
+                redraw_figures({flushed_figure}, throttle=False)
+
+    timer = figure.canvas.new_timer(interval=max(1, int(delay * 1000)))
+    timer.single_shot = True
+    timer.add_callback(_flush)
+    timer.start()
+    FIGURES_TO_FLUSH_TIMERS[figure] = timer
+
+
+def flush_dirty_figures():
+    """
+    Redraw all figures whose redraw was deferred by the frame-rate cap
+    """
+    for timer in FIGURES_TO_FLUSH_TIMERS.values():
+        timer.stop()
+    FIGURES_TO_FLUSH_TIMERS.clear()
+    redraw_figures(set(DIRTY_FIGURES), throttle=False)
+
+
+def redraw_figures(figures: Set[Figure], throttle: bool = True):
     """
     Actual redrawing of figure- this should be WITHOUT rendering anything except for the new artists
+
+    While dragging, if GRAPHICS_MAX_FPS is set, figures are redrawn at most GRAPHICS_MAX_FPS times per second.
     """
-    canvases = {figure.canvas for figure in figures if fignum_exists(figure.number)}
+    figures = {figure for figure in figures if is_figure_visible(figure)}
+    max_fps = GRAPHICS_MAX_FPS.val
+    if throttle and max_fps is not None and is_dragging():
+        figures = _get_figures_to_redraw_now(figures, 1 / max_fps)
+
+    canvases_to_figures = {figure.canvas: figure for figure in figures}
     with timeit("redraw", f"redraw {len(figures)} figures"):
-        for canvas in canvases:
-            redraw_canvas(canvas)
+        for canvas, figure in canvases_to_figures.items():
+            if is_blitting_figure(figure):
+                blit_figure(figure)
+            else:
+                redraw_canvas(canvas)
+
+    now = perf_counter()
+    for figure in figures:
+        DIRTY_FIGURES.discard(figure)
+        FIGURES_TO_LAST_REDRAW_TIMES[figure] = now
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import contextlib
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Optional, Any, List, Dict, Tuple
+
+from pyquibbler.path import Path
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyquibbler.quib.quib import Quib
+
+
+@dataclass
+class PendingVerification:
+    """
+    An invalidation of a verifying quib at `path`, whose effect on the children of the quib awaits verification.
+    `old_value` is a copy of the value of the quib at the path before the invalidation (`missing` if unknown).
+    """
+    path: Path
+    old_value: Any
+    is_full_invalidation: bool
+
+
+@dataclass
+class PendingVerifications:
+    """
+    The verifications pending during an invalidation pass, keyed by quib, and ordered by the depth of the quibs.
+    """
+    quibs_to_verifications: Dict[Quib, List[PendingVerification]] = field(default_factory=dict)
+    heap: List[Tuple[int, int, Quib]] = field(default_factory=list)
+    counter: itertools.count = field(default_factory=itertools.count)
+
+    def add(self, quib: Quib, verification: PendingVerification):
+        verifications = self.quibs_to_verifications.get(quib)
+        if verifications is None:
+            self.quibs_to_verifications[quib] = verifications = []
+            heapq.heappush(self.heap, (quib.handler.get_depth(), next(self.counter), quib))
+        verifications.append(verification)
+
+    def pop(self) -> Tuple[Quib, List[PendingVerification]]:
+        _, _, quib = heapq.heappop(self.heap)
+        return quib, self.quibs_to_verifications.pop(quib)
+
+
+_PENDING_VERIFICATIONS: Optional[PendingVerifications] = None
+
+
+def add_pending_verification(quib: Quib, verification: PendingVerification):
+    _PENDING_VERIFICATIONS.add(quib, verification)
+
+
+def is_verification_pending_at_path(quib: Quib, path: Path) -> bool:
+    verifications = _PENDING_VERIFICATIONS.quibs_to_verifications.get(quib, [])
+    return any(verification.path == path for verification in verifications)
+
+
+@contextlib.contextmanager
+def deferred_invalidation_verification():
+    """
+    Verifying quibs invalidated within this context are only verified (recalculated and compared with their old
+    value) once the invalidation pass is over, shallowest quibs first.
+
+    A quib is thereby only recalculated after all its affected ancestors were invalidated, or verified, so that it is
+    never recalculated from stale caches. Verifications may invalidate further quibs, adding verifications.
+    Nested contexts join the outermost one.
+    """
+    global _PENDING_VERIFICATIONS
+    if _PENDING_VERIFICATIONS is not None:
+        yield
+        return
+
+    pending_verifications = _PENDING_VERIFICATIONS = PendingVerifications()
+    try:
+        yield
+        while pending_verifications.heap:
+            quib, verifications = pending_verifications.pop()
+            quib.handler.verify_invalidation_and_invalidate_children(verifications)
+    finally:
+        _PENDING_VERIFICATIONS = None
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import copy
 import pathlib
+import threading
 import weakref
+from contextlib import nullcontext
 
 import numpy as np
 
 # Typing
 from pyquibbler.utilities.general_utils import Shape, Args, Kwargs
-from typing import Set, Any, Optional, Type, List, Union, Iterable, Callable
+from typing import Set, Any, Optional, Type, List, Union, Iterable, Callable, Dict, FrozenSet, Tuple, Iterator
 
 # Matplotlib types:
 from matplotlib.artist import Artist
@@ -23,6 +25,7 @@ from pyquibbler.utilities.warning_messages import no_header_warn
 from pyquibbler.utilities.input_validation_utils import validate_user_input, InvalidArgumentValueException, \
     get_enum_by_str
 from pyquibbler.utilities.missing_value import missing
+from pyquibbler.utilities.iterators import recursively_compare_objects
 
 # Assignments:
 from pyquibbler.assignment import \
@@ -38,26 +41,34 @@ from pyquibbler.file_syncing import SaveFormat, SAVE_FORMAT_TO_FILE_EXT, \
 from pyquibbler.utilities.file_path import PathWithHyperLink
 
 # Create new quibs:
-from pyquibbler.env import LEN_BOOL_ETC_RAISE_EXCEPTION, ITER_RAISE_EXCEPTION
+from pyquibbler.env import LEN_BOOL_ETC_RAISE_EXCEPTION, ITER_RAISE_EXCEPTION, SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS
 from pyquibbler.utilities.iterators import recursively_run_func_on_object
 from pyquibbler.utilities.unpacker import Unpacker
-from pyquibbler.quib.variable_metadata import get_quib_name
+from pyquibbler.quib.variable_metadata import get_quib_name, get_var_name_of_call_site, CallSite
 
 # get_value:
-from pyquibbler.quib.external_call_failed_exception_handling import raise_quib_call_exceptions_as_own
+from pyquibbler.quib.external_call_failed_exception_handling import raise_quib_call_exceptions_as_own, \
+    ExternalCallFailedException
 from pyquibbler.quib.get_value_context_manager import get_value_context, is_within_get_value_context
+from pyquibbler.quib.async_evaluation import run_quib_evaluation_async
+from pyquibbler.quib.evaluation_threads import are_evaluation_threads_started, EVALUATION_LOCK_CREATION_LOCK
+from pyquibbler.quib.evaluation_cancellation import raise_if_evaluation_cancelled, EvaluationCancelledException
+from pyquibbler.quib.invalidation_verification import deferred_invalidation_verification, PendingVerification, \
+    add_pending_verification, is_verification_pending_at_path
 from pyquibbler.quib.quib_guard import guard_raise_if_not_allowed_access_to_quib, \
     CannotAccessQuibInScopeException
+from pyquibbler.quib.graph_traversal import get_graph_version, on_graph_edges_change, iter_reachable_quibs, \
+    iter_quibs_bypassing_intermediate, get_topological_order
 from pyquibbler.function_definitions import get_definition_for_function, FuncArgsKwargs
 
 # Cache:
-from pyquibbler.cache import create_cache, CacheStatus
+from pyquibbler.cache import create_cache, CacheStatus, get_uncached_paths_matching_path
 from pyquibbler.quib.func_calling.cache_mode import CacheMode
 
 # Translations and inversion:
 from pyquibbler.utilities.multiple_instance_runner import NoRunnerWorkedException
 from pyquibbler.path_translation.translate import forwards_translate
-from pyquibbler.path import FailedToDeepAssignException, PathComponent, Path, Paths
+from pyquibbler.path import FailedToDeepAssignException, PathComponent, Path, Paths, deep_get
 from pyquibbler.path_translation.create_source_func_call import get_func_call_for_translation
 from pyquibbler.inversion.invert import invert
 
@@ -87,6 +98,9 @@ if TYPE_CHECKING:
 
 NoneType = type(None)
 
+# Shared by all quibs without children
+NO_QUIBS: FrozenSet[Quib] = frozenset()
+
 
 class QuibHandler:
     """
@@ -95,8 +109,18 @@ class QuibHandler:
     Allows the Quib class to only have user functions.
 
     All data is stored on the QuibHandler (the Quib itself is state-less).
+
+    To keep the memory footprint of large networks small, attributes are stored in slots, and auxiliary containers
+    (children, callbacks, override choices, file syncer) are only created once needed.
     """
 
+    __slots__ = ('_quib_ref', '_override_choice_cache', 'quib_function_call', 'assignment_template',
+                 '_assigned_name', '_assigned_name_call_site', '_children', '_overrider', '_file_syncer',
+                 'allow_overriding', 'assigned_quibs', 'created_in_get_value_context', 'created_in',
+                 'graphics_update', 'save_directory', 'save_format', 'func_args_kwargs', 'func_definition',
+                 'cache_mode', 'verify_invalidation', '_has_ever_called_get_value', '_evaluation_lock', '_widget',
+                 '_callbacks', '_ancestors_index', '_depth', '__dict__')
+
     def __init__(self, quib: Quib, quib_function_call: QuibFuncCall,
                  assignment_template: Optional[AssignmentTemplate],
                  allow_overriding: bool,
@@ -110,20 +134,22 @@ class QuibHandler:
                  kwargs: Kwargs = None,
                  func_definition: FuncDefinition = None,
                  cache_mode: CacheMode = None,
-                 has_ever_called_get_value: bool = False
+                 has_ever_called_get_value: bool = False,
+                 verify_invalidation: Optional[bool] = None,
                  ):
         kwargs = kwargs or {}
 
         quib_ref = weakref.ref(quib)
         self._quib_ref = quib_ref
-        self._override_choice_cache = {}
+        self._override_choice_cache: Optional[Dict[ChoiceContext, OverrideChoice]] = None
         self.quib_function_call = quib_function_call
 
         self.assignment_template = assignment_template
-        self.assigned_name = assigned_name
-        self.children: weakref.WeakSet[Quib] = weakref.WeakSet()
+        self._assigned_name = assigned_name
+        self._assigned_name_call_site: Optional[CallSite] = None
+        self._children: Optional[weakref.WeakSet[Quib]] = None
         self._overrider: Optional[Overrider] = None
-        self.file_syncer: QuibFileSyncer = QuibFileSyncer(quib_ref)
+        self._file_syncer: Optional[QuibFileSyncer] = None
         self.allow_overriding = allow_overriding
         self.assigned_quibs: Optional[Set[Quib]] = None
         self.created_in_get_value_context = is_within_get_value_context()
@@ -137,10 +163,47 @@ class QuibHandler:
         self.func_definition = func_definition
 
         self.cache_mode = cache_mode
+        self.verify_invalidation = verify_invalidation
 
         self._has_ever_called_get_value = has_ever_called_get_value
+        self._evaluation_lock: Optional[threading.RLock] = None
         self._widget: Optional[QuibWidget] = None
-        self.callbacks: Set[Callable] = set()
+        self._callbacks: Optional[Set[Callable]] = None
+        self._ancestors_index: Optional[Tuple[int, FrozenSet[Quib]]] = None
+        self._depth: Optional[int] = None
+
+    """
+    name
+    """
+
+    @property
+    def assigned_name(self) -> Optional[str]:
+        if self._assigned_name_call_site is not None:
+            call_site, self._assigned_name_call_site = self._assigned_name_call_site, None
+            self._assigned_name = get_var_name_of_call_site(call_site)
+        return self._assigned_name
+
+    @assigned_name.setter
+    def assigned_name(self, assigned_name: Optional[str]):
+        had_name = self.may_have_assigned_name
+        self._assigned_name_call_site = None
+        self._assigned_name = assigned_name
+        if had_name or assigned_name is not None:
+            self.project.on_quib_name_change(self.quib)
+
+    def set_lazy_assigned_name(self, call_site: CallSite):
+        """
+        Set the assigned_name to be the name of the variable assigned at the given call site, once first needed.
+        """
+        self._assigned_name_call_site = call_site
+        self.project.on_quib_name_change(self.quib)
+
+    @property
+    def may_have_assigned_name(self) -> bool:
+        """
+        Whether the quib has an assigned_name, or a pending name (without resolving it)
+        """
+        return self._assigned_name is not None or self._assigned_name_call_site is not None
 
     """
     relationships
@@ -158,22 +221,33 @@ class QuibHandler:
     def parents(self) -> List[Quib]:
         return self.quib_function_call.get_data_sources() + self.quib_function_call.get_parameter_sources()
 
+    @property
+    def children(self) -> Union[weakref.WeakSet[Quib], FrozenSet[Quib]]:
+        return self._children if self._children is not None else NO_QUIBS
+
     def add_child(self, quib: Quib) -> None:
         """
         Add the given quib to the list of quibs that are dependent on this quib.
         """
-        self.children.add(quib)
+        if self._children is None:
+            self._children = weakref.WeakSet()
+        self._children.add(quib)
 
     def remove_child(self, quib_to_remove: Quib):
         """
         Removes a child from the quib, no longer sending invalidations to it
         """
-        self.children.remove(quib_to_remove)
+        if self._children is None:
+            raise KeyError(quib_to_remove)
+        self._children.remove(quib_to_remove)
 
     def connect_to_parents(self):
         """
         Connect the quib to its parents
         """
+        if self._children:
+            # A new quib has no descendants whose ancestors could change
+            on_graph_edges_change()
         for parent in self.parents:
             parent.handler.add_child(self.quib)
 
@@ -181,9 +255,50 @@ class QuibHandler:
         """
         Disconnect the quib from its parents, so that the quib is effectively inactivated
         """
+        if self._children:
+            # A quib without children is not an ancestor of any other quib
+            on_graph_edges_change()
         for parent in self.parents:
             parent.handler.remove_child(self.quib)
 
+    def get_ancestors_index(self) -> FrozenSet[Quib]:
+        """
+        Get the set of all the quibs upstream of the quib.
+        The set is cached on this quib only (not on its ancestors, so that retained memory stays linear in the
+        number of quibs indexed), and recalculated after the edges of the quib graph change.
+        """
+        graph_version = get_graph_version()
+        if self._ancestors_index is None or self._ancestors_index[0] != graph_version:
+            ancestors = frozenset(iter_reachable_quibs([self.quib], lambda quib: quib.handler.parents))
+            self._ancestors_index = graph_version, ancestors
+        return self._ancestors_index[1]
+
+    def get_depth(self) -> int:
+        """
+        Get the length of the longest path from the quib up to its root ancestors.
+        A quib is deeper than all its ancestors. As the parents of a quib do not change, and disconnecting only removes
+        ancestors, the depth is calculated only once.
+        """
+        if self._depth is None:
+            uncalculated_quibs = get_topological_order(
+                [self.quib], lambda quib: [parent for parent in quib.handler.parents if parent.handler._depth is None])
+            for quib in uncalculated_quibs:
+                quib.handler._depth = 1 + max((parent.handler._depth for parent in quib.handler.parents), default=-1)
+        return self._depth
+
+    def _get_evaluation_lock(self):
+        """
+        Quibs are only locked while evaluated once worker threads may evaluate them too (parallel or async evaluation).
+        The lock of each quib is then created upon its first evaluation.
+        """
+        if not are_evaluation_threads_started():
+            return nullcontext()
+        if self._evaluation_lock is None:
+            with EVALUATION_LOCK_CREATION_LOCK:
+                if self._evaluation_lock is None:
+                    self._evaluation_lock = threading.RLock()
+        return self._evaluation_lock
+
     @property
     def is_iquib(self):
         return getattr(self.func_args_kwargs.func, '__name__', None) == 'iquib'
@@ -196,12 +311,25 @@ class QuibHandler:
     def actual_graphics_update(self):
         return self.graphics_update or self.project.graphics_update
 
+    @property
+    def actual_verify_invalidation(self) -> bool:
+        return self.project.verify_invalidation if self.verify_invalidation is None else self.verify_invalidation
+
+    @property
+    def callbacks(self) -> Set[Callable]:
+        if self._callbacks is None:
+            self._callbacks = set()
+        return self._callbacks
+
+    def has_callbacks(self) -> bool:
+        return bool(self._callbacks)
+
     def reevaluate_graphic_quib(self):
         """
         Reevaluate the quib and call any assigned callbacks after its value has been invalidated
         """
         value = self.quib.get_value()
-        for callback in self.callbacks:
+        for callback in self._callbacks or ():
             callback(value)
 
     def _iter_artist_lists(self) -> Iterable[List[Artist]]:
@@ -210,6 +338,9 @@ class QuibHandler:
     def _iter_artists(self) -> Iterable[Artist]:
         return (artist for artists in self._iter_artist_lists() for artist in artists)
 
+    def get_artists(self) -> List[Artist]:
+        return list(self._iter_artists())
+
     def get_figures(self):
         return {artist.figure for artist in self._iter_artists()}
 
@@ -256,20 +387,87 @@ class QuibHandler:
         """
         Change this quib's state according to a change in a dependency.
         """
-        for child in set(self.children):  # We copy of the set because children can change size during iteration
+        with deferred_invalidation_verification():
+            for child in set(self.children):  # We copy of the set because children can change size during iteration
 
-            child.handler._invalidate_quib_with_children_at_path(self.quib, path)
+                child.handler._invalidate_quib_with_children_at_path(self.quib, path)
 
     def _invalidate_quib_with_children_at_path(self, invalidator_quib: Quib, path: Path):
         """
         Invalidate a quib and it's children at a given path.
         """
+        self.quib_function_call.on_parent_invalidated_at_path(invalidator_quib, path)
         new_paths = self._get_paths_for_children_invalidation(invalidator_quib, path)
         for new_path in new_paths:
             if new_path is not None:
-                self.invalidate_self(new_path)
-                if len(path) == 0 or len(self._get_list_of_not_overridden_paths_at_first_component(new_path)) > 0:
-                    self._invalidate_children_at_path(new_path)
+                is_full_invalidation = len(path) == 0
+                if self.actual_verify_invalidation and not self.quib.is_graphics_quib:
+                    if self._invalidate_self_and_verify_later_at_path(new_path, is_full_invalidation):
+                        continue
+                else:
+                    self.invalidate_self(new_path)
+                self._invalidate_children_at_path_unless_overridden(new_path, is_full_invalidation)
+
+    def _invalidate_children_at_path_unless_overridden(self, path: Path, is_full_invalidation: bool):
+        if is_full_invalidation or len(self._get_list_of_not_overridden_paths_at_first_component(path)) > 0:
+            self._invalidate_children_at_path(path)
+
+    def _get_copy_of_cached_value_at_path(self, path: Path) -> Any:
+        """
+        Return a copy of the cached function result at the given path, or `missing` if not fully cached at the path,
+        or if the value cannot be copied.
+        """
+        cache = self.quib_function_call.cache
+        if cache is None or len(get_uncached_paths_matching_path(cache, path)) > 0:
+            return missing
+        value = deep_get(cache.get_value(), path)
+        try:
+            return copy.deepcopy(value)
+        except (TypeError, copy.Error):
+            return missing
+
+    def _invalidate_self_and_verify_later_at_path(self, path: Path, is_full_invalidation: bool) -> bool:
+        """
+        Invalidate the quib at the given path, deferring the invalidation of its children until the quib is verified,
+        once the invalidation pass is over (see `deferred_invalidation_verification`).
+        Returns False if the quib cannot be verified (its old value is unknown), and its children should be
+        invalidated right away.
+        """
+        old_value = self._get_copy_of_cached_value_at_path(path)
+        self.invalidate_self(path)
+        if old_value is missing:
+            # A verification pending at the same path already holds the old value
+            return is_verification_pending_at_path(self.quib, path)
+
+        add_pending_verification(self.quib, PendingVerification(path, old_value, is_full_invalidation))
+        return True
+
+    def verify_invalidation_and_invalidate_children(self, verifications: List[PendingVerification]):
+        """
+        Recalculate the quib at the paths of the pending verifications, and invalidate the children only at paths
+        where the value has changed (early cutoff).
+        """
+        for verification in verifications:
+            if self._is_changed_at_path(verification.path, verification.old_value):
+                self._invalidate_children_at_path_unless_overridden(verification.path,
+                                                                    verification.is_full_invalidation)
+
+    def _is_changed_at_path(self, path: Path, old_value: Any) -> bool:
+        """
+        Recalculate the quib at the given path, and compare with the old value.
+        Returns False only if the recalculated value is known to be the same as the old one.
+        """
+        try:
+            with SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS.temporary_set(True):
+                self.get_value_valid_at_path(path)
+        except (ExternalCallFailedException, EvaluationCancelledException):
+            # We cannot verify. Invalidate downstream, so that any exception is raised upon get_value
+            return True
+
+        cache = self.quib_function_call.cache
+        if cache is None or len(get_uncached_paths_matching_path(cache, path)) > 0:
+            return True
+        return not recursively_compare_objects(old_value, deep_get(cache.get_value(), path))
 
     def _forward_translate_with_retrieving_metadata(self, invalidator_quib: Quib, path: Path) -> Paths:
         func_call, sources_to_quibs = get_func_call_for_translation(self.quib_function_call, with_meta_data=None)
@@ -339,6 +537,7 @@ class QuibHandler:
     def overrider(self) -> Overrider:
         if self._overrider is None:
             self._overrider = Overrider()
+            self.project.on_quib_overrider_creation(self.quib)
         return self._overrider
 
     @property
@@ -448,13 +647,15 @@ class QuibHandler:
         """
         Store a user override choice in the cache for future use.
         """
+        if self._override_choice_cache is None:
+            self._override_choice_cache = {}
         self._override_choice_cache[context] = choice
 
     def try_load_override_choice(self, context: ChoiceContext) -> Optional[OverrideChoice]:
         """
         If a choice fitting the current options has been cached, return it. Otherwise return None.
         """
-        return self._override_choice_cache.get(context)
+        return self._override_choice_cache.get(context) if self._override_choice_cache is not None else None
 
     @staticmethod
     def _apply_assignment_to_cache(original_value, cache, assignment):
@@ -521,7 +722,9 @@ class QuibHandler:
         except CannotAccessQuibInScopeException:
             raise
 
-        with get_value_context(self.quib.pass_quibs):
+        raise_if_evaluation_cancelled()
+
+        with get_value_context(self.quib.pass_quibs), self._get_evaluation_lock():
             if not self._has_ever_called_get_value and Project.get_or_create().autoload_upon_first_get_value:
                 self.quib.load(ResponseToFileNotDefined.IGNORE)
 
@@ -545,10 +748,18 @@ class QuibHandler:
 
     def on_project_directory_change(self):
         if not (self.save_directory is not None and self.save_directory.is_absolute()):
-            self.file_syncer.on_file_name_changed()
+            self.on_file_name_change()
+
+    @property
+    def file_syncer(self) -> QuibFileSyncer:
+        if self._file_syncer is None:
+            self._file_syncer = QuibFileSyncer(self._quib_ref)
+        return self._file_syncer
 
     def on_file_name_change(self):
-        self.file_syncer.on_file_name_changed()
+        # A file syncer not yet created has no file metadata to reset
+        if self._file_syncer is not None:
+            self._file_syncer.on_file_name_changed()
 
     def save_assignments_or_value(self, file_path: pathlib.Path):
         if self.actual_save_format is SaveFormat.OFF:
@@ -557,6 +768,8 @@ class QuibHandler:
             self.overrider.save_as_binary(file_path)
         if self.actual_save_format is SaveFormat.TXT:
             self.overrider.save_as_txt(file_path)
+        if self.actual_save_format is SaveFormat.NPZ:
+            self.overrider.save_as_npz(file_path)
 
     def load_from_assignment_file_or_value_file(self, file_path: pathlib.Path):
         if self.actual_save_format is SaveFormat.OFF:
@@ -565,6 +778,8 @@ class QuibHandler:
             changed_paths = self.overrider.load_from_binary(file_path)
         elif self.actual_save_format is SaveFormat.TXT:
             changed_paths = self.overrider.load_from_txt(file_path)
+        elif self.actual_save_format is SaveFormat.NPZ:
+            changed_paths = self.overrider.load_from_npz(file_path)
         else:
             assert False
 
@@ -623,6 +838,8 @@ class Quib:
     A Quib represents the output of a call to a specific function with specific arguments.
     """
 
+    __slots__ = ('handler', '__weakref__', '__dict__')
+
     def __init__(self,
                  quib_function_call: QuibFuncCall = None,
                  assignment_template: Optional[AssignmentTemplate] = None,
@@ -887,6 +1104,51 @@ class Quib:
         if self.handler.quib_function_call:
             self.handler.quib_function_call.cache_mode = self.handler.cache_mode
 
+    @property
+    def verify_invalidation(self) -> Optional[bool]:
+        """
+        bool or None: Indicates whether the quib verifies that its value changed before invalidating downstream quibs.
+
+        ``True`` : Upon upstream changes, the quib recalculates its value at the invalidated paths and compares it
+        with its previously cached value. Downstream quibs are only invalidated if the value has actually changed
+        (early cutoff).
+
+        ``False`` : Upon upstream changes, downstream quibs are invalidated without recalculating the quib.
+
+        ``None`` : Yield to the project's `verify_invalidation` (default).
+
+        Verification is useful for quibs whose value is often unchanged by upstream changes (like clipping,
+        rounding or thresholding), and which feed heavy downstream calculations or graphics.
+
+        See Also
+        --------
+        actual_verify_invalidation, Project.verify_invalidation, cache_mode
+
+        Notes
+        -----
+        Verification requires the quib to cache its value. It is not applied to graphics quibs.
+        """
+        return self.handler.verify_invalidation
+
+    @verify_invalidation.setter
+    @validate_user_input(verify_invalidation=(NoneType, bool))
+    def verify_invalidation(self, verify_invalidation: Optional[bool]):
+        self.handler.verify_invalidation = verify_invalidation
+
+    @property
+    def actual_verify_invalidation(self) -> bool:
+        """
+        bool: Indicates whether the quib actually verifies its value changed before invalidating downstream quibs.
+
+        The quib's ``actual_verify_invalidation`` is its ``verify_invalidation`` if not ``None``.
+        Otherwise, it defaults to the project's ``verify_invalidation``.
+
+        See Also
+        --------
+        verify_invalidation, Project.verify_invalidation
+        """
+        return self.handler.actual_verify_invalidation
+
     def invalidate(self):
         """
         Invalidate the quib value.
@@ -944,7 +1206,7 @@ class Quib:
         """
         return self.handler.quib_function_call.func_can_create_graphics \
             and not self.handler.created_in_get_value_context \
-            or len(self.handler.callbacks) > 0
+            or self.handler.has_callbacks()
 
     @property
     def graphics_update(self) -> Optional[GraphicsUpdateType]:
@@ -977,7 +1239,10 @@ class Quib:
     @graphics_update.setter
     @validate_user_input(graphics_update=(NoneType, str, GraphicsUpdateType))
     def graphics_update(self, graphics_update: Union[None, str, GraphicsUpdateType]):
+        was_central = self.handler.graphics_update is GraphicsUpdateType.CENTRAL
         self.handler.graphics_update = get_enum_by_str(GraphicsUpdateType, graphics_update, allow_none=True)
+        if was_central or self.handler.graphics_update is GraphicsUpdateType.CENTRAL:
+            self.project.on_quib_graphics_update_change(self)
 
     @property
     def actual_graphics_update(self):
@@ -1217,6 +1482,7 @@ class Quib:
              name: Union[None, str] = missing,
              graphics_update: Union[None, str] = missing,
              assigned_quibs: Optional[Set[Quib]] = missing,
+             verify_invalidation: Optional[bool] = missing,
              ) -> Quib:
         """
         Set one or more properties on a quib.
@@ -1235,7 +1501,7 @@ class Quib:
         save_directory : str or pathlib.Path, optional
             The directory to which quib assignments are saved.
 
-        save_format : {None, 'off', 'txt', 'bin'} or SaveFormat, optional
+        save_format : {None, 'off', 'txt', 'bin', 'npz'} or SaveFormat, optional
             The file format for saving quib assignments.
 
         cache_mode : {'auto', 'on', 'off'} or CacheMode, optional
@@ -1250,6 +1516,9 @@ class Quib:
         graphics_update : {None, 'drag', 'drop', 'central', 'never'} or GraphicsUpdateType, optional
             For graphics quibs, indicates when they should be refreshed.
 
+        verify_invalidation : None or bool, optional
+            Indicates whether to verify that the quib value changed before invalidating downstream quibs.
+
         Returns
         -------
         quib: Quib
@@ -1258,7 +1527,7 @@ class Quib:
         See Also
         --------
         allow_overriding, assigned_quibs, assignment_template, save_directory, save_format
-        cache_mode, assigned_name, name, graphics_update
+        cache_mode, assigned_name, name, graphics_update, verify_invalidation
 
 
         Examples
@@ -1267,7 +1536,8 @@ class Quib:
         """
 
         for attr_name in ['allow_overriding', 'save_directory', 'save_format',
-                          'cache_mode', 'assigned_name', 'name', 'graphics_update', 'assigned_quibs']:
+                          'cache_mode', 'assigned_name', 'name', 'graphics_update', 'assigned_quibs',
+                          'verify_invalidation']:
             value = eval(attr_name)
             if value is not missing:
                 setattr(self, attr_name, value)
@@ -1428,6 +1698,58 @@ class Quib:
         """
         return self.handler.get_value_valid_at_path([])
 
+    async def get_value_async(self) -> Any:
+        """
+        Calculate the entire value of the quib, without blocking the event loop.
+
+        Awaitable version of ``get_value``. The calculation runs in a worker thread, keeping the
+        event loop (for example, a Jupyter kernel) free to process widget and other events.
+        Graphics redraws and quib callbacks triggered during the calculation are scheduled back on the loop.
+
+        Quibs whose function may create graphics are calculated on the loop thread, as matplotlib is not
+        thread-safe.
+
+        Returns
+        -------
+        any
+            The result of the function of the quib.
+
+        See Also
+        --------
+        get_value, get_value_valid_at_path_async, Project.evaluate_many_async
+
+        Examples
+        --------
+        >>> a = iquib(3)
+        >>> b = a ** 2
+        >>> await b.get_value_async()
+        9
+        """
+        return await run_quib_evaluation_async(self, self.get_value)
+
+    async def get_value_valid_at_path_async(self, path: Union[None, Path, List[Any]]) -> Any:
+        """
+        Get the value of the quib, calculated only for a requested path, without blocking the event loop.
+
+        Awaitable version of ``get_value_valid_at_path``.
+
+        Parameters
+        ----------
+        path: list of components, or None
+            The path at which the returned value should be valid (see ``get_value_valid_at_path``).
+
+        Returns
+        -------
+        value: any
+            a value with the same shape as the real value of the quib, but guaranteed to be valid
+            only at the specified `path`.
+
+        See Also
+        --------
+        get_value_valid_at_path, get_value_async
+        """
+        return await run_quib_evaluation_async(self, self.get_value_valid_at_path, path)
+
     @raise_quib_call_exceptions_as_own
     def get_type(self) -> Type:
         """
@@ -1662,13 +1984,7 @@ class Quib:
         if not bypass_intermediate_quibs:
             return children
 
-        named_children = set()
-        for child in children:
-            if child.assigned_name is None and not child.is_graphics_quib:
-                named_children |= child.get_children(bypass_intermediate_quibs)
-            else:
-                named_children.add(child)
-        return named_children
+        return set(iter_quibs_bypassing_intermediate(children, lambda quib: quib.handler.children))
 
     @validate_user_input(bypass_intermediate_quibs=bool, depth=(NoneType, int))
     def get_descendants(self, bypass_intermediate_quibs: bool = False, depth: Optional[int] = None) -> Set[Quib]:
@@ -1709,13 +2025,47 @@ class Quib:
         >>> a.get_descendants(True)
         {b = a + 1, c = (a + 2) * b, d = b * (c + 1)}
         """
-        descendants = set()
-        if depth is None or depth > 0:
-            for child in self.get_children(bypass_intermediate_quibs):
-                descendants.add(child)
-                descendants |= child.get_descendants(bypass_intermediate_quibs,
-                                                     depth if depth is None else depth - 1)
-        return descendants
+        return set(self.iter_descendants(bypass_intermediate_quibs, depth))
+
+    @validate_user_input(bypass_intermediate_quibs=bool, depth=(NoneType, int))
+    def iter_descendants(self, bypass_intermediate_quibs: bool = False, depth: Optional[int] = None
+                         ) -> Iterator[Quib]:
+        """
+        Iterate over the quibs downstream of current quib, nearest first.
+
+        Like `get_descendants`, but yields the descendant quibs one by one, breadth first, so that the search
+        can be stopped early.
+
+        Parameters
+        ----------
+        bypass_intermediate_quibs : bool, default: False
+            Indicates whether to bypass intermediate quibs.
+            Intermediate quibs are defined as unnamed and non-graphics
+            quibs (``assigned_name=None`` and ``is_graphics=False``), typically representing
+            intermediate calculations.
+
+        depth : int or None
+            Depth of search, `0` yields nothing, `1` yields the children, etc.
+            `None` for infinite (default).
+
+        Returns
+        -------
+        Iterator of Quib
+            The descendant quibs, each yielded once
+
+        See Also
+        --------
+        get_descendants, iter_ancestors
+
+        Examples
+        --------
+        >>> a = iquib(1)
+        >>> b = a + 1
+        >>> c = 2 * b
+        >>> list(a.iter_descendants())
+        [b = a + 1, c = 2 * b]
+        """
+        return iter_reachable_quibs([self], lambda quib: quib.get_children(bypass_intermediate_quibs), depth)
 
     @validate_user_input(bypass_intermediate_quibs=bool, is_data_source=(NoneType, bool))
     def get_parents(self, bypass_intermediate_quibs: bool = False, is_data_source: Optional[bool] = None) -> Set[Quib]:
@@ -1767,13 +2117,7 @@ class Quib:
         if not bypass_intermediate_quibs:
             return parents
 
-        named_parents = set()
-        for parent in parents:
-            if parent.assigned_name is None and not parent.is_graphics_quib:
-                named_parents |= parent.get_parents(bypass_intermediate_quibs)
-            else:
-                named_parents.add(parent)
-        return named_parents
+        return set(iter_quibs_bypassing_intermediate(parents, lambda quib: quib.handler.parents))
 
     @validate_user_input(bypass_intermediate_quibs=bool, depth=(NoneType, int))
     def get_ancestors(self, bypass_intermediate_quibs: bool = False, depth: Optional[int] = None) -> Set[Quib]:
@@ -1813,13 +2157,47 @@ class Quib:
         >>> c.get_ancestors(True)
         {a = iquib(1), b = iquib(3)}
         """
-        ancestors = set()
-        if depth is None or depth > 0:
-            for parent in self.get_parents(bypass_intermediate_quibs):
-                ancestors.add(parent)
-                ancestors |= parent.get_ancestors(bypass_intermediate_quibs,
-                                                  depth if depth is None else depth - 1)
-        return ancestors
+        return set(self.iter_ancestors(bypass_intermediate_quibs, depth))
+
+    @validate_user_input(bypass_intermediate_quibs=bool, depth=(NoneType, int))
+    def iter_ancestors(self, bypass_intermediate_quibs: bool = False, depth: Optional[int] = None) -> Iterator[Quib]:
+        """
+        Iterate over the quibs upstream of current quib, nearest first.
+
+        Like `get_ancestors`, but yields the ancestor quibs one by one, breadth first, so that the search
+        can be stopped early.
+
+        Parameters
+        ----------
+        bypass_intermediate_quibs : bool, default: False
+            Indicates whether to bypass intermediate quibs.
+            Intermediate quibs are defined as unnamed and non-graphics
+            quibs (``assigned_name=None`` and ``is_graphics=False``), typically representing
+            intermediate calculations.
+
+        depth : int or None
+            Depth of search, `0` yields nothing, `1` yields the parents, etc.
+            `None` for infinite (default).
+
+        Returns
+        -------
+        Iterator of Quib
+            The ancestor quibs, each yielded once
+
+        See Also
+        --------
+        get_ancestors, iter_descendants
+
+        Examples
+        --------
+        >>> a = iquib(1)
+        >>> b = a + 1
+        >>> c = 2 * b
+        >>> list(c.iter_ancestors())
+        [b = a + 1, a = iquib(1)]
+        """
+        return iter_reachable_quibs([self], lambda quib: quib.get_parents(bypass_intermediate_quibs), depth)
+
     """
     File saving
     """
@@ -1849,6 +2227,8 @@ class Quib:
 
         ``'bin'`` - save overriding assignments as a binary file (extension '.quib').
 
+        ``'npz'`` - save overriding assignments as a NumPy npz file, with arrays stored natively (extension '.npz').
+
         ``'off'`` - do not save overriding assignments of this quib.
 
         ``None`` - yield to the Project save_format (default).
@@ -27,15 +27,16 @@ class QuibGuard:
 
     def __init__(self, quibs_allowed: Set):
         self._quibs_allowed = set(quibs_allowed)
-        for quib in quibs_allowed:
-            self._quibs_allowed.update(quib.get_ancestors())
+        # The cached ancestors of each allowed quib are checked as is, rather than merged into a new set
+        self._ancestors_of_quibs_allowed = [quib.handler.get_ancestors_index() for quib in quibs_allowed]
 
     def __enter__(self):
         self._QUIB_GUARDS.append(self)
         return self
 
     def raise_if_not_allowed_access_to_quib(self, quib):
-        if quib not in self._quibs_allowed:
+        if quib not in self._quibs_allowed \
+                and not any(quib in ancestors for ancestors in self._ancestors_of_quibs_allowed):
             raise CannotAccessQuibInScopeException(quib)
 
     def add_allowed_quib(self, quib: Quib):
@@ -14,7 +14,7 @@ HEADER_TO_PROPERTIES = (
     ('Arguments', ('args', 'kwargs')),
     ('File saving', (('save_format', 'actual_save_format'), 'file_path')),
     ('Assignments', ('assignment_template', 'allow_overriding', 'assigned_quibs')),
-    ('Caching', ('cache_mode', 'cache_status')),
+    ('Caching', ('cache_mode', 'cache_status', ('verify_invalidation', 'actual_verify_invalidation'))),
     ('Graphics', (('graphics_update', 'actual_graphics_update'), 'is_graphics_quib')),
 )
 
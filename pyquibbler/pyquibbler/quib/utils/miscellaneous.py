@@ -1,6 +1,8 @@
 from copy import copy
 from typing import Any, Optional
 
+import numpy as np
+
 from pyquibbler.env import DEBUG
 from pyquibbler.utilities.iterators import is_iterator_empty, recursively_run_func_on_object, \
     SHALLOW_MAX_LENGTH, SHALLOW_MAX_DEPTH
@@ -23,7 +25,23 @@ def is_there_a_quib_in_args(args, kwargs):
     return not is_iterator_empty(iter_quibs_in_args(args, kwargs))
 
 
-def deep_copy_without_quibs_or_graphics(obj: Any, max_depth: Optional[int] = None, max_length: Optional[int] = None):
+def get_read_only_view(array: np.ndarray) -> np.ndarray:
+    """
+    Returns a read-only view of the array, sharing its data without copying.
+    Writing into the view raises an exception; setters of pyquibbler (see `deep_set`) copy read-only arrays before
+    writing into them.
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def deep_copy_without_quibs_or_graphics(obj: Any, max_depth: Optional[int] = None, max_length: Optional[int] = None,
+                                        zero_copy_arrays: bool = False):
+    """
+    Copy `obj`, keeping quibs, graphics and callables as is.
+    With `zero_copy_arrays`, numpy arrays are not copied, but are kept as read-only views.
+    """
     from matplotlib.artist import Artist
     from matplotlib.widgets import AxesWidget
     from pyquibbler.quib.quib import Quib
@@ -31,6 +49,8 @@ def deep_copy_without_quibs_or_graphics(obj: Any, max_depth: Optional[int] = Non
     def copy_if_not_quib_or_artist(o):
         if isinstance(o, (Quib, Artist, AxesWidget)) or callable(o):
             return o
+        if zero_copy_arrays and type(o) is np.ndarray:
+            return get_read_only_view(o)
         return copy(o)
 
     return recursively_run_func_on_object(func=copy_if_not_quib_or_artist, max_length=max_length,
@@ -1,8 +1,15 @@
 import ast
+import contextlib
+import functools
+import os
+import sys
+import sysconfig
+import weakref
 from dataclasses import dataclass
-from typing import Optional
+from types import CodeType, FrameType
+from typing import Optional, Tuple, Dict, Union
 
-from varname.utils import ASSIGN_TYPES, get_node, node_name, AssignType
+from varname.utils import ASSIGN_TYPES, get_node_by_frame, node_name, AssignType
 
 from pyquibbler.env import GET_VARIABLE_NAMES, SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS
 from pyquibbler.debug_utils.logger import logger
@@ -11,6 +18,14 @@ from .types import FileAndLineNumber
 
 AST_ASSIGNMENTS_TO_VAR_NAME_STATES = {}
 
+# Frames of these packages are not where quibs are being set:
+IGNORED_PACKAGES = ('pyquibbler', 'matplotlib', 'varname')
+
+STDLIB_DIRECTORY = os.path.join(sysconfig.get_path('stdlib'), '')
+SITE_PACKAGES_DIRECTORY = os.path.join(STDLIB_DIRECTORY, 'site-packages', '')
+
+IS_IN_FAST_QUIB_CREATION_MODE = False
+
 
 @dataclass
 class VarNameState:
@@ -18,6 +33,73 @@ class VarNameState:
     current_var_count: int
 
 
+@dataclass(frozen=True)
+class CallSiteAssignment:
+    """
+    The assignment statement in which a call creating quibs is made (eg `a, b = iquib(1), iquib(2)`)
+    """
+    node: AssignType
+    names: Tuple[str, ...]
+
+    # The position of the call within the assigned tuple, if the call is an element of the tuple
+    index_in_tuple: Optional[int]
+
+
+@dataclass(frozen=True)
+class CallSite:
+    """
+    A snapshot of the frame in which a quib was created, allowing the variable name of the quib to be found after
+    the frame is gone.
+    Holds the frame attributes used for finding the executing AST node.
+    """
+    f_code: CodeType
+    f_lasti: int
+    f_lineno: int
+    f_globals: dict
+
+    @classmethod
+    def from_frame(cls, frame: FrameType):
+        return cls(frame.f_code, frame.f_lasti, frame.f_lineno, frame.f_globals)
+
+
+FrameOrCallSite = Union[FrameType, CallSite]
+
+# Whether the frames of a code object are ignored when looking for the frame in which a quib is created
+CODES_TO_IS_IGNORED: weakref.WeakKeyDictionary[CodeType, bool] = weakref.WeakKeyDictionary()
+
+# The assignments of each call site, by code object and instruction offset
+CODES_TO_CALL_SITE_ASSIGNMENTS: weakref.WeakKeyDictionary[CodeType, Dict[int, Optional[CallSiteAssignment]]] = \
+    weakref.WeakKeyDictionary()
+
+
+def _is_stdlib_file(file_name: str) -> bool:
+    file_name = os.path.realpath(file_name)
+    return file_name.startswith(STDLIB_DIRECTORY) and not file_name.startswith(SITE_PACKAGES_DIRECTORY)
+
+
+def _is_frame_ignored(frame: FrameType) -> bool:
+    code = frame.f_code
+    is_ignored = CODES_TO_IS_IGNORED.get(code)
+    if is_ignored is None:
+        module_name = frame.f_globals.get('__name__') or ''
+        is_ignored = code.co_name == '<lambda>' \
+            or module_name.split('.')[0] in IGNORED_PACKAGES \
+            or _is_stdlib_file(code.co_filename)
+        CODES_TO_IS_IGNORED[code] = is_ignored
+    return is_ignored
+
+
+def get_frame_outside_of_pyquibbler() -> Optional[FrameType]:
+    """
+    Get the innermost frame which is not in pyquibbler (nor in matplotlib, the standard library, or a lambda).
+    Whether a frame is ignored is cached per code object, so that walking up the stack is cheap.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and _is_frame_ignored(frame):
+        frame = frame.f_back
+    return frame
+
+
 def find_relevant_parent_assignment_node(node: ast.AST) -> AssignType:
     """Look for an ast.Assign node in the parents"""
     if hasattr(node, 'parent'):
@@ -29,35 +111,12 @@ def find_relevant_parent_assignment_node(node: ast.AST) -> AssignType:
     return None
 
 
-def get_quib_node_being_set_outside_of_pyquibbler():
-    import pyquibbler
-    import matplotlib
-    return get_node(frame=1, ignore=[pyquibbler, matplotlib], raise_exc=False)
-
-
-def get_file_name_and_line_number_of_quib() -> Optional[FileAndLineNumber]:
-    refnode = get_quib_node_being_set_outside_of_pyquibbler()
+def _find_call_site_assignment(frame: FrameOrCallSite) -> Optional[CallSiteAssignment]:
+    refnode = get_node_by_frame(frame, raise_exc=False)
     if refnode is None:
         return None
-    frame = refnode.__frame__
-    file_name = frame.f_code.co_filename
-    line_number = frame.f_lineno
-    return FileAndLineNumber(file_name, line_number)
-
-
-def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
-    """
-    Get the current variable name being set outside of pyquibbler.
-    If none is found, return None.
-    This is not thread safe, as it keeps track_and_handle_new_graphics of the current line being accessed and which
-     variable is being set in that line (eg a, b = iquib(1), iquib(2))
-    """
-    refnode = get_quib_node_being_set_outside_of_pyquibbler()
-    if not refnode:
-        return None
     node = find_relevant_parent_assignment_node(refnode)
-
-    if not node:
+    if node is None:
         return None
 
     if isinstance(node, ast.Assign):
@@ -72,6 +131,53 @@ def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
     if not isinstance(names, tuple):
         names = (names,)
 
+    index_in_tuple = refnode.parent.elts.index(refnode) if isinstance(refnode.parent, ast.Tuple) else None
+    return CallSiteAssignment(node, names, index_in_tuple)
+
+
+def get_call_site_assignment(frame: FrameOrCallSite) -> Optional[CallSiteAssignment]:
+    """
+    Get the assignment statement of the call executing in the given frame.
+    The AST lookup is done once per call site (code object and instruction), so creating quibs in a loop only
+    inspects the source code once.
+    """
+    lasti_to_assignments = CODES_TO_CALL_SITE_ASSIGNMENTS.get(frame.f_code)
+    if lasti_to_assignments is None:
+        lasti_to_assignments = CODES_TO_CALL_SITE_ASSIGNMENTS[frame.f_code] = {}
+    if frame.f_lasti not in lasti_to_assignments:
+        lasti_to_assignments[frame.f_lasti] = _find_call_site_assignment(frame)
+    return lasti_to_assignments[frame.f_lasti]
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_file_and_line_number(file_name: str, line_number: int) -> FileAndLineNumber:
+    # Shared by all the quibs created in the same line
+    return FileAndLineNumber(file_name, line_number)
+
+
+def get_file_name_and_line_number_of_quib() -> Optional[FileAndLineNumber]:
+    frame = get_frame_outside_of_pyquibbler()
+    if frame is None:
+        return None
+    return _get_file_and_line_number(frame.f_code.co_filename, frame.f_lineno)
+
+
+def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
+    """
+    Get the current variable name being set outside of pyquibbler.
+    If none is found, return None.
+    This is not thread safe, as it keeps track_and_handle_new_graphics of the current line being accessed and which
+     variable is being set in that line (eg a, b = iquib(1), iquib(2))
+    """
+    frame = get_frame_outside_of_pyquibbler()
+    if frame is None:
+        return None
+    assignment = get_call_site_assignment(frame)
+    if assignment is None:
+        return None
+
+    node = assignment.node
+    names = assignment.names
     AST_ASSIGNMENTS_TO_VAR_NAME_STATES.setdefault(node, VarNameState(current_var_count=0, total_var_count=len(names)))
     var_name_state = AST_ASSIGNMENTS_TO_VAR_NAME_STATES.get(node)
     current_name = names[var_name_state.current_var_count]
@@ -82,12 +188,37 @@ def get_var_name_being_set_outside_of_pyquibbler() -> Optional[str]:
     return current_name
 
 
+def get_var_name_of_call_site(call_site: CallSite) -> Optional[str]:
+    """
+    Get the variable name being set at a recorded call site.
+    Unlike get_var_name_being_set_outside_of_pyquibbler, the name is not determined by counting the quibs created
+    in the line, but by the position of the call within the assigned tuple.
+    """
+    try:
+        assignment = get_call_site_assignment(call_site)
+    except Exception as e:
+        logger.warning(f"Failed to get name, exception:\n{e}")
+        return None
+
+    if assignment is None:
+        return None
+    if len(assignment.names) == 1:
+        return assignment.names[0]
+    if assignment.index_in_tuple is not None and assignment.index_in_tuple < len(assignment.names):
+        return assignment.names[assignment.index_in_tuple]
+    return None
+
+
+def _should_get_var_name() -> bool:
+    return GET_VARIABLE_NAMES and not is_within_get_value_context()
+
+
 def get_quib_name() -> Optional[str]:
     """
     Get the quib's name- this can potentially return None
     if the context makes getting the file name and line no irrelevant
     """
-    if GET_VARIABLE_NAMES and not is_within_get_value_context():
+    if _should_get_var_name():
         try:
             return get_var_name_being_set_outside_of_pyquibbler()
         except Exception as e:
@@ -96,6 +227,19 @@ def get_quib_name() -> Optional[str]:
     return None
 
 
+def get_quib_name_call_site() -> Optional[CallSite]:
+    """
+    Get the call site where the quib is created, for lazily getting its name.
+    Returns None if the context makes getting the name irrelevant.
+    """
+    if _should_get_var_name():
+        frame = get_frame_outside_of_pyquibbler()
+        if frame is not None:
+            return CallSite.from_frame(frame)
+
+    return None
+
+
 def get_file_name_and_line_no() -> Optional[FileAndLineNumber]:
     """
     Get the file name and line no where the quib was created (outside of pyquibbler)- this can potentially return Nones
@@ -108,3 +252,36 @@ def get_file_name_and_line_no() -> Optional[FileAndLineNumber]:
             logger.warning(f"Failed to get file name + lineno, exception:\n{e}")
 
     return None
+
+
+def is_in_fast_quib_creation_mode() -> bool:
+    return IS_IN_FAST_QUIB_CREATION_MODE
+
+
+@contextlib.contextmanager
+def fast_quib_creation():
+    """
+    Context manager for fast creation of many quibs.
+
+    Within this context, quibs are created without looking up the name of the variable to which they are
+    assigned. Instead, the call site of each quib is recorded, and its ``assigned_name`` is only determined
+    when it is first needed (for example, upon the first ``repr`` of the quib).
+
+    See Also
+    --------
+    Quib.assigned_name
+
+    Examples
+    --------
+    >>> with fast_quib_creation():
+    ...     quibs = []
+    ...     for i in range(1000):
+    ...         quibs.append(iquib(i) + 1)
+    """
+    global IS_IN_FAST_QUIB_CREATION_MODE
+    previous = IS_IN_FAST_QUIB_CREATION_MODE
+    IS_IN_FAST_QUIB_CREATION_MODE = True
+    try:
+        yield
+    finally:
+        IS_IN_FAST_QUIB_CREATION_MODE = previous
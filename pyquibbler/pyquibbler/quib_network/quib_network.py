@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from pyquibbler.optional_packages.exceptions import MissingPackagesForFunctionException
 from typing import Union, Set, Tuple, Optional
 from pyquibbler import Quib
+from pyquibbler.quib.graph_traversal import iter_reachable_quibs
 from pyquibbler.utilities.input_validation_utils import validate_user_input, get_enum_by_str
 
 from .network_properties import NETWORK_STYLE, NETWORK_LAYOUT
@@ -90,21 +91,17 @@ def _get_quibs_connected_up_down_or_all(focal_quib: Quib,
                                         bypass_intermediate_quibs: bool,
                                         quibs: Optional[Set[Quib]] = None) -> Set[Quib]:
     """
-    Starting from a focal quib, recursively explore the quib network upstream, downstream or in all directions.
+    Starting from a focal quib, explore the quib network upstream, downstream or in all directions (breadth first).
     """
     assert direction is not Direction.BOTH
     quibs = set() if quibs is None else quibs
+    if focal_quib in quibs:
+        return quibs
+    quibs.add(focal_quib)
 
-    def _get_quibs_recursively(quib: Quib, depth_: int):
-        nonlocal quibs
-        if quib in quibs:
-            return
-        quibs.add(quib)
-        if depth_ > 0:
-            for neighbour_quib in _get_neighbour_quibs(quib, direction, bypass_intermediate_quibs):
-                _get_quibs_recursively(neighbour_quib, depth_ - 1)
-
-    _get_quibs_recursively(focal_quib, depth)
+    quibs.update(iter_reachable_quibs([focal_quib],
+                                      lambda quib: _get_neighbour_quibs(quib, direction, bypass_intermediate_quibs),
+                                      depth, visited=set(quibs)))
     return quibs
 
 
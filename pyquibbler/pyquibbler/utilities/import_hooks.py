@@ -0,0 +1,50 @@
+import importlib.abc
+import importlib.util
+import sys
+from typing import Callable
+
+
+class _CallUponImportFinder(importlib.abc.MetaPathFinder):
+    """
+    A finder which lets the regular import machinery find a given module, and arranges for a callback to be called
+    once the module is executed.
+    """
+
+    def __init__(self, module_name: str, callback: Callable[[], None]):
+        self.module_name = module_name
+        self.callback = callback
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != self.module_name:
+            return None
+
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def exec_module_and_call_back(module):
+            exec_module(module)
+            self.callback()
+
+        spec.loader.exec_module = exec_module_and_call_back
+        return spec
+
+
+def call_upon_import(module_name: str, callback: Callable[[], None]):
+    """
+    Call `callback` once the top-level module `module_name` is imported (or immediately, if already imported).
+    """
+    if module_name in sys.modules:
+        callback()
+    else:
+        sys.meta_path.insert(0, _CallUponImportFinder(module_name, callback))
+
+
+def is_module_installed(module_name: str) -> bool:
+    """
+    Check whether a top-level module can be imported, without importing it.
+    """
+    return module_name in sys.modules or importlib.util.find_spec(module_name) is not None
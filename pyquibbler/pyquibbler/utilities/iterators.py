@@ -198,6 +198,54 @@ def get_paths_for_objects_of_type(obj: Any, type_: Type) -> Paths:
     return paths
 
 
+# Types of objects which cannot contain other objects
+SCALAR_TYPES = frozenset({int, float, complex, bool, str, bytes, type(None),
+                          np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64,
+                          np.float16, np.float32, np.float64, np.complex64, np.complex128, np.bool_, np.str_})
+
+
+def is_there_object_of_type_in_object(object_type: Type, obj: Any) -> bool:
+    """
+    Check whether there is an object of a certain type within `obj`, looking into the same objects as
+    `get_paths_for_objects_of_type`, but without building the paths.
+
+    Scalars and non-object arrays are not looked into, and collections are first checked for consisting only of
+    scalars (a single, fast, pass on the types of their elements).
+    """
+    obj_type = type(obj)
+    if obj_type in SCALAR_TYPES or obj_type is np.ndarray and not ITERATE_ON_OBJECT_ARRAYS:
+        return False
+    if isinstance(obj, object_type):
+        return True
+    if isinstance(obj, (tuple, list, set)):
+        if len(obj) > SHALLOW_MAX_LENGTH and set(map(type, obj)) <= SCALAR_TYPES:
+            # A long collection of numbers, like the data of an array
+            return False
+        sub_objs = obj
+    elif isinstance(obj, dict):
+        sub_objs = obj.values()
+    elif isinstance(obj, slice):
+        sub_objs = (obj.start, obj.stop, obj.step)
+    elif ITERATE_ON_OBJECT_ARRAYS and is_object_array(obj):
+        sub_objs = obj.flat
+    else:
+        return False
+    for sub_obj in sub_objs:
+        if is_there_object_of_type_in_object(object_type, sub_obj):
+            return True
+    return False
+
+
+def is_there_object_of_type_in_args_kwargs(object_type: Type, args: Args, kwargs: Kwargs) -> bool:
+    for arg in args:
+        if is_there_object_of_type_in_object(object_type, arg):
+            return True
+    for value in kwargs.values():
+        if is_there_object_of_type_in_object(object_type, value):
+            return True
+    return False
+
+
 def recursively_compare_objects(obj1: Any, obj2: Any, type_only=False) -> bool:
     """
     recursively compare two objects
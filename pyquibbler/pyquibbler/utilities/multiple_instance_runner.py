@@ -5,6 +5,7 @@ from typing import List, Any, Optional, Type
 
 from pyquibbler.env import SAFE_MODE
 from pyquibbler.exceptions import PyQuibblerException
+from pyquibbler.quib.evaluation_cancellation import EvaluationCancelledException
 
 
 # Exceptions:
@@ -130,6 +131,8 @@ class MultipleInstanceRunner:
                         return runner.try_run()
                     except BaseRunnerFailedException:
                         pass
+                    except EvaluationCancelledException:
+                        raise
                     except Exception as e:
                         if SAFE_MODE:
                             pass
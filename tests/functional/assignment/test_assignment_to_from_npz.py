@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pyquibbler import default, Assignment
+from pyquibbler.assignment.assignment_to_from_npz import save_assignments_as_npz, load_assignments_from_npz
+from pyquibbler.path import PathComponent
+
+
+def _assert_equal(loaded, expected):
+    assert type(loaded) is type(expected) or isinstance(expected, np.ndarray)
+    if isinstance(expected, np.ndarray):
+        assert loaded.dtype == expected.dtype and np.array_equal(loaded, expected)
+    elif isinstance(expected, (list, tuple)):
+        assert len(loaded) == len(expected)
+        for loaded_item, expected_item in zip(loaded, expected):
+            _assert_equal(loaded_item, expected_item)
+    else:
+        assert loaded == expected
+
+
+@pytest.mark.parametrize(['components', 'value'], [
+    ([1], 0),
+    ([], np.arange(6).reshape((2, 3))),
+    ([(1, slice(None, None, None)), np.array([False, True])], default),
+    ([np.array([[True, False], [False, True]])], np.array([1., 2.])),
+    (['a', 2], [np.array([1, 2]), 'text']),
+])
+@pytest.mark.parametrize('memory_map_min_bytes', [None, 0])
+def test_save_and_load_assignments_as_npz(tmp_path, components, value, memory_map_min_bytes):
+    assignment = Assignment(path=[PathComponent(component) for component in components], value=value)
+    file = tmp_path / 'assignments.npz'
+
+    save_assignments_as_npz([assignment], file)
+    loaded_assignment, = load_assignments_from_npz(file, memory_map_min_bytes)
+
+    _assert_equal([component.component for component in loaded_assignment.path], components)
+    _assert_equal(loaded_assignment.value, value)
+    if isinstance(value, np.ndarray):
+        assert isinstance(loaded_assignment.value, np.memmap) == (memory_map_min_bytes is not None)
+
+
+def test_memory_mapped_assignments_remain_valid_upon_resaving(tmp_path):
+    file = tmp_path / 'assignments.npz'
+    save_assignments_as_npz([Assignment(path=[], value=np.arange(100))], file)
+    loaded_assignment, = load_assignments_from_npz(file, memory_map_min_bytes=0)
+
+    save_assignments_as_npz([Assignment(path=[], value=np.zeros(100))], file)
+
+    assert np.array_equal(loaded_assignment.value, np.arange(100))
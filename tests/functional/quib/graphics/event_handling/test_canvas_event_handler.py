@@ -90,3 +90,57 @@ def test_canvas_event_handler_does_not_call_inverse_without_picking(canvas_event
     canvas_event_handler._handle_motion_notify(mock.Mock())
 
     mock_inverse_graphics_function.assert_not_called()
+
+
+@pytest.mark.parametrize('cancel_stale', [True, False])
+def test_canvas_event_handler_newer_motion_cancels_stale_evaluation(canvas_event_handler, monkeypatch,
+                                                                    cancel_stale):
+    from pyquibbler.env import CANCEL_STALE_DRAG_EVALUATIONS
+    from pyquibbler.quib.evaluation_cancellation import raise_if_evaluation_cancelled
+    newer_mouse_event = mock.Mock(x=2, y=0)
+    handled_mouse_events = []
+    completed_mouse_events = []
+
+    def inverse_assign_drawing_func(func_args_kwargs, mouse_event, pick_event):
+        handled_mouse_events.append(mouse_event)
+        if len(handled_mouse_events) == 1:
+            # A newer event arrives while we are recalculating (like when the canvas processes events upon redraw)
+            canvas_event_handler._handle_motion_notify(newer_mouse_event)
+        raise_if_evaluation_cancelled()
+        completed_mouse_events.append(mouse_event)
+
+    monkeypatch.setattr(graphics_inverse_assigner, 'inverse_assign_drawing_func', inverse_assign_drawing_func)
+    canvas_event_handler._handle_pick_event(mock.Mock())
+    mouse_event = mock.Mock(x=1, y=0)
+    with CANCEL_STALE_DRAG_EVALUATIONS.temporary_set(cancel_stale):
+        canvas_event_handler._handle_motion_notify(mouse_event)
+    canvas_event_handler._handle_button_release(mock.Mock())
+
+    assert handled_mouse_events == [mouse_event, newer_mouse_event]
+    expected = [newer_mouse_event] if cancel_stale else [mouse_event, newer_mouse_event]
+    assert completed_mouse_events == expected
+
+
+def test_canvas_event_handler_coalesces_events_arriving_while_busy(canvas_event_handler, monkeypatch):
+    intermediate_mouse_events = [mock.Mock(x=2, y=0), mock.Mock(x=3, y=0)]
+    handled_mouse_events = []
+    is_dragging_when_handled = []
+
+    def inverse_assign_drawing_func(func_args_kwargs, mouse_event, pick_event):
+        from pyquibbler.quib.graphics.redraw import is_dragging
+        handled_mouse_events.append(mouse_event)
+        is_dragging_when_handled.append(is_dragging())
+        if len(handled_mouse_events) == 1:
+            for intermediate_mouse_event in intermediate_mouse_events:
+                canvas_event_handler._handle_motion_notify(intermediate_mouse_event)
+            canvas_event_handler._handle_button_release(mock.Mock())
+
+    monkeypatch.setattr(graphics_inverse_assigner, 'inverse_assign_drawing_func', inverse_assign_drawing_func)
+    canvas_event_handler._handle_pick_event(mock.Mock())
+    mouse_event = mock.Mock(x=1, y=0)
+    canvas_event_handler._handle_motion_notify(mouse_event)
+
+    # Only the latest pending event is applied, and it is applied before the drop:
+    assert handled_mouse_events == [mouse_event, intermediate_mouse_events[-1]]
+    assert is_dragging_when_handled == [True, True]
+    assert canvas_event_handler.current_pick_event is None
@@ -0,0 +1,75 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from pyquibbler.quib.graphics.event_handling.enhance_pick_event import _enhance_pick_event
+from pyquibbler.quib.graphics.event_handling.transform_cache import get_artist_transform_cache
+from pyquibbler.quib.graphics.event_handling.utils import get_closest_point_on_line_in_axes
+from pyquibbler.quib.types import PointXY
+
+
+def create_mock_pick_event(artist, ind, xdata, ydata):
+    pick_event = mock.Mock()
+    pick_event.artist = artist
+    pick_event.ind = ind
+    pick_event.mouseevent.xdata, pick_event.mouseevent.ydata = xdata, ydata
+    return pick_event
+
+
+def test_transform_cache_is_recreated_only_when_transform_changes(axes):
+    line, = axes.plot(np.arange(10), 'o')
+    transform_cache = get_artist_transform_cache(line)
+    assert get_artist_transform_cache(line) is transform_cache
+
+    line.set_ydata(np.zeros(10))
+    assert get_artist_transform_cache(line) is transform_cache
+    assert np.array_equal(transform_cache.get_xy([3]), [[3, 0]])
+
+    axes.set_xlim(0, 5)
+    zoomed_transform_cache = get_artist_transform_cache(line)
+    assert zoomed_transform_cache is not transform_cache
+    assert get_artist_transform_cache(line) is zoomed_transform_cache
+
+    axes.set_yscale('log')
+    assert get_artist_transform_cache(line) is not zoomed_transform_cache
+
+
+def test_transform_cache_not_created_for_other_artists(axes):
+    text = axes.text(0, 0, 'text')
+
+    assert get_artist_transform_cache(text) is None
+
+
+@pytest.mark.parametrize('yscale', ['linear', 'log'])
+def test_transform_cache_closest_point_on_line(axes, yscale):
+    line, = axes.plot([1, 2, 3], [1, 10, 100], 'o')
+    axes.set_yscale(yscale)
+    xy1, xy2, xy_p = PointXY(1, 1), PointXY(2, 10), PointXY(2, 2)
+
+    xy, slope = get_artist_transform_cache(line).get_closest_point_on_line(xy1, xy2, xy_p)
+
+    expected_xy, expected_slope = get_closest_point_on_line_in_axes(axes, xy1, xy2, xy_p)
+    assert np.allclose(xy, expected_xy)
+    assert np.allclose(slope, expected_slope)
+
+
+@pytest.mark.parametrize('number_of_points', [10, 5000])
+def test_enhance_pick_event_keeps_all_picked_points(axes, number_of_points):
+    x = np.arange(number_of_points) / number_of_points
+    pick_event = create_mock_pick_event(axes.scatter(x, x), np.array([2, 3, 4]), x[3], x[3])
+
+    _enhance_pick_event(pick_event)
+
+    assert list(pick_event.ind) == [2, 3, 4]
+    assert np.allclose(pick_event.xy_offset, (x[[2, 3, 4]] - x[3])[:, np.newaxis])
+
+
+def test_enhance_pick_event_uses_underlying_data_of_masked_points(axes):
+    collection = axes.scatter([0, 0], [0, 0])
+    collection.set_offsets(np.ma.masked_array([[1., 2.], [3., 4.]], mask=[[False, False], [False, True]]))
+    pick_event = create_mock_pick_event(collection, np.array([0, 1]), 1., 1.)
+
+    _enhance_pick_event(pick_event)
+
+    assert np.array_equal(pick_event.xy_offset, [[0., 1.], [2., 3.]])
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from pyquibbler import iquib
+from pyquibbler.env import PLOT_DOWNSAMPLING
+from pyquibbler.path import PathComponent
+from pyquibbler.quib.graphics.downsampling import get_minmax_indices, get_lttb_indices, get_original_data_indices
+
+
+@pytest.fixture(params=['minmax', 'lttb'])
+def downsampling(request):
+    with PLOT_DOWNSAMPLING.temporary_set(request.param):
+        yield request.param
+
+
+def test_minmax_indices_keep_extrema_of_each_bin():
+    y = np.zeros(100)
+    y[17] = 5.
+    y[62] = -5.
+    indices = get_minmax_indices(y, 10)
+
+    assert 17 in indices and 62 in indices
+    assert indices[0] == 0 and indices[-1] == 99
+    assert len(indices) <= 2 * 10 + 2
+
+
+def test_lttb_indices_keep_peaks():
+    x = np.arange(1000.)
+    y = np.zeros(1000)
+    y[500] = 10.
+    indices = get_lttb_indices(x, y, 50)
+
+    assert len(indices) == 50
+    assert 500 in indices
+    assert indices[0] == 0 and indices[-1] == 999
+
+
+def test_short_plots_are_not_downsampled(axes, downsampling):
+    y = iquib(np.arange(10.))
+    line = axes.plot(y).get_value()[0]
+
+    assert len(line.get_ydata()) == 10
+    assert get_original_data_indices(line, [3]) == [3]
+
+
+def test_long_plot_is_downsampled_to_axes_width(axes, downsampling):
+    y = iquib(np.sin(np.arange(100_000) / 1000.))
+    line = axes.plot(y).get_value()[0]
+
+    assert len(line.get_ydata()) <= 2 * axes.bbox.width + 4
+    original_indices = get_original_data_indices(line, np.arange(len(line.get_ydata())))
+    assert np.array_equal(line.get_xdata(), original_indices)
+    assert np.array_equal(line.get_ydata(), y.get_value()[original_indices])
+
+
+def test_downsampled_plot_is_redecimated_upon_zoom(axes, downsampling):
+    x = np.arange(100_000) / 10.
+    y = iquib(np.sin(x))
+    line = axes.plot(x, y).get_value()[0]
+    coarse_x = line.get_xdata()
+
+    axes.set_xlim(1000., 1010.)
+    line = axes.lines[0]
+    zoomed_x = line.get_xdata()
+    assert zoomed_x[0] <= 1000. and zoomed_x[-1] >= 1010.
+    assert np.sum((zoomed_x >= 1000.) & (zoomed_x <= 1010.)) > np.sum((coarse_x >= 1000.) & (coarse_x <= 1010.))
+
+
+def test_zoomed_downsampled_plot_requests_only_visible_range(axes, downsampling):
+    axes.set_xlim(1000, 1010)
+    y = iquib(np.arange(100_000.))
+    y2 = (y * 2).setp(cache_mode='on')
+    axes.plot(y2)
+
+    cache = y2.handler.quib_function_call.cache
+    assert len(cache.get_uncached_paths([])) > 0
+    assert len(cache.get_uncached_paths([PathComponent(slice(999, 1012))])) == 0
+
+
+def test_drag_downsampled_plot_assigns_to_original_index(axes, create_axes_mouse_press_move_release_events,
+                                                         downsampling):
+    axes.set_xlim(0, 5000)
+    axes.set_ylim(-1, 20)
+    y = iquib(np.zeros(5000))
+    y[3000] = 10.
+    axes.plot(y, 'o', pickradius=10)
+    assert len(axes.lines[0].get_ydata()) < 5000
+
+    create_axes_mouse_press_move_release_events(((3000, 10), (3000, 15)))
+
+    assert y.get_value()[3000] == pytest.approx(15., abs=0.1)
+    assert np.count_nonzero(y.get_value()) == 1
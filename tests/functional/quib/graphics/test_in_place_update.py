@@ -0,0 +1,125 @@
+from unittest import mock
+
+import numpy as np
+
+from pyquibbler import iquib
+from pyquibbler.quib.graphics import aggregate_redraw_mode
+
+
+def test_plot_updates_lines_in_place(axes):
+    y = iquib(np.array([[1., 2.], [3., 4.], [5., 6.]]))
+    lines = axes.plot(y).get_value()
+
+    y[0, 0] = 10.
+    assert [line.get_ydata()[0] for line in lines] == [10., 2.]
+    assert len(axes.lines) == 2
+
+
+def test_plot_updated_in_place_returns_same_artists(axes):
+    x = iquib([1, 2, 3])
+    plot = axes.plot(x, [4, 5, 6], 'o')
+    lines = plot.get_value()
+
+    x[1] = 7
+    assert plot.get_value()[0] is lines[0]
+    assert np.array_equal(lines[0].get_xdata(), [1, 7, 3])
+    assert lines[0].get_marker() == 'o'
+
+
+def test_plot_updated_in_place_keeps_gaps_of_masked_data(axes):
+    y = iquib(np.ma.masked_array([1., 2., 3.], mask=[False, True, False]))
+    plot = axes.plot(y)
+    line = plot.get_value()[0]
+
+    y.assign(np.ma.masked_array([10., 2., 3.], mask=[False, True, False]))
+    assert plot.get_value()[0] is line
+    assert np.array_equal(np.isnan(line.get_xydata()[:, 1]), [False, True, False])
+    assert line.get_xydata()[0, 1] == 10.
+
+
+def test_plot_is_recreated_when_non_data_args_change(axes):
+    color = iquib('r')
+    plot = axes.plot([1, 2, 3], color=color)
+    line = plot.get_value()[0]
+
+    color.assign('b')
+    new_line = plot.get_value()[0]
+    assert new_line is not line
+    assert new_line.get_color() == 'b'
+    assert len(axes.lines) == 1
+
+
+def test_plot_is_recreated_when_number_of_lines_changes(axes):
+    y = iquib(np.array([[1., 2.], [3., 4.]]))
+    plot = axes.plot(y)
+    plot.get_value()
+
+    y.assign(np.array([[1., 2., 3.], [3., 4., 5.]]))
+    assert len(plot.get_value()) == 3
+    assert len(axes.lines) == 3
+
+
+def test_scatter_updates_offsets_in_place(axes):
+    x = iquib(np.array([1., 2., 3.]))
+    scatter = axes.scatter(x, [4., 5., 6.])
+    collection = scatter.get_value()
+
+    x[2] = 8.
+    assert scatter.get_value() is collection
+    assert np.array_equal(collection.get_offsets(), [[1., 4.], [2., 5.], [8., 6.]])
+
+
+def test_imshow_updates_image_data_in_place(axes):
+    data = iquib(np.array([[0., 1.], [2., 3.]]))
+    imshow = axes.imshow(data)
+    image = imshow.get_value()
+
+    data[0, 0] = -5.
+    assert imshow.get_value() is image
+    assert image.get_array()[0, 0] == -5.
+    assert image.norm.vmin == -5.
+
+
+def test_imshow_patches_changed_region_of_image(axes):
+    data = iquib(np.zeros((100, 100)))
+    image = axes.imshow(data).get_value()
+    array = image.get_array()
+
+    with mock.patch.object(image, 'set_data') as set_data:
+        data[10:20, 30:40] = 1.
+
+    set_data.assert_not_called()
+    assert image.get_array() is array
+    assert np.sum(array) == 100
+    assert np.all(array[10:20, 30:40] == 1.)
+    assert image.norm.vmax == 1.
+
+
+def test_imshow_requests_only_changed_region_of_data(axes):
+    data = iquib(np.zeros((100, 100)))
+    doubled = data * 2
+    image = axes.imshow(doubled).get_value()
+
+    with mock.patch.object(doubled.handler, 'get_value_valid_at_path',
+                           wraps=doubled.handler.get_value_valid_at_path) as get_value_valid_at_path:
+        data[5, 7] = 1.
+
+    get_value_valid_at_path.assert_called_once()
+    assert get_value_valid_at_path.call_args.args[0] != []
+    assert image.get_array()[5, 7] == 2.
+    assert np.sum(image.get_array()) == 2.
+
+
+def test_imshow_is_fully_updated_when_non_data_arg_changes_with_data(axes):
+    data = iquib(np.zeros((3, 3)))
+    vmax = iquib(5.)
+    imshow = axes.imshow(data, vmax=vmax)
+    imshow.get_value()
+
+    with aggregate_redraw_mode():
+        data[0, 0] = 1.
+        vmax.assign(10.)
+
+    image = imshow.get_value()
+    assert image.get_array()[0, 0] == 1.
+    assert image.norm.vmax == 10.
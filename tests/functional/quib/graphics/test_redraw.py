@@ -135,17 +135,132 @@ def test_plot_with_implicit_quiby_color_updates_when_color_changes(figure, axes1
     assert p.get_value()[0].get_color() == (0.0, 0.0, 1.0, 1)
 
 
-def test_plot_with_no_color_spec_maintains_color_when_updates(figure, axes1):
+@pytest.mark.parametrize('in_place_update', [True, False])
+def test_plot_with_no_color_spec_maintains_color_when_updates(figure, axes1, in_place_update):
+    from pyquibbler.env import IN_PLACE_GRAPHICS_UPDATE
     data = iquib([1, 2, 3])
     axes1.plot([3, 2, 1]) # advance the color cycle before the quib plot
     p = axes1.plot(data)
     line1 = p.get_value()[0]
+    y1 = line1._y.copy()
     axes1.plot([3,3, 3]) # to advance the color cycle after the quib plot
 
-    data[1] = 1
-    line2 = p.get_value()[0]
+    with IN_PLACE_GRAPHICS_UPDATE.temporary_set(in_place_update):
+        data[1] = 1
+        line2 = p.get_value()[0]
+
+    assert (line2 is line1) == in_place_update
+    assert np.array_equal(y1, [1, 2, 3]), "sanity"
 
-    assert np.array_equal(line1._y, [1, 2, 3]), "sanity"
     assert np.array_equal(line2._y, [1, 1, 3]), "sanity"
 
     assert line2.get_color() == line1.get_color()
+
+
+def test_redraw_is_frame_rate_capped_while_dragging(figure):
+    from pyquibbler.env import GRAPHICS_MAX_FPS
+    from pyquibbler.quib.graphics.redraw import start_dragging, end_dragging, DIRTY_FIGURES
+
+    start_dragging()
+    with GRAPHICS_MAX_FPS.temporary_set(0.01):
+        redraw_figures({figure})
+        redraw_figures({figure})
+        redraw_figures({figure})
+        assert figure.canvas.draw_idle.call_count == 1
+        assert figure in DIRTY_FIGURES
+        figure.canvas.new_timer.assert_called_once()
+
+        end_dragging()
+
+    # final flush upon drop:
+    assert figure.canvas.draw_idle.call_count == 2
+    assert figure not in DIRTY_FIGURES
+    figure.canvas.new_timer.return_value.stop.assert_called_once()
+
+
+def test_redraw_is_not_frame_rate_capped_when_not_dragging(figure):
+    from pyquibbler.env import GRAPHICS_MAX_FPS
+
+    with GRAPHICS_MAX_FPS.temporary_set(0.01):
+        redraw_figures({figure})
+        redraw_figures({figure})
+
+    assert figure.canvas.draw_idle.call_count == 2
+
+
+def test_blit_while_dragging():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from pyquibbler.env import BLIT_WHILE_DRAGGING
+    from pyquibbler.quib.graphics.redraw import start_dragging, end_dragging
+    from pyquibbler.quib.graphics.blit import FIGURES_TO_BLIT_STATES
+
+    plt.close("all")
+    fig = plt.figure()
+    FigureCanvasAgg(fig)
+    ax = fig.gca()
+    ax.set_xlim(0, 5)
+    ax.set_ylim(0, 10)
+    y = iquib([1, 2, 3])
+    line = ax.plot(y).get_value()[0]
+    ax.plot([1, 1, 1])  # static content
+
+    with BLIT_WHILE_DRAGGING.temporary_set(True), \
+            mock.patch.object(fig.canvas, 'restore_region', wraps=fig.canvas.restore_region) as restore_region:
+        start_dragging()
+        y[0] = 4
+        assert line.get_animated()
+        assert FIGURES_TO_BLIT_STATES[fig].background is not None
+        restore_region.assert_not_called()
+
+        y[0] = 5
+        restore_region.assert_called_once()
+
+        end_dragging()
+
+    assert not line.get_animated()
+    assert fig not in FIGURES_TO_BLIT_STATES
+
+
+def test_graphics_of_paused_figure_are_deferred_until_resumed(figure, axes1):
+    y = iquib([1, 2, 3])
+    line = axes1.plot(y).get_value()[0]
+    project = Project.get_or_create()
+
+    project.pause_figure(figure)
+    y[0] = 10
+    assert line.get_ydata()[0] == 1
+    figure.canvas.draw_idle.assert_not_called()
+
+    project.resume_figure(figure)
+    assert axes1.lines[0].get_ydata()[0] == 10
+    figure.canvas.draw_idle.assert_called_once()
+
+
+def test_paused_figure_is_connected_to_draw_event_only_while_deferring(figure, axes1):
+    from pyquibbler.quib.graphics.redraw import FIGURES_TO_DRAW_EVENT_CIDS
+    y = iquib([1, 2, 3])
+    axes1.plot(y)
+    project = Project.get_or_create()
+
+    for value in range(3):
+        project.pause_figure(figure)
+        y[0] = value
+        y[1] = value
+        project.resume_figure(figure)
+
+    draw_event_connections = [call for call in figure.canvas.mpl_connect.call_args_list
+                              if call.args[0] == 'draw_event']
+    assert len(draw_event_connections) == 3
+    assert figure.canvas.mpl_disconnect.call_count == 3
+    assert figure not in FIGURES_TO_DRAW_EVENT_CIDS
+
+
+def test_graphics_of_closed_figure_are_not_recalculated(figure, axes1):
+    y = iquib([1, 2, 3])
+    mock_func = mock.Mock(side_effect=np.array)
+    axes1.plot(create_quib(func=mock_func, args=(y,)))
+    assert mock_func.call_count == 1
+
+    plt.close(figure)
+    y[0] = 10
+    assert mock_func.call_count == 1
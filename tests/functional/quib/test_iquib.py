@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 
 from pyquibbler.assignment.exceptions import CannotConvertAssignmentsToTextException
-from pyquibbler.env import GET_VARIABLE_NAMES
+from pyquibbler.env import GET_VARIABLE_NAMES, NPZ_MEMORY_MAP_MIN_BYTES
 from pyquibbler.quib.specialized_functions.iquib import iquib, CannotNestQuibInIQuibException
 from pyquibbler.file_syncing.types import SaveFormat
 from pyquibbler.quib.quib import Quib
@@ -56,6 +56,7 @@ def test_iquib_pretty_repr_str():
 @pytest.mark.parametrize(['save_format'], [
     (SaveFormat.TXT,),
     (SaveFormat.BIN,),
+    (SaveFormat.NPZ,),
 ])
 def test_iquib_save_and_load(save_format: SaveFormat):
     save_name = "example_quib"
@@ -121,6 +122,25 @@ def test_save_txt_and_load_iquib_ndarray(obj, tmpdir):
     assert np.array_equal(a.get_value(), obj)
 
 
+@pytest.mark.parametrize(['memory_map_min_bytes', 'should_memory_map'], [
+    (None, False),
+    (10, True),
+    (10_000, False),
+])
+def test_save_npz_and_load_iquib_memory_maps_large_arrays(memory_map_min_bytes, should_memory_map):
+    a = iquib(np.zeros((10, 10))).setp(save_format=SaveFormat.NPZ, name='my_quib')
+    a.assign(np.arange(100.).reshape((10, 10)))
+    a.assign(7, 0, 0)
+    a.save()
+
+    b = iquib(np.zeros((10, 10))).setp(save_format=SaveFormat.NPZ, name='my_quib')
+    with NPZ_MEMORY_MAP_MIN_BYTES.temporary_set(memory_map_min_bytes):
+        b.load()
+
+    assert isinstance(b.handler.overrider[0].value, np.memmap) == should_memory_map
+    assert np.array_equal(b.get_value(), a.get_value())
+
+
 class A:
     pass
 
@@ -4,11 +4,15 @@ import dataclasses
 import itertools
 from functools import partial
 from typing import Callable
+from unittest import mock
 
 from pyquibbler import iquib
 from pyquibbler.env import GRAPHICS_LAZY
 from pyquibbler.path import PathComponent
 from pyquibbler.path.data_accessing import deep_get, deep_set
+from pyquibbler.quib.evaluation_cancellation import EvaluationCancelledException, GenerationToken, \
+    cancellable_evaluation
+from pyquibbler.quib.func_calling.func_calls.apply_along_axis_call import ApplyAlongAxisQuibFuncCall
 from pyquibbler.quib.quib import Quib
 from tests.functional.utils import get_func_mock
 from tests.functional.quib.test_quib.get_value.utils import check_get_value_valid_at_path
@@ -328,3 +332,102 @@ def test_apply_along_axis_invalidation_manual(should_array, path, expected_inval
     invalid_mask = copy.copy(b.handler.quib_function_call.cache._invalid_mask)
     assert np.array_equal(b.get_value(), [4, 7])
     assert np.array_equal(invalid_mask, expected_invalid_mask)
+
+
+def test_apply_along_axis_recomputes_only_invalidated_slices():
+    a = iquib(np.arange(9).reshape((3, 3)))
+    func = get_func_mock(lambda x: x * 2)
+    b = np.apply_along_axis(func, 1, a).setp(cache_mode='on')
+    b.get_value()
+    func.reset_mock()
+
+    a[1, 0] = 100
+
+    assert np.array_equal(b.get_value(), [[0, 2, 4], [200, 8, 10], [12, 14, 16]])
+    assert func.call_count == 1
+    assert np.array_equal(func.mock_calls[0].args[0], [100, 4, 5])
+
+
+def test_apply_along_axis_keeps_output_buffer_upon_partial_invalidation():
+    a = iquib(np.arange(6).reshape((2, 3)))
+    b = np.apply_along_axis(np.sum, 1, a).setp(cache_mode='on')
+    b.get_value()
+    buffer = b.handler.quib_function_call._output_buffer
+
+    a[1, 0] = 30
+
+    assert np.array_equal(b.get_value(), [3, 39])
+    assert b.handler.quib_function_call._output_buffer is buffer
+
+
+def test_apply_along_axis_updates_returned_value_in_place_upon_partial_invalidation():
+    a = iquib(np.arange(6).reshape((2, 3)))
+    b = np.apply_along_axis(np.sum, 1, a).setp(cache_mode='on')
+    value = b.get_value()
+
+    a[1, 0] = 30
+
+    assert b.get_value() is value
+    assert np.array_equal(value, [3, 39])
+
+
+def test_apply_along_axis_allocates_output_buffer_without_materializing_invalid_value(monkeypatch):
+    a = iquib(np.arange(6).reshape((2, 3)))
+    b = np.apply_along_axis(np.sum, 1, a)
+    monkeypatch.setattr(ApplyAlongAxisQuibFuncCall, '_get_invalid_value_at_correct_shape_and_dtype',
+                        mock.Mock(side_effect=AssertionError))
+
+    assert np.array_equal(b.get_value(), [3, 12])
+
+
+def test_apply_along_axis_does_not_change_returned_value_upon_full_invalidation():
+    arr = np.array([[1, 2], [3, 9]])
+    a = iquib(arr)
+    b = np.apply_along_axis(np.sum, 1, a)
+    value = b.get_value()
+
+    a.assign(arr * 10)
+
+    assert np.array_equal(b.get_value(), [30, 120])
+    assert np.array_equal(value, [3, 12])
+
+
+def test_apply_along_axis_with_workers():
+    from pyquibbler.env import APPLY_ALONG_AXIS_MAX_WORKERS
+    arr = np.arange(24).reshape((2, 3, 4))
+    a = iquib(arr)
+    b = np.apply_along_axis(np.cumsum, 1, a, is_graphics=False)
+    with APPLY_ALONG_AXIS_MAX_WORKERS.temporary_set(4):
+        res = b.get_value()
+
+    assert np.array_equal(res, np.apply_along_axis(np.cumsum, 1, arr))
+
+
+def test_apply_along_axis_workers_check_for_cancellation():
+    from pyquibbler.env import APPLY_ALONG_AXIS_MAX_WORKERS
+    token = GenerationToken()
+    generation = token.new_generation()
+
+    def cancel_and_sum(x):
+        # The first call is for the sample result, before the slices are dispatched to the workers
+        if func.call_count == 3:
+            token.new_generation()
+        return np.sum(x)
+
+    func = get_func_mock(cancel_and_sum)
+    b = np.apply_along_axis(func, 1, iquib(np.zeros((100, 2))), is_graphics=False)
+    with APPLY_ALONG_AXIS_MAX_WORKERS.temporary_set(2), cancellable_evaluation(token, generation):
+        with pytest.raises(EvaluationCancelledException):
+            b.get_value()
+
+    assert func.call_count < 100
+
+
+def test_apply_along_axis_reports_slice_timings():
+    a = iquib(np.arange(6).reshape((2, 3)))
+    b = np.apply_along_axis(np.sum, 0, a)
+    b.get_value_valid_at_path([PathComponent(1)])
+    func_call = b.handler.quib_function_call
+
+    assert np.array_equal(np.isnan(func_call.slice_timings), [True, False, True])
+    assert [loop_indices for loop_indices, _ in func_call.get_hot_slices()] == [(1, )]
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+
+import numpy as np
+
+from pyquibbler import iquib, quiby, Project
+from pyquibbler.quib.async_evaluation import call_soon_in_loop_if_in_async_evaluation
+
+
+def test_get_value_async():
+    a = iquib(np.array([1, 2, 3]))
+    b = a * 2
+    assert np.array_equal(asyncio.run(b.get_value_async()), [2, 4, 6])
+
+
+def test_get_value_valid_at_path_async():
+    a = iquib(np.array([1, 2, 3]))
+    b = a + 10
+    assert asyncio.run(b.get_value_valid_at_path_async([1]))[1] == 12
+
+
+def test_get_value_async_runs_off_the_loop_thread():
+    thread_names = []
+
+    @quiby
+    def record_thread(x):
+        thread_names.append(threading.current_thread().name)
+        return x
+
+    asyncio.run(record_thread(3).get_value_async())
+    assert thread_names == ['quibbler-async_0']
+
+
+def test_get_value_async_of_quib_with_graphics_ancestor_runs_on_the_loop_thread():
+    thread_names = set()
+
+    @quiby(is_graphics=None)
+    def record_thread(x):
+        thread_names.add(threading.current_thread().name)
+        return x
+
+    asyncio.run((record_thread(3) + 1).get_value_async())
+    assert thread_names == {threading.current_thread().name}
+
+
+def test_get_value_async_keeps_loop_free():
+    started = threading.Event()
+    release = threading.Event()
+
+    @quiby
+    def blocking(x):
+        started.set()
+        release.wait(5)
+        return x
+
+    async def main():
+        task = asyncio.create_task(blocking(7).get_value_async())
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        # The loop is still responsive while the quib is being evaluated:
+        await asyncio.sleep(0)
+        assert not task.done()
+        release.set()
+        return await task
+
+    assert asyncio.run(main()) == 7
+
+
+def test_evaluate_many_async():
+    a = iquib(2)
+    assert asyncio.run(Project.get_or_create().evaluate_many_async([a + 1, a * 10, a])) == [3, 20, 2]
+
+
+def test_calls_within_async_evaluation_are_scheduled_on_loop():
+    loop_thread = threading.get_ident()
+    called_in = []
+
+    @quiby
+    def schedule(x):
+        assert call_soon_in_loop_if_in_async_evaluation(lambda: called_in.append(threading.get_ident()))
+        return x
+
+    async def main():
+        value = await schedule(1).get_value_async()
+        await asyncio.sleep(0)
+        return value
+
+    assert asyncio.run(main()) == 1
+    assert called_in == [loop_thread]
+    assert not call_soon_in_loop_if_in_async_evaluation(lambda: None)
@@ -38,3 +38,75 @@ def test_quib_representing_read_only_array():
 
     x = get_read_only_array()
     assert x.get_value_valid_at_path([PathComponent([False, True, False])])[1] == 0.
+
+
+def test_parent_quibs_are_evaluated_in_parallel():
+    from threading import current_thread
+    from pyquibbler.env import PARENTS_EVALUATION_MAX_WORKERS
+    thread_names = set()
+
+    @quiby
+    def record_thread(x):
+        thread_names.add(current_thread().name)
+        return x
+
+    a = record_thread(np.array([1, 2]))
+    b = record_thread(np.array([10, 20]))
+    with PARENTS_EVALUATION_MAX_WORKERS.temporary_set(2):
+        assert np.array_equal((a + b).get_value(), [11, 22])
+    assert any(name.startswith('quibbler-parents') for name in thread_names)
+
+
+def test_parent_quibs_with_graphics_ancestors_are_not_evaluated_in_parallel():
+    from threading import current_thread
+    from pyquibbler.env import PARENTS_EVALUATION_MAX_WORKERS
+    thread_names = set()
+
+    @quiby
+    def record_thread(x):
+        thread_names.add(current_thread().name)
+        return x
+
+    @quiby(is_graphics=None)
+    def may_create_graphics(x):
+        thread_names.add(current_thread().name)
+        return x
+
+    a = may_create_graphics(np.array([1, 2])) + 0
+    b = record_thread(np.array([10, 20]))
+    with PARENTS_EVALUATION_MAX_WORKERS.temporary_set(2):
+        assert np.array_equal((a + b).get_value(), [11, 22])
+    assert not any(name.startswith('quibbler-parents') for name in thread_names)
+
+
+def test_quib_evaluation_lock_is_created_upon_evaluation_in_threads():
+    from pyquibbler.env import PARENTS_EVALUATION_MAX_WORKERS
+    a = quiby(lambda x: x)(np.array([1, 2]))
+    b = quiby(lambda x: x)(np.array([10, 20]))
+    assert a.handler._evaluation_lock is None
+
+    with PARENTS_EVALUATION_MAX_WORKERS.temporary_set(2):
+        (a + b).get_value()
+    assert a.handler._evaluation_lock is not None
+
+
+def test_parallel_evaluation_gives_same_result_as_serial():
+    from pyquibbler.env import PARENTS_EVALUATION_MAX_WORKERS
+    a = create_quib(func=lambda: np.arange(6.))
+    b = np.sin(a) + np.cos(a) * np.exp(a[::-1])
+    serial = b.get_value()
+    b.invalidate()
+    with PARENTS_EVALUATION_MAX_WORKERS.temporary_set(3):
+        assert np.array_equal(b.get_value(), serial)
+
+
+def test_parallel_evaluation_raises_parent_exception():
+    from pyquibbler.env import PARENTS_EVALUATION_MAX_WORKERS
+
+    @quiby
+    def fail(x):
+        raise ValueError('failed')
+
+    with PARENTS_EVALUATION_MAX_WORKERS.temporary_set(2):
+        with pytest.raises(Exception):
+            (fail(1) + quiby(lambda x: x)(2)).get_value()
@@ -242,3 +242,104 @@ def test_vectorize_sample_call_with_minor_data_sources(func_x2y, func_y2z):
     b = func_x2y(a)
     c = func_y2z([b, [14, 15]])
     assert c.get_shape() == (2, 2, 3)
+
+
+@pytest.mark.parametrize('memo_size, expected_call_count', [(None, 1), (10, 0)])
+def test_vectorize_memo_skips_elements_with_unchanged_values(memo_size, expected_call_count):
+    func_mock = get_func_mock(lambda x: x * 10)
+    parent = iquib(np.array([1, 5, 10]))
+    clipped = np.minimum(parent, 6)
+    quib = np.vectorize(func_mock, memo_size=memo_size)(clipped)
+    quib.get_value()
+    func_mock.reset_mock()
+
+    parent[2] = 20
+
+    assert np.array_equal(quib.get_value(), [10, 50, 60])
+    assert func_mock.call_count == expected_call_count
+
+
+def test_vectorize_memo_is_bounded():
+    func_mock = get_func_mock(lambda x: x * 10)
+    parent = iquib(np.arange(5))
+    quib = np.vectorize(func_mock, memo_size=2)(parent)
+    quib.get_value()
+
+    assert len(quib.handler.quib_function_call._element_memo) == 2
+
+
+def test_element_memo_evicts_least_recently_used():
+    from pyquibbler.quib.func_calling.func_calls.vectorize.utils import ElementMemo, get_memo_key
+    from pyquibbler.utilities.missing_value import missing
+    memo = ElementMemo(2)
+    memo.set(get_memo_key((1, ), {}), 'a')
+    memo.set(get_memo_key((2, ), {}), 'b')
+    memo.get(get_memo_key((1, ), {}))
+    memo.set(get_memo_key((3, ), {}), 'c')
+
+    assert memo.get(get_memo_key((1, ), {})) == 'a'
+    assert memo.get(get_memo_key((2, ), {})) is missing
+    assert memo.get(get_memo_key((1., ), {})) is missing
+    assert get_memo_key(([1], ), {}) is None
+
+
+def test_vectorize_aggregates_lines_into_line_collection(temp_axes):
+    from matplotlib.collections import LineCollection
+
+    def plot_segment(x):
+        temp_axes.plot([x, x + 1], [0, 1], color='r')
+
+    xs = iquib(np.arange(5.))
+    np.vectorize(plot_segment, is_graphics=True, aggregate_lines=True)(xs)
+    line_collection, = [collection for collection in temp_axes.collections if isinstance(collection, LineCollection)]
+    assert [segment.tolist() for segment in line_collection.get_segments()] == \
+           [[[x, 0.], [x + 1, 1.]] for x in range(5)]
+    assert not any(line.get_visible() for line in temp_axes.lines)
+
+    lines = list(temp_axes.lines)
+    xs[2] = 10.
+    assert sum(line not in lines for line in temp_axes.lines) == 1
+    assert [segment.tolist() for segment in line_collection.get_segments()] == \
+           [[[x, 0.], [x + 1, 1.]] for x in (0, 1, 10, 3, 4)]
+    assert [collection for collection in temp_axes.collections if isinstance(collection, LineCollection)] \
+           == [line_collection]
+
+
+def test_vectorize_aggregated_lines_are_patched_only_for_rerun_iterations(temp_axes, monkeypatch):
+    from pyquibbler.quib.func_calling.func_calls.vectorize import line_aggregation
+
+    def plot_segment(x):
+        temp_axes.plot([x, x + 1], [0, 1])
+
+    xs = iquib(np.arange(5.))
+    np.vectorize(plot_segment, is_graphics=True, aggregate_lines=True)(xs)
+    aggregate_and_hide_line = mock.Mock(wraps=line_aggregation._aggregate_and_hide_line)
+    update_line_collection = mock.Mock(wraps=line_aggregation._update_line_collection)
+    monkeypatch.setattr(line_aggregation, '_aggregate_and_hide_line', aggregate_and_hide_line)
+    monkeypatch.setattr(line_aggregation, '_update_line_collection', update_line_collection)
+
+    xs[3] = 10.
+
+    aggregate_and_hide_line.assert_called_once()
+    assert aggregate_and_hide_line.call_args.args[0].get_xydata().tolist() == [[10., 0.], [11., 1.]]
+    update_line_collection.assert_called_once()
+
+
+def test_vectorize_aggregates_markers_into_path_collection(temp_axes):
+    from matplotlib.collections import LineCollection, PathCollection
+
+    def plot_markers(x):
+        temp_axes.plot([x, x], [0, 1], 'o', color='b', markersize=4)
+
+    xs = iquib(np.arange(3.))
+    np.vectorize(plot_markers, is_graphics=True, aggregate_lines=True)(xs)
+    path_collection, = temp_axes.collections
+    assert isinstance(path_collection, PathCollection)
+    assert path_collection.get_offsets().tolist() == [[0., 0.], [0., 1.], [1., 0.], [1., 1.], [2., 0.], [2., 1.]]
+    assert path_collection.get_sizes().tolist() == [16.] * 6
+    assert np.array_equal(path_collection.get_facecolor(), [[0., 0., 1., 1.]] * 6)
+    assert not any(line.get_visible() for line in temp_axes.lines)
+
+    xs[1] = 5.
+    assert path_collection.get_offsets().tolist() == [[0., 0.], [0., 1.], [5., 0.], [5., 1.], [2., 0.], [2., 1.]]
+    assert not any(isinstance(collection, LineCollection) for collection in temp_axes.collections)
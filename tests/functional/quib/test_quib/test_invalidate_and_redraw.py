@@ -1,12 +1,16 @@
 from unittest import mock
 
+import numpy as np
+
 import pytest
 
-from pyquibbler import CacheMode
+from pyquibbler import CacheMode, iquib
+from pyquibbler.env import SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS
 from pyquibbler.cache.cache import CacheStatus
 from pyquibbler.function_definitions import add_definition_for_function
 from pyquibbler.function_definitions.func_definition import create_or_reuse_func_definition
 from pyquibbler.quib.factory import create_quib
+from tests.functional.utils import get_func_mock
 
 
 def test_quib_invalidate_and_redraw_calls_children_with_graphics(quib, graphics_quib):
@@ -76,3 +80,75 @@ def test_quib_invalidates_all_when_invalidated_at_param_source(quib, create_quib
 
     assert quib_with_param_source.cache_status == CacheStatus.ALL_INVALID
 
+
+def _create_verified_threshold_chain(verify_invalidation):
+    a = iquib(np.array([1, 5, 10]))
+    threshold = (a > 3).setp(cache_mode='on', verify_invalidation=verify_invalidation)
+    downstream_func = get_func_mock(lambda x: x * 2)
+    downstream = create_quib(func=downstream_func, args=(threshold,), cache_mode=CacheMode.ON)
+    downstream.get_value()
+    downstream_func.reset_mock()
+    return a, downstream, downstream_func
+
+
+@pytest.mark.parametrize('verify_invalidation, expected_call_count', [(False, 1), (True, 0)])
+def test_quib_verify_invalidation_prevents_downstream_invalidation_when_unchanged(
+        verify_invalidation, expected_call_count):
+    a, downstream, downstream_func = _create_verified_threshold_chain(verify_invalidation)
+
+    a[2] = 20
+
+    assert np.array_equal(downstream.get_value(), [0, 2, 2])
+    assert downstream_func.call_count == expected_call_count
+
+
+def test_quib_verify_invalidation_invalidates_downstream_when_changed():
+    a, downstream, downstream_func = _create_verified_threshold_chain(True)
+
+    a[0] = 20
+
+    assert np.array_equal(downstream.get_value(), [2, 2, 2])
+    assert downstream_func.call_count == 1
+
+
+def test_quib_verify_invalidation_yields_to_project(project):
+    a, downstream, downstream_func = _create_verified_threshold_chain(None)
+    project.verify_invalidation = True
+
+    a[2] = 20
+
+    downstream.get_value()
+    assert downstream_func.call_count == 0
+
+
+def test_quib_verify_invalidation_recalculates_once_in_diamond():
+    a = iquib(np.array([1, 2, 3]))
+    c = (a * 10).setp(cache_mode='on', verify_invalidation=True)
+    b_func = get_func_mock(lambda x, y: x + y)
+    b = create_quib(func=b_func, args=(a, c), cache_mode=CacheMode.ON).setp(verify_invalidation=True)
+    b.get_value()
+    b_func.reset_mock()
+
+    a[0] = 5
+
+    assert b_func.call_count == 1
+    assert np.array_equal(b.get_value(), [55, 22, 33])
+
+
+def _fail_on_negative(x):
+    if np.any(x < 0):
+        raise ValueError('negative')
+    return x
+
+
+def test_quib_verify_invalidation_of_failing_quib_invalidates_downstream():
+    a = iquib(np.array([1, 2, 3]))
+    failing = create_quib(func=_fail_on_negative, args=(a,), cache_mode=CacheMode.ON)
+    failing.setp(verify_invalidation=True).get_value()
+    downstream = failing + 1
+
+    with SHOW_QUIB_EXCEPTIONS_AS_QUIB_TRACEBACKS.temporary_set(False):
+        a[2] = -3
+
+    with pytest.raises(ValueError):
+        downstream.get_value()
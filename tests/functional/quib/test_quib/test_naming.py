@@ -1,9 +1,12 @@
+import sys
 from unittest import mock
 
 import pytest
 
 from pyquibbler.utilities.input_validation_utils import InvalidArgumentTypeException, InvalidArgumentValueException
 from pyquibbler.quib.factory import create_quib
+from pyquibbler.quib.variable_metadata import fast_quib_creation, get_frame_outside_of_pyquibbler, \
+    CODES_TO_CALL_SITE_ASSIGNMENTS
 
 
 @pytest.mark.get_variable_names(True)
@@ -71,3 +74,36 @@ def test_quib_can_assign_none_to_name():
     a.name = None
 
     assert a.assigned_name is None
+
+
+def test_frame_outside_of_pyquibbler_is_the_creating_frame():
+    assert get_frame_outside_of_pyquibbler() is sys._getframe()
+
+
+@pytest.mark.get_variable_names(True)
+def test_quib_call_site_assignment_is_looked_up_once_per_call_site():
+    for _ in range(3):
+        create_quib(func=mock.Mock())
+
+    assert len(CODES_TO_CALL_SITE_ASSIGNMENTS[sys._getframe().f_code]) == 1
+
+
+@pytest.mark.get_variable_names(True)
+def test_fast_quib_creation_names_quib_lazily():
+    with mock.patch('pyquibbler.quib.quib.get_var_name_of_call_site', return_value='lazy_quib') as get_name:
+        with fast_quib_creation():
+            lazy_quib = create_quib(func=mock.Mock(return_value=1))
+        assert get_name.call_count == 0
+
+        assert repr(lazy_quib).startswith('lazy_quib = ')
+        assert lazy_quib.assigned_name == 'lazy_quib'
+        assert get_name.call_count == 1
+
+
+@pytest.mark.get_variable_names(True)
+def test_fast_quib_creation_keeps_explicitly_set_name():
+    with fast_quib_creation():
+        my_quib = create_quib(func=mock.Mock(), assigned_name='explicit')
+    my_quib.assigned_name = 'renamed'
+
+    assert my_quib.assigned_name == 'renamed'
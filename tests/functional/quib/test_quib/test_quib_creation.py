@@ -2,7 +2,7 @@ import numpy as np
 from matplotlib import pyplot as plt
 
 from pyquibbler import iquib, Quib
-from pyquibbler.env import ALLOW_ARRAY_WITH_DTYPE_OBJECT
+from pyquibbler.env import ALLOW_ARRAY_WITH_DTYPE_OBJECT, ZERO_COPY_ARRAY_ARGUMENTS
 
 
 def test_allow_array_with_dtype_object_off():
@@ -22,3 +22,26 @@ def test_plot_quib_converts_quib_containing_args_to_quib_arrays():
     b = plt.plot([0, a, 2])
     arg = b.args[1]
     assert isinstance(arg, Quib) and np.array_equal(arg.get_value(), [0, 1, 2])
+
+
+def test_zero_copy_array_arguments():
+    data = np.arange(10)
+    with ZERO_COPY_ARRAY_ARGUMENTS.temporary_set(True):
+        a = iquib(data)
+        b = np.add(a, data)
+
+    assert np.shares_memory(a.args[0], data) and not a.args[0].flags.writeable
+    assert np.shares_memory(b.args[1], data) and not b.args[1].flags.writeable
+    assert data.flags.writeable
+
+
+def test_zero_copy_array_arguments_copied_upon_assignment():
+    data = np.arange(10)
+    with ZERO_COPY_ARRAY_ARGUMENTS.temporary_set(True):
+        a = iquib(data)
+        assert np.shares_memory(a.get_value(), data)
+
+        a[2] = 20
+
+        assert a.get_value()[2] == 20
+        assert data[2] == 2
@@ -70,3 +70,27 @@ def test_named_children():
     grand_daughter = create_quib(func=mock.Mock(), args=(daughter,), assigned_name='grandpa')
 
     assert me.get_children(True) == {daughter, grand_son}
+
+
+def test_iter_descendants_is_breadth_first_and_yields_each_quib_once():
+    me = create_quib(func=mock.Mock())
+    child1 = create_quib(func=mock.Mock(), args=(me,))
+    child2 = create_quib(func=mock.Mock(), args=(me,))
+    grand_child = create_quib(func=mock.Mock(), args=(child1, child2))
+
+    descendants = list(me.iter_descendants())
+    assert set(descendants[:2]) == {child1, child2}
+    assert descendants[2:] == [grand_child]
+    assert list(grand_child.iter_ancestors(depth=1)) in ([child1, child2], [child2, child1])
+
+
+def test_ancestors_and_descendants_of_deep_networks():
+    first = create_quib(func=mock.Mock())
+    last = first
+    for _ in range(5000):
+        last = create_quib(func=mock.Mock(), args=(last,), assigned_name=None)
+
+    assert len(last.get_ancestors()) == 5000
+    assert len(last.get_ancestors(depth=10)) == 10
+    assert len(first.get_descendants()) == 5000
+    assert len(first.get_descendants(bypass_intermediate_quibs=True)) == 0
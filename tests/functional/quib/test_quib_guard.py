@@ -57,3 +57,42 @@ def test_quib_guard_within_quib_guard_exits_and_goes_back_to_previous_quib_guard
             pass
         # sanity, make sure we don't raise exception
         assert quib.get_value() == 3
+
+
+def test_quib_guard_allows_ancestors_of_allowed_quibs():
+    a = iquib(1)
+    b = a + 1
+    c = b * 2
+    with QuibGuard({c}):
+        assert a.get_value() == 1
+        assert b.get_value() == 2
+
+
+def test_ancestors_index_is_cached_until_graph_changes():
+    a = iquib(1)
+    b = a + 1
+    c = b + 2
+    ancestors = c.handler.get_ancestors_index()
+    assert ancestors == {a, b}
+    assert c.handler.get_ancestors_index() is ancestors
+
+    d = c + 3  # a new leaf quib does not change the ancestors of existing quibs
+    assert c.handler.get_ancestors_index() is ancestors
+    assert d.handler.get_ancestors_index() == {a, b, c}
+
+    d.handler.disconnect_from_parents()  # neither does disconnecting a quib without children
+    assert c.handler.get_ancestors_index() is ancestors
+
+    b.handler.disconnect_from_parents()
+    assert c.handler.get_ancestors_index() is not ancestors
+
+
+def test_quib_guard_indexes_ancestors_of_allowed_quibs_only():
+    a = iquib(1)
+    b = a + 1
+    c = b * 2
+    with QuibGuard({c}):
+        pass
+
+    assert c.handler._ancestors_index is not None
+    assert b.handler._ancestors_index is None
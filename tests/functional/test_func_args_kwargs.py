@@ -0,0 +1,72 @@
+import inspect
+
+import numpy as np
+import pytest
+
+from pyquibbler.function_definitions.func_call import FuncArgsKwargs
+from pyquibbler.function_definitions.utils import get_binding_plan_for_func
+
+
+def positional_only(a, b=2, /, c=3):
+    pass
+
+
+def var_args_and_kwargs(a, *args, b, c=3, **kwargs):
+    pass
+
+
+def simple(a, b=2):
+    pass
+
+
+@pytest.mark.parametrize(['func', 'args', 'kwargs'], [
+    (simple, (1,), {}),
+    (simple, (1, 5), {}),
+    (simple, (), {'b': 5, 'a': 1}),
+    (positional_only, (1,), {'c': 7}),
+    (var_args_and_kwargs, (1,), {'b': 2}),
+    (var_args_and_kwargs, (1, 2, 3), {'b': 2, 'd': 4}),
+    (np.sum, (np.arange(3),), {'axis': 0}),
+])
+@pytest.mark.parametrize('include_defaults', [True, False])
+def test_binding_plan_binds_like_signature(func, args, kwargs, include_defaults):
+    bound_args = inspect.signature(func).bind(*args, **kwargs)
+    if include_defaults:
+        bound_args.apply_defaults()
+
+    arguments = get_binding_plan_for_func(func).bind(args, kwargs, include_defaults)
+
+    assert list(arguments.items()) == list(bound_args.arguments.items())
+
+
+@pytest.mark.parametrize(['func', 'args', 'kwargs'], [
+    (simple, (), {}),
+    (simple, (1, 2, 3), {}),
+    (simple, (1,), {'a': 1}),
+    (simple, (1,), {'c': 1}),
+    (positional_only, (), {'a': 1}),
+])
+def test_binding_plan_raises_like_signature(func, args, kwargs):
+    with pytest.raises(TypeError):
+        get_binding_plan_for_func(func).bind(args, kwargs)
+
+
+def test_func_args_kwargs_binding_is_updated_upon_change():
+    func_args_kwargs = FuncArgsKwargs(simple, [1], {})
+    assert func_args_kwargs.get('b') == 2
+
+    func_args_kwargs.kwargs['b'] = 5
+    assert func_args_kwargs.get('b') == 5
+
+    func_args_kwargs.args[0] = 10
+    assert func_args_kwargs.get('a') == 10
+
+    func_args_kwargs.func = var_args_and_kwargs
+    assert func_args_kwargs.get('c') == 3
+
+
+def test_func_args_kwargs_returns_copies_of_binding():
+    func_args_kwargs = FuncArgsKwargs(simple, (1,), {})
+    func_args_kwargs.get_arg_values_by_keyword()['a'] = 2
+
+    assert func_args_kwargs.get('a') == 1
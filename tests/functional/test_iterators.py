@@ -3,7 +3,7 @@ import unittest
 import numpy as np
 import pytest
 from pyquibbler.utilities.iterators import recursively_cast_one_object_by_other, recursively_compare_objects, \
-    CannotCastObjectByOtherObjectException
+    CannotCastObjectByOtherObjectException, is_there_object_of_type_in_object, get_paths_for_objects_of_type
 
 
 @pytest.mark.parametrize(['template', 'obj', 'expected'], [
@@ -35,3 +35,22 @@ def test_recursively_compare_objects_type():
     assert recursively_compare_objects(obj1, obj2, type_only=True)
     assert not recursively_compare_objects(obj1, obj2, type_only=False)
 
+
+class Marker:
+    pass
+
+
+@pytest.mark.parametrize(['obj', 'expected'], [
+    (Marker(), True),
+    (3, False),
+    (np.arange(5), False),
+    ([1, 2, [3, Marker()]], True),
+    ({'a': (1, slice(None, Marker()))}, True),
+    (list(range(1000)), False),
+    (list(range(1000)) + [Marker()], True),
+    ([[1, 2]] * 1000, False),
+    (np.array([1, [Marker()]], dtype=object), False),  # object arrays are not looked into
+])
+def test_is_there_object_of_type_in_object(obj, expected):
+    assert is_there_object_of_type_in_object(Marker, obj) is expected
+    assert is_there_object_of_type_in_object(Marker, obj) is bool(get_paths_for_objects_of_type(obj, Marker))
@@ -4,14 +4,15 @@ from unittest import mock
 import pytest
 
 import pyquibbler as qb
-from pyquibbler import iquib, Assignment, default
-from pyquibbler.file_syncing import SaveFormat
+from pyquibbler import iquib, Assignment, default, Quib
+from pyquibbler.file_syncing import SaveFormat, ResponseToFileNotDefined
 from pyquibbler.function_definitions import add_definition_for_function
 from pyquibbler.function_definitions.func_definition import create_or_reuse_func_definition
 from pyquibbler.project import Project, NothingToUndoException, NothingToRedoException
 from pyquibbler.project.exceptions import NoProjectDirectoryException
 from pyquibbler.quib.factory import create_quib
 from pyquibbler.quib.graphics import GraphicsUpdateType, aggregate_redraw_mode
+from pyquibbler.quib.quib import QuibHandler
 from pyquibbler.utilities.file_path import PathWithHyperLink
 from pyquibbler.utilities.input_validation_utils import InvalidArgumentTypeException, UnknownEnumException
 
@@ -267,6 +268,74 @@ def test_project_redraw_central_graphics_function_quibs():
     func.assert_called_once()
 
 
+def test_project_redraw_central_graphics_quibs_upstream_first(monkeypatch):
+    parent = create_quib(func=mock.Mock(), graphics_update='central', lazy=True)
+    children = [create_quib(func=mock.Mock(), args=(parent,), graphics_update='central', lazy=True)
+                for _ in range(10)]
+    evaluated = []
+    monkeypatch.setattr(Quib, 'get_value', lambda self: evaluated.append(self))
+
+    qb.refresh_graphics()
+
+    assert evaluated[0] is parent
+    assert set(evaluated[1:]) == set(children)
+
+
+def test_project_redraw_central_graphics_quibs_through_intermediate_quibs_upstream_first(monkeypatch):
+    top = create_quib(func=mock.Mock(), graphics_update='central', lazy=True)
+    intermediate = top
+    for _ in range(5):
+        intermediate = create_quib(func=mock.Mock(), args=(intermediate,), lazy=True)
+    bottom = create_quib(func=mock.Mock(), args=(intermediate,), graphics_update='central', lazy=True)
+    middle = create_quib(func=mock.Mock(), args=(top,), graphics_update='central', lazy=True)
+    evaluated = []
+    monkeypatch.setattr(Quib, 'get_value', lambda self: evaluated.append(self))
+
+    qb.refresh_graphics()
+
+    assert evaluated == [top, middle, bottom]
+
+
+def test_project_redraw_graphics_does_not_visit_non_graphics_quibs(monkeypatch):
+    quib = iquib(0)
+    for _ in range(100):
+        quib = create_quib(func=mock.Mock(), args=(quib,), lazy=True)
+    graphics_quib = create_quib(func=mock.Mock(), args=(quib,), graphics_update='central', lazy=True)
+    qb.refresh_graphics()  # depths are calculated once
+    create_quib(func=mock.Mock(), args=(quib,), lazy=True)
+    visited = []
+    monkeypatch.setattr(QuibHandler, 'parents', property(lambda self: visited.append(self.quib) or []))
+    monkeypatch.setattr(Quib, 'get_value', lambda self: visited.append(self))
+
+    qb.refresh_graphics()
+
+    assert visited == [graphics_quib]
+
+
+def test_project_redraw_graphics_quibs_set_as_central_after_creation():
+    func = mock.Mock()
+    quib = create_quib(func=func, lazy=True)
+    quib.graphics_update = 'central'
+    quib.graphics_update = 'drop'
+    qb.refresh_graphics()
+    func.assert_not_called()
+
+    quib.graphics_update = 'central'
+    qb.refresh_graphics()
+    func.assert_called_once()
+
+
+def test_project_indexes_named_and_overridden_quibs(project):
+    named = iquib(1, assigned_name='named')
+    unnamed = iquib(2, assigned_name=None)
+    assert project._get_file_syncing_quibs(ResponseToFileNotDefined.WARN_IF_DATA) == {named}
+
+    unnamed.assign(3)
+    named.assigned_name = None
+    assert project._get_file_syncing_quibs(ResponseToFileNotDefined.WARN_IF_DATA) == {unnamed}
+    assert project._get_file_syncing_quibs(ResponseToFileNotDefined.RAISE) == {named, unnamed}
+
+
 @pytest.mark.regression
 def test_undo_redo_does_not_hold_strong_ref():
     a = iquib(7)
@@ -357,3 +426,16 @@ def test_set_project_directory_affects_quib_directory(project):
     assert(str(quib.actual_save_directory).endswith('test'))
     project.directory = None
     assert quib.actual_save_directory is None
+
+
+def test_quibs_in_topological_order(project):
+    a = iquib(1)
+    c = create_quib(func=mock.Mock(), args=(a,))
+    b = create_quib(func=mock.Mock(), args=(c, a))
+    assert project.get_quibs_in_topological_order() == [a, c, b]
+
+    d = create_quib(func=mock.Mock(), args=(b,))
+    assert project.get_quibs_in_topological_order()[-1] is d
+
+    del d
+    assert project.get_quibs_in_topological_order() == [a, c, b]
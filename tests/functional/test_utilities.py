@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from typing import Tuple
 
@@ -11,6 +12,7 @@ from pyquibbler.quib.specialized_functions.iquib import create_iquib
 from pyquibbler.quib.utils import miscellaneous
 from pyquibbler.quib.utils.iterators import iter_quibs_in_args, iter_quibs_in_object
 from pyquibbler.quib.utils.miscellaneous import copy_and_replace_quibs_with_vals, is_there_a_quib_in_args
+from pyquibbler.utilities.import_hooks import call_upon_import, is_module_installed
 from pyquibbler.utilities.iterators import is_iterator_empty, iter_objects_of_type_in_object_recursively
 from pyquibbler.utilities.unpacker import Unpacker, CannotDetermineNumberOfIterations
 from tests.functional.utils import slicer
@@ -221,3 +223,22 @@ def test_unpacker_with_set_length_fails_on_too_much(unpacker_with_set_length, un
     with raises(ValueError) as e:
         a, b, c, d = unpacker_with_set_length
     assert e.value.args == ('not enough values to unpack (expected 4, got 3)',)
+
+
+def test_call_upon_import(tmp_path, monkeypatch):
+    (tmp_path / 'module_imported_later.py').write_text('VALUE = 7\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, 'module_imported_later', raising=False)
+    values_upon_import = []
+
+    assert is_module_installed('module_imported_later')
+    call_upon_import('module_imported_later',
+                     lambda: values_upon_import.append(sys.modules['module_imported_later'].VALUE))
+    assert values_upon_import == []
+
+    import module_imported_later  # noqa: F401
+    assert values_upon_import == [7]
+
+    call_upon_import('module_imported_later', lambda: values_upon_import.append(None))
+    assert values_upon_import == [7, None]
+    monkeypatch.delitem(sys.modules, 'module_imported_later')